@@ -0,0 +1,1050 @@
+"""
+Shared engine for converting MySQL dumps into per-table CSV and JSON files.
+
+Each dataset script (``sakila-db/sql_to_csv_json.py``,
+``world-db/world_sql_to_csv_json.py``) only points ``run_converter`` at its
+dump; statement reassembly, schema discovery, VALUES tokenizing, type
+conversion, streaming export and the command line are implemented once here.
+
+Table schemas come from CREATE TABLE statements, either in a separate schema
+file or earlier in the dump itself, so column order and SQL types never need
+to be written out by hand. Each column's SQL type picks the conversion applied
+to its values (integers -> int, DECIMAL -> Decimal, FLOAT/DOUBLE -> float,
+DATETIME/TIMESTAMP -> datetime, DATE -> date, everything else -> str).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# Converts one column's raw VALUES tokens (as written in the dump) into Python values.
+ColumnConverter = Callable[[List[str]], List[Any]]
+
+
+@dataclass
+class TableSchema:
+    """
+    Representation of a table schema.
+
+    Attributes:
+        name: Canonical name of the table, used for output file names.
+        columns: Ordered list of column names.
+        types: Upper-cased base SQL type of each column (e.g. "DECIMAL"), when known.
+    """
+    name: str
+    columns: List[str]
+    types: List[str] = field(default_factory=list)
+
+    @cached_property
+    def converters(self) -> Optional[List[ColumnConverter]]:
+        """
+        Per-column converters in table order, or None when the types are unknown.
+        """
+        if len(self.types) != len(self.columns):
+            return None
+        return [column_converter(sql_type) for sql_type in self.types]
+
+    def converters_for(self, columns: List[str]) -> Optional[List[ColumnConverter]]:
+        """
+        Converters for an INSERT that lists its own columns.
+
+        Args:
+            columns: Column names in the order the INSERT gives them.
+
+        Returns:
+            One converter per listed column (shape-based for columns not in the
+            schema), or None when the types are unknown.
+        """
+        if not self.types:
+            return None
+        types = {column.lower(): sql_type for column, sql_type in zip(self.columns, self.types)}
+        return [column_converter(types.get(column.lower(), "")) for column in columns]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cached converters are closures; workers rebuild them on first use.
+        state = self.__dict__.copy()
+        state.pop("converters", None)
+        return state
+
+
+def read_text(path: Path) -> str:
+    """
+    Read a text file as UTF-8.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        File contents as a single string.
+    """
+    return path.read_text(encoding="utf-8")
+
+
+# Unescaped MySQL backslash sequences; \% and \_ keep their backslash, as in MySQL.
+_STRING_ESCAPES: Dict[str, str] = {
+    "0": "\0",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "Z": "\x1a",
+    "%": "\\%",
+    "_": "\\_",
+}
+_ESCAPE_PATTERN = re.compile(r"\\(.)|''", re.DOTALL)
+
+# Quoted SQL string, with backslash escapes and doubled quotes ("unrolled" so
+# the regex engine does not backtrack character by character).
+_SQL_STRING = r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+
+# Raw tokens of a VALUES list: strings, bare literals and parentheses. There
+# are no capture groups, so findall() returns plain strings from C; commas and
+# whitespace are the separators it skips. A lone "'" (unterminated string) is
+# returned as its own token so it can be reported.
+_VALUE_TOKEN = re.compile(rf"{_SQL_STRING}|[^,\s'()]+|[()']", re.DOTALL)
+
+# Comments inside a statement. mysqldump wraps values and column definitions
+# only newer servers understand in versioned comments, e.g.
+# "/*!50705 0x0101...,*/": their markers are removed so the content is read as
+# ordinary SQL, while plain "/* ... */" comments are dropped whole. Strings are
+# matched first so comment markers inside them are left alone.
+_COMMENT = re.compile(rf"({_SQL_STRING})|/\*!\d*|\*/|/\*.*?\*/", re.DOTALL)
+
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def _strip_comments(sql: str) -> str:
+    return _COMMENT.sub(lambda m: m.group(1) or " ", sql)
+
+
+def _unescape_match(match: re.Match) -> str:
+    char = match.group(1)
+    if char is None:
+        return "'"
+    return _STRING_ESCAPES.get(char, char)
+
+
+def sql_token_to_python(token: str) -> Any:
+    """
+    Convert a single SQL literal token to a Python value.
+
+    Handles:
+    - NULL -> None
+    - quoted strings -> str (MySQL backslash escapes and '' unescaped)
+    - unquoted numeric tokens -> int/float
+    - anything else (hex literals, keywords) -> the original string.
+
+    Args:
+        token: Raw token as produced by the VALUES tokenizer.
+
+    Returns:
+        Python value.
+    """
+    if token[0] == "'":
+        inner = token[1:-1]
+        if "\\" in inner or "''" in inner:
+            inner = _ESCAPE_PATTERN.sub(_unescape_match, inner)
+        return inner
+
+    if token.upper() == "NULL":
+        return None
+
+    if _NUMBER.fullmatch(token):
+        if token.lstrip("+-").isdecimal():
+            return int(token)
+        return float(token)
+
+    return token
+
+
+def _unquote(token: str) -> Any:
+    """
+    Text value of a raw token: unescaped string, None for NULL, else the token as is.
+    """
+    if token[0] == "'":
+        inner = token[1:-1]
+        if "\\" in inner or "''" in inner:
+            inner = _ESCAPE_PATTERN.sub(_unescape_match, inner)
+        return inner
+    if token.upper() == "NULL":
+        return None
+    return token
+
+
+def _text_column(tokens: List[str]) -> List[Any]:
+    joined = "\0".join(tokens)
+    if "\\" in joined or "''" in joined:
+        return [_unquote(t) for t in tokens]
+    return [t[1:-1] if t[0] == "'" else _unquote(t) for t in tokens]
+
+
+def _guess_column(tokens: List[str]) -> List[Any]:
+    return [sql_token_to_python(t) for t in tokens]
+
+
+# What the column parsers raise on bad input; Decimal reports it with
+# InvalidOperation, an ArithmeticError rather than a ValueError.
+_PARSE_ERRORS = (ValueError, ArithmeticError)
+
+
+def _typed_column(parse: Callable[[str], Any]) -> ColumnConverter:
+    """
+    Build a converter applying ``parse`` to a whole column at once.
+
+    The column is mapped through ``parse`` in C, first as written and then with
+    the quotes of quoted tokens stripped, since mysqldump quotes some types
+    (DECIMAL and temporal values) and not others. Only a column that fails both,
+    because it holds NULLs or values ``parse`` rejects such as zero dates, is
+    converted token by token; such values are kept as text.
+    """
+
+    def convert(tokens: List[str]) -> List[Any]:
+        try:
+            return list(map(parse, tokens))
+        except _PARSE_ERRORS:
+            pass
+        try:
+            return list(map(parse, [t[1:-1] if t[0] == "'" else t for t in tokens]))
+        except _PARSE_ERRORS:
+            pass
+        values = []
+        for token in tokens:
+            value = _unquote(token)
+            if value is not None:
+                try:
+                    value = parse(value)
+                except _PARSE_ERRORS:
+                    pass
+            values.append(value)
+        return values
+
+    return convert
+
+
+_INTEGER_TYPES = {"TINYINT", "SMALLINT", "MEDIUMINT", "INT", "INTEGER", "BIGINT", "YEAR", "BOOL", "BOOLEAN", "SERIAL"}
+# Exact types keep their scale ("0.00" stays "0.00" in CSV); see _json_default.
+_DECIMAL_TYPES = {"DECIMAL", "DEC", "NUMERIC", "FIXED"}
+_FLOAT_TYPES = {"FLOAT", "DOUBLE", "REAL"}
+
+_COLUMN_CONVERTERS: Dict[str, ColumnConverter] = {
+    **{sql_type: _typed_column(int) for sql_type in _INTEGER_TYPES},
+    **{sql_type: _typed_column(Decimal) for sql_type in _DECIMAL_TYPES},
+    **{sql_type: _typed_column(float) for sql_type in _FLOAT_TYPES},
+    "DATETIME": _typed_column(datetime.fromisoformat),
+    "TIMESTAMP": _typed_column(datetime.fromisoformat),
+    "DATE": _typed_column(date.fromisoformat),
+}
+
+
+def column_converter(sql_type: str) -> ColumnConverter:
+    """
+    Pick the conversion for a column from its base SQL type.
+
+    Integer types give int, DECIMAL gives Decimal, FLOAT/DOUBLE give float,
+    DATETIME and TIMESTAMP give datetime and DATE gives date. Character, TIME,
+    ENUM/SET, binary and spatial columns keep their text (hex literals stay as
+    written), and an empty/unknown type falls back to guessing from each
+    token's shape.
+
+    Args:
+        sql_type: Base SQL type such as "VARCHAR" or "decimal".
+
+    Returns:
+        Function converting a column's raw tokens into Python values.
+    """
+    if not sql_type:
+        return _guess_column
+    return _COLUMN_CONVERTERS.get(sql_type.upper(), _text_column)
+
+
+def parse_value_tuples(
+    values_sql: str,
+    converters: Optional[List[ColumnConverter]] = None,
+) -> List[Tuple[Any, ...]]:
+    """
+    Tokenize the VALUES part of an INSERT straight into typed row tuples.
+
+    One regex findall() splits the whole list into raw tokens, replacing the
+    old character-by-character split into "(...)" groups followed by a second
+    scan of every group. mysqldump writes rows of equal width, so the row
+    boundaries are checked with list slices rather than a per-token state
+    machine.
+
+    With ``converters`` each column is converted as a whole by its type's
+    converter. Without them, tokens are converted by their shape in a single
+    comprehension where plain strings and unsigned integers take an inline
+    fast path.
+
+    Args:
+        values_sql: String after the VALUES keyword, e.g. "(...),(...),(...)".
+        converters: Optional per-column converters, see column_converter().
+
+    Returns:
+        One tuple of Python values per "(...)" group, in order.
+
+    Raises:
+        ValueError: If the text is not a list of equally sized "(...)" groups,
+            or the groups do not have one value per converter.
+    """
+    if "/*" in values_sql:
+        values_sql = _strip_comments(values_sql)
+
+    tokens = _VALUE_TOKEN.findall(values_sql)
+    if not tokens:
+        return []
+    if "'" in tokens:
+        raise ValueError(f"Unterminated string literal in VALUES list: {values_sql[:200]!r}")
+
+    try:
+        width = tokens.index(")") + 1
+    except ValueError:
+        raise ValueError(f"VALUES list has no complete '(...)' group: {values_sql[:200]!r}") from None
+    n_rows = len(tokens) // width
+    if (
+        len(tokens) != n_rows * width
+        or tokens[0::width] != ["("] * n_rows
+        or tokens[width - 1 :: width] != [")"] * n_rows
+        or tokens.count("(") != n_rows
+        or tokens.count(")") != n_rows
+    ):
+        raise ValueError(_describe_bad_group(tokens, width))
+
+    # Drop the parentheses, leaving the values of every row back to back.
+    del tokens[width - 1 :: width]
+    del tokens[0 :: width - 1]
+    n_values = width - 2
+
+    if converters is not None:
+        if len(converters) != n_values:
+            raise ValueError(f"Column count mismatch: {len(converters)} columns but {n_values} values per row.")
+        columns = [convert(tokens[i::n_values]) for i, convert in enumerate(converters)]
+        return list(zip(*columns))
+
+    if "\\" in values_sql or "''" in values_sql:
+        values = [sql_token_to_python(t) for t in tokens]
+    else:
+        values = [
+            t[1:-1] if t[0] == "'" else int(t) if t.isdecimal() else sql_token_to_python(t)
+            for t in tokens
+        ]
+    return list(zip(*[iter(values)] * n_values))
+
+
+def _describe_bad_group(tokens: List[str], width: int) -> str:
+    """
+    Point at the first group that breaks the layout set by the first one.
+    """
+    start = 0
+    while start < len(tokens):
+        if tokens[start] != "(":
+            return f"Value {tokens[start]!r} outside parentheses in VALUES list"
+        try:
+            end = tokens.index(")", start)
+        except ValueError:
+            return "Unterminated '(' group at the end of the VALUES list"
+        group = tokens[start : end + 1]
+        if "(" in group[1:]:
+            return f"Nested '(' in VALUES group {' '.join(group)!r}"
+        if len(group) != width:
+            return (
+                f"VALUES group has {len(group) - 2} values where the first had {width - 2}: "
+                f"{' '.join(group)!r}"
+            )
+        start = end + 1
+    return "Malformed VALUES list"
+
+
+# Typical MySQL format:
+# INSERT INTO `table_name` VALUES (...),(...),(...);
+# or: INSERT INTO `table_name` (`col1`,`col2`,...) VALUES (...),(...);
+_INSERT_PATTERN = re.compile(
+    r"INSERT\s+INTO\s+`?(?P<table>[^\s`(]+)`?\s*(?:\((?P<cols>[^)]*)\))?\s*VALUES\s*(?P<values>.+);",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def lookup_schema(schemas: Dict[str, TableSchema], table_name: str) -> Optional[TableSchema]:
+    """
+    Find a table's schema by its exact name, falling back to the lower-cased name.
+
+    Args:
+        schemas: Mapping from table names (or lower-cased names) to TableSchema.
+        table_name: Table name as written in the dump.
+
+    Returns:
+        The matching TableSchema, or None for unknown tables.
+    """
+    schema = schemas.get(table_name)
+    if schema is None:
+        schema = schemas.get(table_name.lower())
+    return schema
+
+
+def parse_insert_statement(
+    stmt: str,
+    schemas: Dict[str, TableSchema],
+) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Parse a single INSERT statement into a list of row dicts.
+
+    Args:
+        stmt: Full INSERT statement, possibly spanning multiple lines.
+        schemas: Mapping of table names to TableSchema, to know the column order.
+            Lookups fall back to the lower-cased table name.
+
+    Returns:
+        (table_name, list_of_rows) if the statement is an INSERT for a known table,
+        where table_name is the schema's canonical name; None otherwise.
+    """
+    stmt = stmt.strip()
+    if not stmt.upper().startswith("INSERT INTO"):
+        return None
+
+    m = _INSERT_PATTERN.match(stmt)
+    if not m:
+        return None
+
+    table_name = m.group("table")
+    cols_spec = m.group("cols")
+    values_sql = m.group("values")
+    schema = lookup_schema(schemas, table_name)
+
+    # Determine column order and conversions
+    if cols_spec:
+        # Columns are explicitly listed in the INSERT
+        col_names = [c.strip(" `") for c in cols_spec.split(",")]
+        converters = schema.converters_for(col_names) if schema is not None else None
+    else:
+        if schema is None:
+            print(f"Warning: no schema for table '{table_name}', skipping its INSERT.")
+            return None
+        col_names = schema.columns
+        converters = schema.converters
+
+    try:
+        value_rows = parse_value_tuples(values_sql, converters)
+    except ValueError as exc:
+        raise ValueError(f"Table '{table_name}': {exc}") from exc
+
+    # All groups have the same width, so checking the first row is enough.
+    if value_rows and len(value_rows[0]) != len(col_names):
+        raise ValueError(
+            f"Column count mismatch in table '{table_name}': "
+            f"{len(col_names)} columns but {len(value_rows[0])} values.\n"
+            f"Values: {value_rows[0]!r}"
+        )
+    rows = [dict(zip(col_names, values)) for values in value_rows]
+
+    if schema is not None:
+        table_name = schema.name
+    return table_name, rows
+
+
+_CREATE_TABLE_PATTERN = re.compile(
+    r"CREATE\s+(?:TEMPORARY\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:`?[^\s`.(]+`?\.)?`?(?P<table>[^\s`.(]+)`?\s*\(",
+    re.IGNORECASE,
+)
+_DEFINITION_TOKEN = re.compile(rf"{_SQL_STRING}|`[^`]*`|\"[^\"]*\"|[(),]|[^'`\"(),]+", re.DOTALL)
+_COLUMN_DEFINITION = re.compile(r"(?:`(?P<quoted>[^`]+)`|(?P<name>[^\s`]+))\s+(?P<type>[A-Za-z]+)")
+# Table-level definitions that can appear alongside the columns.
+_NON_COLUMN_KEYWORDS = {"PRIMARY", "KEY", "INDEX", "UNIQUE", "CONSTRAINT", "FOREIGN", "FULLTEXT", "SPATIAL", "CHECK"}
+
+
+def _split_definitions(body: str) -> List[str]:
+    """
+    Split the text after "CREATE TABLE name (" into its top-level definitions.
+
+    Commas inside parentheses (DECIMAL(5,2), ENUM('a','b'), key column lists)
+    and quotes do not split; scanning stops at the parenthesis closing the table.
+    """
+    definitions: List[str] = []
+    current: List[str] = []
+    depth = 0
+    for token in _DEFINITION_TOKEN.findall(body):
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            if depth == 0:
+                break
+            depth -= 1
+        elif token == "," and depth == 0:
+            definitions.append("".join(current).strip())
+            current = []
+            continue
+        current.append(token)
+    definitions.append("".join(current).strip())
+    return [definition for definition in definitions if definition]
+
+
+def parse_create_table(stmt: str) -> Optional[TableSchema]:
+    """
+    Build a TableSchema from a CREATE TABLE statement.
+
+    Column names and their base SQL types are read in declaration order; keys,
+    constraints and table options are ignored. Versioned comments are unwrapped,
+    so columns only newer servers create (e.g. Sakila's GEOMETRY location) are
+    included, matching what mysqldump writes in the INSERTs.
+
+    Args:
+        stmt: Full SQL statement text.
+
+    Returns:
+        The table's schema, or None if the statement is not a CREATE TABLE
+        with a column list.
+    """
+    if "/*" in stmt:
+        stmt = _strip_comments(stmt)
+    m = _CREATE_TABLE_PATTERN.match(stmt.strip())
+    if not m:
+        return None
+
+    columns: List[str] = []
+    types: List[str] = []
+    for definition in _split_definitions(stmt.strip()[m.end():]):
+        column = _COLUMN_DEFINITION.match(definition)
+        if column is None:
+            continue
+        name = column.group("quoted")
+        if name is None:
+            name = column.group("name")
+            if name.upper() in _NON_COLUMN_KEYWORDS:
+                continue
+        columns.append(name)
+        types.append(column.group("type").upper())
+
+    return TableSchema(name=m.group("table"), columns=columns, types=types)
+
+
+def load_schemas(path: Path) -> Dict[str, TableSchema]:
+    """
+    Read every CREATE TABLE statement of a schema file (e.g. sakila-schema.sql).
+
+    Args:
+        path: SQL file to scan; other statements are ignored.
+
+    Returns:
+        Mapping from lower-cased table name to TableSchema.
+    """
+    schemas: Dict[str, TableSchema] = {}
+    with path.open(encoding="utf-8") as f:
+        for stmt in iter_statements(f):
+            schema = parse_create_table(stmt)
+            if schema is not None:
+                schemas[schema.name.lower()] = schema
+    return schemas
+
+
+def iter_parsed_statements(
+    statements: Iterable[str],
+    schemas: Dict[str, TableSchema],
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Parse a statement stream, learning table schemas from its CREATE TABLEs.
+
+    A CREATE TABLE adds (or replaces) its table in ``schemas``, so the INSERTs
+    following it in the same dump are converted with its columns and types.
+
+    Args:
+        statements: Statements as produced by iter_statements().
+        schemas: Mapping from table names to TableSchema; updated in place.
+
+    Yields:
+        (table_name, rows) per parsed INSERT statement, in order.
+    """
+    for stmt in statements:
+        if _CREATE_TABLE_PATTERN.match(stmt):
+            _register_schema(stmt, schemas)
+            continue
+
+        parsed = parse_insert_statement(stmt, schemas)
+        if parsed is not None:
+            yield parsed
+
+
+def _register_schema(stmt: str, schemas: Dict[str, TableSchema]) -> None:
+    schema = parse_create_table(stmt)
+    if schema is not None:
+        schemas[schema.name.lower()] = schema
+
+
+# SQL handed to one worker task; large INSERTs are split into pieces of about this size.
+DEFAULT_CHUNK_BYTES = 256 * 1024
+
+_ROW_BOUNDARY = re.compile(r"\)\s*,\s*\(")
+
+# (piece results, (whole statement, is last piece) per piece, schemas the batch was parsed with)
+_PendingBatch = Tuple["Future[List[Tuple[bool, Any]]]", List[Tuple[str, bool]], Dict[str, TableSchema]]
+
+
+def _split_insert(stmt: str, chunk_bytes: int) -> List[str]:
+    """
+    Split a large INSERT into INSERTs covering consecutive ranges of its rows.
+
+    Cuts are made at the first "),(" after every ``chunk_bytes`` of VALUES text.
+    A cut that lands inside a string literal leaves an unterminated string in
+    the piece before it, which the tokenizer rejects; the caller then re-parses
+    the whole statement. Statements with comments are never split.
+    """
+    if len(stmt) <= chunk_bytes or "/*" in stmt:
+        return [stmt]
+    m = _INSERT_PATTERN.match(stmt)
+    if not m:
+        return [stmt]
+
+    prefix = stmt[: m.start("values")]
+    values = m.group("values")
+    pieces: List[str] = []
+    start = 0
+    while len(values) - start > chunk_bytes:
+        boundary = _ROW_BOUNDARY.search(values, start + chunk_bytes)
+        if boundary is None:
+            break
+        pieces.append(f"{prefix}{values[start : boundary.start() + 1]};")
+        start = boundary.end() - 1
+    pieces.append(f"{prefix}{values[start:]};")
+    return pieces
+
+
+def _iter_batches(
+    statements: Iterable[str],
+    schemas: Dict[str, TableSchema],
+    chunk_bytes: int,
+) -> Iterator[Tuple[List[str], List[Tuple[str, bool]]]]:
+    """
+    Group INSERT pieces into worker tasks of about ``chunk_bytes`` of SQL.
+
+    CREATE TABLE statements are applied to ``schemas`` here, in the parent,
+    after flushing the current batch, so every batch is parsed with the schemas
+    in force at its position in the dump.
+    """
+    batch: List[str] = []
+    tags: List[Tuple[str, bool]] = []
+    size = 0
+    for stmt in statements:
+        if _CREATE_TABLE_PATTERN.match(stmt):
+            if batch:
+                yield batch, tags
+                batch, tags, size = [], [], 0
+            _register_schema(stmt, schemas)
+            continue
+        if stmt[:6].upper() != "INSERT":
+            continue
+
+        pieces = _split_insert(stmt, chunk_bytes)
+        for index, piece in enumerate(pieces):
+            batch.append(piece)
+            tags.append((stmt, index == len(pieces) - 1))
+            size += len(piece)
+            if size >= chunk_bytes:
+                yield batch, tags
+                batch, tags, size = [], [], 0
+    if batch:
+        yield batch, tags
+
+
+def _parse_pieces(pieces: List[str], schemas: Dict[str, TableSchema]) -> List[Tuple[bool, Any]]:
+    """
+    Worker task: parse INSERT pieces, reporting failures instead of raising.
+    """
+    results: List[Tuple[bool, Any]] = []
+    for piece in pieces:
+        try:
+            results.append((True, parse_insert_statement(piece, schemas)))
+        except ValueError:
+            results.append((False, None))
+    return results
+
+
+class _PieceMerger:
+    """
+    Reassemble per-statement results from piece results arriving in order.
+    """
+
+    def __init__(self) -> None:
+        self.table_name: Optional[str] = None
+        self.rows: List[Dict[str, Any]] = []
+        self.failed = False
+
+    def add(self, pending: _PendingBatch) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        future, tags, schemas = pending
+        merged = []
+        for (ok, parsed), (stmt, last) in zip(future.result(), tags):
+            if not ok:
+                self.failed = True
+            elif parsed is not None:
+                self.table_name = parsed[0]
+                self.rows.extend(parsed[1])
+            if not last:
+                continue
+
+            if self.failed:
+                # Raises the statement's real error, or parses it if only a cut was bad.
+                whole = parse_insert_statement(stmt, schemas)
+                if whole is not None:
+                    merged.append(whole)
+            elif self.table_name is not None:
+                merged.append((self.table_name, self.rows))
+            self.table_name, self.rows, self.failed = None, [], False
+        return merged
+
+
+def iter_parallel_statements(
+    statements: Iterable[str],
+    schemas: Dict[str, TableSchema],
+    workers: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Parse INSERT statements on a process pool, yielding results in dump order.
+
+    Statements are reassembled and CREATE TABLEs applied in the calling
+    process; INSERTs larger than ``chunk_bytes`` are split on row boundaries
+    so one big extended INSERT (Sakila's payment or rental) spreads over
+    several workers, and small ones are batched to keep tasks near
+    ``chunk_bytes``. At most two tasks per worker are in flight, so memory
+    stays bounded as in the serial streaming path.
+
+    Args:
+        statements: Statements as produced by iter_statements().
+        schemas: Mapping from table names to TableSchema; updated in place.
+        workers: Number of worker processes; 1 or less parses serially.
+        chunk_bytes: Approximate amount of SQL per worker task.
+
+    Yields:
+        (table_name, rows) per INSERT statement, in order, exactly as
+        iter_parsed_statements() would.
+    """
+    if workers <= 1:
+        yield from iter_parsed_statements(statements, schemas)
+        return
+
+    max_pending = workers * 2
+    merger = _PieceMerger()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[_PendingBatch] = deque()
+        for batch, tags in _iter_batches(statements, schemas, chunk_bytes):
+            # Snapshot the schemas: later CREATE TABLEs must not affect this batch.
+            snapshot = dict(schemas)
+            pending.append((pool.submit(_parse_pieces, batch, snapshot), tags, snapshot))
+            if len(pending) >= max_pending:
+                yield from merger.add(pending.popleft())
+        while pending:
+            yield from merger.add(pending.popleft())
+
+
+def iter_statements(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Re-assemble SQL statements from dump lines.
+
+    INSERTs may span multiple lines, so non-empty lines are buffered until one
+    ends with ";". Only the current statement is held in memory, which keeps
+    this usable on a file object for dumps of any size.
+
+    Args:
+        lines: Lines of the dump (a list or an open file).
+
+    Yields:
+        One statement at a time, its lines joined by single spaces.
+    """
+    buffer: List[str] = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped == "--" or stripped.startswith("-- "):
+            # Line comment; joining it into a statement would comment out the rest.
+            continue
+
+        buffer.append(stripped)
+        if stripped.endswith(";"):
+            # End of one statement
+            yield " ".join(buffer)
+            buffer = []
+
+
+def iter_table_rows(
+    data_path: Path,
+    schemas: Dict[str, TableSchema],
+    workers: int = 1,
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Stream (table_name, rows) for each INSERT in a dump file.
+
+    The file is read line by line, so memory is bounded by the largest single
+    INSERT statement (mysqldump caps extended INSERTs at net_buffer_length,
+    about 1 MB by default) rather than by the size of the dump.
+
+    Args:
+        data_path: Path to the SQL dump.
+        schemas: Mapping from table names to TableSchema; CREATE TABLE
+            statements in the dump are added to it.
+        workers: Parse on this many processes (see iter_parallel_statements()).
+
+    Yields:
+        (table_name, rows) per parsed INSERT statement, in file order.
+    """
+    with data_path.open(encoding="utf-8") as f:
+        yield from iter_parallel_statements(iter_statements(f), schemas, workers)
+
+
+def parse_data_file(
+    data_sql: str,
+    schemas: Dict[str, TableSchema],
+    workers: int = 1,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Parse a whole dump into per-table row dictionaries.
+
+    Args:
+        data_sql: Contents of the dump.
+        schemas: Mapping from table names to TableSchema; CREATE TABLE
+            statements in the dump are added to it.
+        workers: Parse on this many processes (see iter_parallel_statements()).
+
+    Returns:
+        Mapping from table name to list of row dictionaries, in dump order.
+    """
+    tables_to_rows: Dict[str, List[Dict[str, Any]]] = {}
+
+    statements = iter_statements(data_sql.splitlines())
+    for table_name, rows in iter_parallel_statements(statements, schemas, workers):
+        tables_to_rows.setdefault(table_name, []).extend(rows)
+
+    return tables_to_rows
+
+
+def write_csv(
+    table_name: str,
+    columns: List[str],
+    rows: List[Dict[str, Any]],
+    out_dir: Path,
+) -> None:
+    """
+    Write a table to CSV with header.
+
+    Args:
+        table_name: Name of the table.
+        columns: Ordered list of column names.
+        rows: List of row dictionaries.
+        out_dir: Output directory.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{table_name}.csv"
+
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def _json_default(value: Any) -> Any:
+    """
+    JSON form of values json cannot encode: DECIMAL columns stay numbers, dates become text.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def write_json(
+    table_name: str,
+    rows: List[Dict[str, Any]],
+    out_dir: Path,
+) -> None:
+    """
+    Write a table to JSON as a list of objects.
+
+    Args:
+        table_name: Name of the table.
+        rows: List of row dictionaries.
+        out_dir: Output directory.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{table_name}.json"
+
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False, indent=2, default=_json_default)
+
+
+class StreamingTableWriter:
+    """
+    Append one table's rows to its CSV and JSON files as they are parsed.
+
+    The files are opened once and the header and "[" are written straight
+    away. Each batch of rows is then appended, and close() terminates the
+    JSON array. The output is byte-for-byte what write_csv() and write_json()
+    produce for the full row list.
+    """
+
+    def __init__(self, table_name: str, columns: List[str], out_dir: Path) -> None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.table_name = table_name
+        self.rows_written = 0
+        self._csv_file: TextIO = (out_dir / f"{table_name}.csv").open("w", newline="", encoding="utf-8")
+        self._json_file: TextIO = (out_dir / f"{table_name}.json").open("w", encoding="utf-8")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=columns)
+        self._csv_writer.writeheader()
+        self._json_file.write("[")
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Append rows to both files.
+
+        Args:
+            rows: Row dictionaries in table order.
+        """
+        self._csv_writer.writerows(rows)
+        for row in rows:
+            text = json.dumps(row, ensure_ascii=False, indent=2, default=_json_default)
+            # Indent each object one level, as json.dump does inside the list.
+            self._json_file.write(("\n" if self.rows_written == 0 else ",\n") + "  " + text.replace("\n", "\n  "))
+            self.rows_written += 1
+
+    def close(self) -> None:
+        """
+        Terminate the JSON array and close both files.
+        """
+        self._json_file.write("\n]" if self.rows_written else "]")
+        self._json_file.close()
+        self._csv_file.close()
+
+
+def export_streaming(
+    data_path: Path,
+    schemas: Dict[str, TableSchema],
+    out_dir: Path,
+    workers: int = 1,
+) -> Dict[str, int]:
+    """
+    Convert a dump to CSV/JSON without holding more than one statement's rows
+    (or, with workers, the rows of the tasks in flight).
+
+    Args:
+        data_path: Path to the SQL dump.
+        schemas: Mapping from table names to TableSchema.
+        out_dir: Output directory.
+        workers: Number of parsing processes.
+
+    Returns:
+        Mapping from table name to number of rows written.
+    """
+    writers: Dict[str, StreamingTableWriter] = {}
+    try:
+        for table_name, rows in iter_table_rows(data_path, schemas, workers):
+            writer = writers.get(table_name)
+            if writer is None:
+                schema = lookup_schema(schemas, table_name)
+                if schema is None:
+                    print(f"Warning: parsed rows for unknown table '{table_name}', skipping export.")
+                    continue
+                print(f"Streaming table '{table_name}'...")
+                writer = writers[table_name] = StreamingTableWriter(table_name, schema.columns, out_dir)
+            writer.write_rows(rows)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {name: writer.rows_written for name, writer in writers.items()}
+
+
+def export_tables(
+    tables_to_rows: Dict[str, List[Dict[str, Any]]],
+    schemas: Dict[str, TableSchema],
+    out_dir: Path,
+) -> None:
+    """
+    Write every parsed table to CSV and JSON.
+
+    Args:
+        tables_to_rows: Mapping from table name to its rows, from parse_data_file().
+        schemas: Mapping from table names to TableSchema.
+        out_dir: Output directory.
+    """
+    for table_name, rows in tables_to_rows.items():
+        schema = lookup_schema(schemas, table_name)
+        if schema is None:
+            print(f"Warning: parsed rows for unknown table '{table_name}', skipping export.")
+            continue
+
+        print(f"Exporting table '{table_name}' with {len(rows)} rows...")
+        write_csv(table_name, schema.columns, rows, out_dir)
+        write_json(table_name, rows, out_dir)
+
+
+def run_converter(
+    dataset: str,
+    default_data: Path,
+    default_out: Path,
+    default_schema: Optional[Path] = None,
+    argv: Optional[List[str]] = None,
+) -> None:
+    """
+    Command-line entry point shared by the dataset conversion scripts.
+
+    1. Load table schemas from the schema file, if any.
+    2. Read the dump (whole, or line by line with --stream), learning the
+       schemas of tables it creates itself.
+    3. Parse INSERT statements into typed per-table rows, on --workers processes.
+    4. Export each table to CSV and JSON.
+
+    Args:
+        dataset: Dataset name used in messages, e.g. "Sakila".
+        default_data: Dump converted when --data is not given.
+        default_out: Output directory used when --out is not given.
+        default_schema: File with the CREATE TABLE statements, used when
+            --schema is not given; None when the dump creates its own tables.
+        argv: Command-line arguments; sys.argv[1:] when None.
+    """
+    parser = argparse.ArgumentParser(description=f"Convert the {dataset} SQL dump to CSV and JSON.")
+    parser.add_argument("--data", type=Path, default=default_data, help="SQL dump to convert")
+    parser.add_argument("--out", type=Path, default=default_out, help="output directory")
+    parser.add_argument(
+        "--schema",
+        type=Path,
+        default=default_schema,
+        help="SQL file with CREATE TABLE statements (tables created in the dump itself are always picked up)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read the dump incrementally and append rows to the output files as they are parsed",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="parse INSERT statements on this many processes (default: 1, serial)",
+    )
+    args = parser.parse_args(argv)
+    data_path = args.data
+    out_dir = args.out
+
+    if not data_path.exists():
+        raise FileNotFoundError(f"Data file not found: {data_path}")
+
+    schemas = load_schemas(args.schema) if args.schema is not None else {}
+    if schemas:
+        print(f"Known {dataset} tables:", ", ".join(sorted(schemas.keys())))
+    else:
+        print(f"Reading {dataset} table schemas from CREATE TABLE statements in {data_path}")
+
+    if args.stream:
+        counts = export_streaming(data_path, schemas, out_dir, args.workers)
+        for table_name, count in counts.items():
+            print(f"Exported table '{table_name}' with {count} rows.")
+    else:
+        tables_to_rows = parse_data_file(read_text(data_path), schemas, args.workers)
+        export_tables(tables_to_rows, schemas, out_dir)
+
+    print("Done. Files written to:", out_dir.resolve())
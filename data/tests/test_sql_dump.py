@@ -0,0 +1,147 @@
+"""Tests for the shared MySQL dump to CSV/JSON engine."""
+
+import os
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if DATA_DIR not in sys.path:
+    sys.path.append(DATA_DIR)
+
+import sql_dump  # noqa: E402
+
+PAYMENT_DDL = """CREATE TABLE `payment` (
+  `payment_id` smallint unsigned NOT NULL AUTO_INCREMENT,
+  `amount` DECIMAL(5,2) NOT NULL,
+  `payment_date` datetime NOT NULL,
+  `note` enum('a,b','c') DEFAULT NULL,
+  PRIMARY KEY (`payment_id`),
+  KEY `idx_fk_note` (`note`,`amount`),
+  UNIQUE KEY `uq` (`payment_date`),
+  CONSTRAINT `fk_payment` FOREIGN KEY (`payment_id`) REFERENCES `rental` (`rental_id`) ON DELETE SET NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;"""
+
+ADDRESS_DDL = (
+    "CREATE TABLE `address` ( `address_id` int NOT NULL, `phone` varchar(20) NOT NULL, "
+    "/*!50705 `location` geometry NOT NULL,*/ `last_update` timestamp NOT NULL, PRIMARY KEY (`address_id`), "
+    "/*!50705 SPATIAL KEY `idx_location` (`location`),*/ KEY `idx_phone` (`phone`)) ENGINE=InnoDB;"
+)
+
+
+def test_parse_value_tuples_unescapes_strings():
+    rows = sql_dump.parse_value_tuples(r"(1,'it''s','a\'b\nc',NULL,-2.5,0x0A),(2,'','\\',NULL,3,'x')")
+    assert rows == [(1, "it's", "a'b\nc", None, -2.5, "0x0A"), (2, "", "\\", None, 3, "x")]
+
+
+@pytest.mark.parametrize(
+    "values_sql, message",
+    [
+        ("(1,2),(3)", "has 1 values where the first had 2"),
+        ("(1,2),(3,4,5)", "has 3 values where the first had 2"),
+        ("(1,2),3", "outside parentheses"),
+        ("(1,2", "no complete"),
+        ("(1,'ab)", "Unterminated string"),
+        ("(1,(2))", "Nested"),
+    ],
+)
+def test_parse_value_tuples_rejects_malformed_groups(values_sql, message):
+    with pytest.raises(ValueError, match=message):
+        sql_dump.parse_value_tuples(values_sql)
+
+
+def test_versioned_comments_are_unwrapped():
+    rows = sql_dump.parse_value_tuples("(1,'x',/*!50705 0x0101 */,'y'),(2,'/* kept */',/*!50705 0x02 */,'z')")
+    assert rows == [(1, "x", "0x0101", "y"), (2, "/* kept */", "0x02", "z")]
+
+    schema = sql_dump.parse_create_table(ADDRESS_DDL)
+    assert schema.columns == ["address_id", "phone", "location", "last_update"]
+    stmt = "INSERT INTO `address` VALUES (1,'555',/*!50705 0x0000000001 */,'2014-09-25 22:30:27');"
+    _, rows = sql_dump.parse_insert_statement(stmt, {"address": schema})
+    assert rows[0]["location"] == "0x0000000001"
+    assert rows[0]["last_update"] == datetime(2014, 9, 25, 22, 30, 27)
+
+
+def test_parse_create_table_skips_keys_and_constraints():
+    schema = sql_dump.parse_create_table(PAYMENT_DDL)
+    assert schema.name == "payment"
+    assert schema.columns == ["payment_id", "amount", "payment_date", "note"]
+    assert schema.types == ["SMALLINT", "DECIMAL", "DATETIME", "ENUM"]
+
+
+def test_typed_columns_handle_null_and_zero_dates():
+    schema = sql_dump.parse_create_table(PAYMENT_DDL)
+    stmt = (
+        "INSERT INTO `payment` VALUES (1,'0.00','2005-05-25 11:30:37','a,b'),"
+        "(2,2.99,'0000-00-00 00:00:00',NULL),(3,NULL,NULL,'c');"
+    )
+    table, rows = sql_dump.parse_insert_statement(stmt, {"payment": schema})
+    assert table == "payment"
+    assert rows == [
+        {"payment_id": 1, "amount": Decimal("0.00"), "payment_date": datetime(2005, 5, 25, 11, 30, 37), "note": "a,b"},
+        {"payment_id": 2, "amount": Decimal("2.99"), "payment_date": "0000-00-00 00:00:00", "note": None},
+        {"payment_id": 3, "amount": None, "payment_date": None, "note": "c"},
+    ]
+    assert sql_dump.column_converter("date")(["'2006-02-15'", "'0000-00-00'"]) == [date(2006, 2, 15), "0000-00-00"]
+
+
+def test_typed_columns_only_unquote_quoted_tokens():
+    schema = sql_dump.TableSchema("t", ["a", "b"], ["INT", "DECIMAL"])
+    _, rows = sql_dump.parse_insert_statement("INSERT INTO t VALUES (123,'10.5'),('5',10.5);", {"t": schema})
+    assert rows == [{"a": 123, "b": Decimal("10.5")}, {"a": 5, "b": Decimal("10.5")}]
+
+
+def test_decimal_keeps_its_scale_in_csv_and_is_a_number_in_json(tmp_path):
+    rows = [{"amount": Decimal("0.00")}]
+    sql_dump.write_csv("t", ["amount"], rows, tmp_path)
+    sql_dump.write_json("t", rows, tmp_path)
+    assert (tmp_path / "t.csv").read_text(encoding="utf-8").splitlines() == ["amount", "0.00"]
+    assert '"amount": 0.0' in (tmp_path / "t.json").read_text(encoding="utf-8")
+
+
+def _dump_text():
+    rows = ",".join(f"({i},'{i}.50','2005-05-25 11:30:37','{'a),(b' if i % 7 == 0 else 'c'}')" for i in range(1, 301))
+    return "\n".join(
+        [
+            "-- MySQL dump",
+            PAYMENT_DDL,
+            f"INSERT INTO `payment` VALUES {rows};",
+            "INSERT INTO `payment` VALUES (301,NULL,NULL,NULL),",
+            "(302,'0.00','0000-00-00 00:00:00','c');",
+            "",
+        ]
+    )
+
+
+def test_split_insert_cut_inside_a_string_is_reparsed_whole():
+    stmt = f"INSERT INTO `payment` VALUES (1,'1.00','2005-05-25 11:30:37','{'x' * 40}),({'y' * 40}'),(2,NULL,NULL,'c');"
+    pieces = sql_dump._split_insert(stmt, 30)
+    assert len(pieces) > 1
+    with pytest.raises(ValueError, match="Unterminated string"):
+        sql_dump.parse_insert_statement(pieces[0], {"payment": sql_dump.parse_create_table(PAYMENT_DDL)})
+
+    serial = list(sql_dump.iter_parsed_statements([PAYMENT_DDL, stmt], {}))
+    parallel = list(sql_dump.iter_parallel_statements([PAYMENT_DDL, stmt], {}, workers=2, chunk_bytes=30))
+    assert parallel == serial
+    assert serial[0][1][0]["note"] == f"{'x' * 40}),({'y' * 40}"
+
+
+def test_parallel_parsing_matches_serial_with_small_chunks():
+    statements = list(sql_dump.iter_statements(_dump_text().splitlines()))
+    serial = list(sql_dump.iter_parsed_statements(statements, {}))
+    parallel = list(sql_dump.iter_parallel_statements(statements, {}, workers=2, chunk_bytes=500))
+    assert parallel == serial
+    assert sum(len(rows) for _, rows in serial) == 302
+
+
+@pytest.mark.parametrize("options", [["--stream"], ["--workers", "2"], ["--stream", "--workers", "2"]])
+def test_converter_outputs_match_the_serial_run(tmp_path, options):
+    dump = tmp_path / "dump.sql"
+    dump.write_text(_dump_text(), encoding="utf-8")
+    sql_dump.run_converter("Test", dump, tmp_path / "serial", argv=[])
+    sql_dump.run_converter("Test", dump, tmp_path / "other", argv=options + ["--out", str(tmp_path / "other")])
+
+    for name in ("payment.csv", "payment.json"):
+        assert (tmp_path / "other" / name).read_bytes() == (tmp_path / "serial" / name).read_bytes()
@@ -0,0 +1,185 @@
+"""Asyncio seeding path that keeps many ``insert_many`` batches in flight.
+
+On high-latency or replicated targets the synchronous seeders are bound by
+round trips: every batch waits for its acknowledgement before the next one is
+sent. Here batches are produced by the same ``iter_*`` generators (so a given
+seed yields the same documents as the sync path) and inserted through Motor,
+with up to ``max_in_flight`` unordered ``insert_many`` calls outstanding,
+bounded by a semaphore.
+
+Motor is listed in ``requirements.txt`` but only imported by
+``insert_data_async``; ``seed_async`` also accepts any database object
+exposing awaitable ``drop``/``insert_many``/``create_index``.
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+from python import generate_fake_data as fake_data
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+
+async def _create_indexes(collection, name: str) -> None:
+    for keys, options in fake_data.INDEX_SPECS[name]:
+        await collection.create_index(keys, **options)
+
+
+async def _insert_batches(
+    collection,
+    documents: Iterable[Dict[str, Any]],
+    batch_size: int,
+    semaphore: asyncio.Semaphore,
+    keep=None,
+) -> int:
+    """
+    Insert ``documents`` in unordered batches, at most ``semaphore`` in flight; return the count.
+    """
+    tasks = set()
+    errors: List[BaseException] = []
+    inserted = 0
+
+    async def insert(batch):
+        try:
+            await collection.insert_many(batch, ordered=False)
+        except Exception as exc:  # surfaced after the in-flight batches settle
+            errors.append(exc)
+        finally:
+            semaphore.release()
+
+    for batch in fake_data._batched(documents, batch_size):
+        if errors:
+            break
+        if keep is not None:
+            keep.extend(batch)
+        await semaphore.acquire()
+        task = asyncio.ensure_future(insert(batch))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        inserted += len(batch)
+        # Let in-flight inserts progress between CPU-bound batch generations.
+        await asyncio.sleep(0)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    if errors:
+        raise errors[0]
+    return inserted
+
+
+async def _load_collection(
+    db,
+    name: str,
+    documents: Iterable[Dict[str, Any]],
+    batch_size: int,
+    semaphore: asyncio.Semaphore,
+    keep=None,
+    create_indexes: bool = True,
+):
+    """
+    Async counterpart of ``_stream_into_collection``: drop, insert concurrently, index.
+    """
+    collection = db[name]
+    await collection.drop()
+    inserted = await _insert_batches(collection, documents, batch_size, semaphore, keep)
+    if create_indexes:
+        await _create_indexes(collection, name)
+    print(f"✅ {name.capitalize()} inserted ({inserted})")
+    return keep if keep is not None else []
+
+
+async def build_indexes_async(db, collections: Optional[Iterable[str]] = None) -> None:
+    """
+    Build the ``INDEX_SPECS`` indexes of ``collections`` (default: all) concurrently.
+
+    Async counterpart of ``generate_fake_data.build_indexes`` for ``defer_indexes``.
+    """
+    names = list(collections or fake_data.INDEX_SPECS)
+    print("\n🗂️  Building indexes...")
+    await asyncio.gather(*(_create_indexes(db[name], name) for name in names))
+
+
+async def seed_async(
+    db,
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    batch_size: int = fake_data.DEFAULT_BATCH_SIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    create_indexes: bool = True,
+) -> None:
+    """
+    Seed every collection of ``db`` with bounded concurrent inserts.
+
+    Parameters
+    ----------
+    db : motor.motor_asyncio.AsyncIOMotorDatabase
+        Target database (or a compatible async stand-in).
+    n_users, n_products, n_transactions, n_logs : int, optional
+        Number of documents to generate per collection.
+    batch_size : int, optional
+        Documents per ``insert_many`` call.
+    max_in_flight : int, optional
+        Maximum concurrent ``insert_many`` calls per collection.
+    create_indexes : bool, optional
+        Build each collection's ``INDEX_SPECS`` after loading it.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be >= 1")
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def load(name, documents, keep=None):
+        return await _load_collection(db, name, documents, batch_size, semaphore, keep, create_indexes)
+
+    users = await load("users", fake_data.iter_users(n_users), fake_data.UserTable())
+    products = await load("products", fake_data.iter_products(n_products), fake_data.ProductTable())
+    await load("transactions", fake_data.iter_transactions(users, products, n_transactions))
+    await load("logs", fake_data.iter_logs(users, n_logs))
+
+
+def insert_data_async(
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    batch_size: int = fake_data.DEFAULT_BATCH_SIZE,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    uri: Optional[str] = None,
+    db_name: Optional[str] = None,
+    defer_indexes: bool = False,
+):
+    """
+    Run ``seed_async`` against a Motor client and print the usual statistics.
+
+    ``uri``/``db_name`` default to the target configured with ``configure_database``.
+    With ``defer_indexes`` the indexes of every collection are built concurrently
+    once all of them are loaded.
+    """
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient
+    except ImportError as exc:  # pragma: no cover - motor is optional
+        raise ImportError("the async seeder requires motor (pip install motor)") from exc
+
+    uri = uri or fake_data._mongo_settings["uri"]
+    db_name = db_name or fake_data._mongo_settings["db_name"]
+    print(f"🔄 Async seeding ({max_in_flight} batches in flight)...")
+
+    async def run():
+        client = AsyncIOMotorClient(uri)
+        try:
+            db = client[db_name]
+            await seed_async(
+                db, n_users, n_products, n_transactions, n_logs, batch_size, max_in_flight, not defer_indexes
+            )
+            if defer_indexes:
+                await build_indexes_async(db)
+            stats = await db.command("dbstats")
+        finally:
+            client.close()
+        print("\n📈 Database statistics:")
+        print(f"  - Database: {stats['db']}")
+        print(f"  - Collections: {stats['collections']}")
+        print(f"  - Data Size: {stats['dataSize'] / 1024 / 1024:.2f} MB")
+
+    asyncio.run(run())
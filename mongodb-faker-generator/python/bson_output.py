@@ -0,0 +1,230 @@
+"""Pre-encoded BSON output for the faker seeder.
+
+Batches are encoded to BSON ``bytes`` (inside the generation workers when a
+process pool is used) and inserted as ``RawBSONDocument`` instances, so PyMongo
+does not re-encode nested sub-documents on the main thread. The same bytes can
+be written to a ``mongorestore``-compatible dump (``<dir>/<db>/<collection>.bson``)
+and replayed into any number of test databases without regenerating them. Each
+dumped collection gets a ``<collection>.metadata.json`` listing the indexes from
+``INDEX_SPECS``, which ``mongorestore`` builds once the documents are loaded.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from bson.raw_bson import RawBSONDocument
+
+from python import generate_fake_data as fake_data
+from python import parallel_generation
+
+COLLECTIONS = ("users", "products", "transactions", "logs")
+
+
+def insert_raw_batches(collection, batches: Iterable[List[bytes]]) -> int:
+    """
+    Insert pre-encoded batches as ``RawBSONDocument`` objects.
+
+    Returns
+    -------
+    int
+        Number of inserted documents.
+    """
+    inserted = 0
+    for batch in batches:
+        if not batch:
+            continue
+        collection.insert_many([RawBSONDocument(raw) for raw in batch], ordered=False)
+        inserted += len(batch)
+    return inserted
+
+
+def write_bson_file(path: str, batches: Iterable[List[bytes]]) -> int:
+    """
+    Write concatenated BSON documents, the format ``mongorestore`` reads.
+
+    Returns
+    -------
+    int
+        Number of documents written.
+    """
+    written = 0
+    with open(path, "wb") as handle:
+        for batch in batches:
+            handle.writelines(batch)
+            written += len(batch)
+    return written
+
+
+def iter_bson_file(path: str, batch_size: int = fake_data.DEFAULT_BATCH_SIZE) -> Iterator[List[bytes]]:
+    """
+    Read a ``.bson`` file back as batches of raw documents without decoding them.
+    """
+    batch: List[bytes] = []
+    with open(path, "rb") as handle:
+        while True:
+            header = handle.read(4)
+            if not header:
+                break
+            if len(header) < 4:
+                raise ValueError(f"truncated BSON document in {path}")
+            size = int.from_bytes(header, "little")
+            body = handle.read(size - 4)
+            if len(body) < size - 4:
+                raise ValueError(f"truncated BSON document in {path}")
+            batch.append(header + body)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def index_metadata(name: str) -> Dict[str, Any]:
+    """
+    ``mongodump``-style metadata for one collection, with its ``INDEX_SPECS`` indexes.
+    """
+    indexes = [{"v": 2, "key": {"_id": 1}, "name": "_id_"}]
+    for keys, options in fake_data.INDEX_SPECS[name]:
+        index_name = "_".join(f"{field}_{direction}" for field, direction in keys)
+        indexes.append({"v": 2, "key": dict(keys), "name": index_name, **options})
+    return {"options": {}, "indexes": indexes, "collectionName": name, "type": "collection"}
+
+
+def write_metadata_file(path: str, name: str) -> None:
+    """
+    Write ``<collection>.metadata.json`` so ``mongorestore`` recreates the indexes.
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(index_metadata(name), handle)
+
+
+def _encoded_collections(
+    n_users: int,
+    n_products: int,
+    n_transactions: int,
+    n_logs: int,
+    seed: int,
+    workers: int,
+    chunk_size: int,
+) -> Iterator[tuple]:
+    """
+    Yield ``(collection, batches)`` pairs in dependency order.
+
+    User/product batches are wrapped so their reference fields are collected
+    while the caller consumes them; transactions and logs are only started
+    after that.
+    """
+    users = fake_data.UserTable()
+    products = fake_data.ProductTable()
+
+    def collecting(batches, sink):
+        for batch in batches:
+            sink.extend(RawBSONDocument(raw) for raw in batch)
+            yield batch
+
+    def encoded(kind, n, **refs):
+        return parallel_generation.iter_parallel_batches(
+            kind, n, seed=seed, workers=workers, chunk_size=chunk_size, encode=True, **refs
+        )
+
+    yield "users", collecting(encoded("users", n_users), users)
+    yield "products", collecting(encoded("products", n_products), products)
+    yield "transactions", encoded("transactions", n_transactions, users=users, products=products)
+    yield "logs", encoded("logs", n_logs, users=users)
+
+
+def dump_dataset(
+    dump_dir: str,
+    db_name: str = fake_data.DEFAULT_DB_NAME,
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    seed: int = 0,
+    workers: int = 1,
+    chunk_size: int = parallel_generation.DEFAULT_CHUNK_SIZE,
+) -> Dict[str, str]:
+    """
+    Generate the dataset straight to ``mongorestore`` layout.
+
+    Restore with ``mongorestore --db <name> <dump_dir>/<db_name>``, which also
+    builds the indexes listed in each ``.metadata.json``, or replay with
+    ``insert_from_dump``.
+
+    Returns
+    -------
+    dict
+        Collection name mapped to the written ``.bson`` path.
+    """
+    target = os.path.join(dump_dir, db_name)
+    os.makedirs(target, exist_ok=True)
+    paths = {}
+    for name, batches in _encoded_collections(n_users, n_products, n_transactions, n_logs, seed, workers, chunk_size):
+        path = os.path.join(target, f"{name}.bson")
+        count = write_bson_file(path, batches)
+        write_metadata_file(os.path.join(target, f"{name}.metadata.json"), name)
+        print(f"✅ {name.capitalize()} written to {path} ({count})")
+        paths[name] = path
+    return paths
+
+
+def _load_collection(name: str, batches: Iterable[List[bytes]], create_indexes: bool = True) -> None:
+    collection = fake_data.get_db()[name]
+    collection.drop()
+    inserted = insert_raw_batches(collection, batches)
+    if create_indexes:
+        fake_data._create_collection_indexes(collection, name)
+    print(f"✅ {name.capitalize()} inserted ({inserted})")
+
+
+def insert_data_bson(
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    seed: int = 0,
+    workers: int = 1,
+    chunk_size: int = parallel_generation.DEFAULT_CHUNK_SIZE,
+    defer_indexes: bool = False,
+):
+    """
+    Seed every collection from pre-encoded BSON batches.
+    """
+    print(f"🔄 Seeding with pre-encoded BSON ({workers} workers)...")
+    for name, batches in _encoded_collections(n_users, n_products, n_transactions, n_logs, seed, workers, chunk_size):
+        _load_collection(name, batches, create_indexes=not defer_indexes)
+    if defer_indexes:
+        fake_data.build_indexes()
+    fake_data._print_db_stats()
+
+
+def insert_from_dump(
+    source_dir: str,
+    batch_size: int = fake_data.DEFAULT_BATCH_SIZE,
+    collections: Optional[Iterable[str]] = None,
+    defer_indexes: bool = False,
+):
+    """
+    Replay a directory of ``<collection>.bson`` files into the current database.
+
+    Parameters
+    ----------
+    source_dir : str
+        Directory holding the ``.bson`` files (e.g. ``<dump_dir>/<db_name>``).
+    batch_size : int, optional
+        Raw documents per ``insert_many`` call.
+    collections : iterable of str, optional
+        Subset of collections to replay; defaults to all four.
+    defer_indexes : bool, optional
+        Create the replayed collections' indexes concurrently after loading.
+    """
+    names = list(collections or COLLECTIONS)
+    for name in names:
+        path = os.path.join(source_dir, f"{name}.bson")
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        _load_collection(name, iter_bson_file(path, batch_size), create_indexes=not defer_indexes)
+    if defer_indexes:
+        fake_data.build_indexes(names)
+    fake_data._print_db_stats()
@@ -0,0 +1,262 @@
+"""Resumable, checkpointed seeding for very large synthetic datasets.
+
+Every collection is generated in fixed-size batches whose RNG state is fully
+determined by ``derive_chunk_seed(seed, collection, batch)``. After each
+successful ``insert_many`` the checkpoint file records the next batch and its
+seed, so a restarted run skips straight to the first uncommitted batch and
+produces the same documents as an uninterrupted one. Documents without an
+``_id`` receive a deterministic ``ObjectId``, which makes re-inserting a
+partially written batch idempotent (duplicate-key errors are ignored).
+
+Date fields generated relative to "now" (``createdAt``, ``timestamp``...) are
+drawn against a reference time stored in the checkpoint, so a resumed run
+dates its batches exactly as the interrupted one would have.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from python import generate_fake_data as fake_data
+from python import parallel_generation
+
+CHECKPOINT_VERSION = 2
+COLLECTIONS = ("users", "products", "transactions", "logs")
+DUPLICATE_KEY = 11000
+
+
+def _deterministic_id(seed: int, kind: str, batch_index: int, position: int) -> ObjectId:
+    digest = hashlib.sha256(f"{seed}:{kind}:{batch_index}:{position}".encode()).digest()
+    return ObjectId(digest[:12])
+
+
+def _assign_ids(docs: List[Dict[str, Any]], seed: int, kind: str, batch_index: int) -> None:
+    for position, doc in enumerate(docs):
+        if "_id" not in doc:
+            doc["_id"] = _deterministic_id(seed, kind, batch_index, position)
+
+
+def _insert_idempotent(collection, docs: List[Dict[str, Any]]) -> None:
+    """
+    Insert ``docs`` unordered, tolerating documents already written by a crashed run.
+    """
+    try:
+        collection.insert_many(docs, ordered=False)
+    except BulkWriteError as exc:
+        errors = exc.details.get("writeErrors", [])
+        if not errors or any(error.get("code") != DUPLICATE_KEY for error in errors):
+            raise
+
+
+def _run_identity(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in params.items() if key != "now"}
+
+
+class Checkpoint:
+    """
+    JSON progress file describing one seeding run.
+
+    Parameters
+    ----------
+    path : str
+        Location of the checkpoint file.
+    params : dict
+        Run parameters (seed, batch size, counts); a resumed run must match them.
+        ``params["now"]`` is the run's reference time, which a resumed run takes
+        from the file instead.
+    """
+
+    def __init__(self, path: str, params: Dict[str, Any]):
+        self.path = path
+        self.params = params
+        self.collections: Dict[str, Dict[str, Any]] = {
+            name: {"next_batch": 0, "rng_seed": None, "inserted": 0, "indexed": False} for name in COLLECTIONS
+        }
+        self.resumed = False
+
+    @classmethod
+    def load_or_create(cls, path: str, params: Dict[str, Any]) -> "Checkpoint":
+        checkpoint = cls(path, params)
+        if not os.path.exists(path):
+            return checkpoint
+        with open(path, "r", encoding="utf-8") as handle:
+            state = json.load(handle)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"unsupported checkpoint version in {path}")
+        saved = state["params"]
+        if _run_identity(saved) != _run_identity(params):
+            raise ValueError(
+                f"checkpoint {path} was written for {_run_identity(saved)}, not {_run_identity(params)}; "
+                "delete it to start over"
+            )
+        checkpoint.params = {**params, "now": saved["now"]}
+        checkpoint.collections.update(state["collections"])
+        checkpoint.resumed = True
+        return checkpoint
+
+    def save(self) -> None:
+        """
+        Atomically replace the checkpoint file.
+        """
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"version": CHECKPOINT_VERSION, "params": self.params, "collections": self.collections},
+                handle,
+                indent=2,
+            )
+        os.replace(tmp_path, self.path)
+
+    @property
+    def complete(self) -> bool:
+        return all(state["indexed"] for state in self.collections.values())
+
+
+def _seed_collection(
+    checkpoint: Checkpoint,
+    kind: str,
+    n: int,
+    seed: int,
+    batch_size: int,
+    keep=None,
+    users=(),
+    products=(),
+    create_indexes: bool = True,
+) -> List[Any]:
+    """
+    Generate ``kind`` batch by batch, inserting only batches not yet committed.
+
+    Reference collections (``keep`` given) are regenerated from their seeds even
+    for committed batches so dependents see the same reference order.
+    """
+    state = checkpoint.collections[kind]
+    collection = fake_data.get_db()[kind]
+    # Nothing committed yet: clear leftovers from earlier seeds (or from a partly
+    # written first batch) even when resuming, so the result matches a fresh run.
+    if state["next_batch"] == 0 and not state["indexed"]:
+        collection.drop()
+
+    counts = parallel_generation.chunk_counts(n, batch_size)
+    for batch_index, count in enumerate(counts):
+        committed = batch_index < state["next_batch"]
+        if committed and keep is None:
+            continue
+        chunk_seed = parallel_generation.derive_chunk_seed(seed, kind, batch_index)
+        docs = parallel_generation.generate_chunk(
+            kind, count, chunk_seed, users, products, start=batch_index * batch_size, total=n
+        )
+        if keep is not None:
+            keep.extend(docs)
+        if committed:
+            continue
+        _assign_ids(docs, seed, kind, batch_index)
+        _insert_idempotent(collection, docs)
+        state["next_batch"] = batch_index + 1
+        state["rng_seed"] = (
+            parallel_generation.derive_chunk_seed(seed, kind, batch_index + 1) if batch_index + 1 < len(counts) else None
+        )
+        state["inserted"] += count
+        checkpoint.save()
+
+    if create_indexes and not state["indexed"]:
+        fake_data._create_collection_indexes(collection, kind)
+        state["indexed"] = True
+        checkpoint.save()
+    print(f"✅ {kind.capitalize()} inserted ({state['inserted']})")
+    return keep if keep is not None else []
+
+
+def insert_data_resumable(
+    checkpoint_path: str,
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    seed: int = 0,
+    batch_size: int = fake_data.DEFAULT_BATCH_SIZE,
+    defer_indexes: bool = False,
+    now: Optional[datetime] = None,
+) -> Optional[Checkpoint]:
+    """
+    Seed every collection, resuming from ``checkpoint_path`` when it exists.
+
+    Parameters
+    ----------
+    checkpoint_path : str
+        JSON file recording per-collection progress; created if missing.
+    n_users, n_products, n_transactions, n_logs : int, optional
+        Number of documents to generate per collection.
+    seed : int, optional
+        Master seed; batch seeds are derived from it.
+    batch_size : int, optional
+        Documents per batch and per checkpoint.
+    defer_indexes : bool, optional
+        Create all indexes concurrently once every collection is loaded.
+    now : datetime, optional
+        Reference time for relative dates of a new run; defaults to the current
+        time. A resumed run keeps the one stored in the checkpoint.
+
+    Returns
+    -------
+    Checkpoint
+        The final checkpoint state.
+    """
+    params = {
+        "seed": seed,
+        "batch_size": batch_size,
+        "counts": {"users": n_users, "products": n_products, "transactions": n_transactions, "logs": n_logs},
+        "now": (now or datetime.now()).isoformat(),
+    }
+    checkpoint = Checkpoint.load_or_create(checkpoint_path, params)
+    if checkpoint.complete:
+        print(f"✅ Checkpoint {checkpoint_path} is already complete; nothing to do.")
+        return checkpoint
+    if checkpoint.resumed:
+        progress = ", ".join(f"{name} batch {state['next_batch']}" for name, state in checkpoint.collections.items())
+        print(f"🔁 Resuming from {checkpoint_path} ({progress})")
+    else:
+        print(f"🔄 Checkpointed seeding into {checkpoint_path} (batch size {batch_size})...")
+
+    counts = params["counts"]
+    fake_data.set_reference_time(datetime.fromisoformat(checkpoint.params["now"]))
+    try:
+        build_now = not defer_indexes
+        users = _seed_collection(
+            checkpoint, "users", counts["users"], seed, batch_size, keep=fake_data.UserTable(), create_indexes=build_now
+        )
+        products = _seed_collection(
+            checkpoint,
+            "products",
+            counts["products"],
+            seed,
+            batch_size,
+            keep=fake_data.ProductTable(),
+            create_indexes=build_now,
+        )
+        _seed_collection(
+            checkpoint,
+            "transactions",
+            counts["transactions"],
+            seed,
+            batch_size,
+            users=users,
+            products=products,
+            create_indexes=build_now,
+        )
+        _seed_collection(checkpoint, "logs", counts["logs"], seed, batch_size, users=users, create_indexes=build_now)
+    finally:
+        fake_data.set_reference_time(None)
+
+    if defer_indexes:
+        fake_data.build_indexes()
+        for state in checkpoint.collections.values():
+            state["indexed"] = True
+        checkpoint.save()
+
+    fake_data._print_db_stats()
+    return checkpoint
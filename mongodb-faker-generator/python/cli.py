@@ -0,0 +1,207 @@
+"""Command-line entry point for the faker seeder.
+
+Examples
+--------
+Seed the classroom dataset (same sizes as ``generate_fake_data.py``)::
+
+    python -m python.cli --profile lab
+
+Seed one million documents into another server, deferring index builds::
+
+    python -m python.cli --profile 1M --uri mongodb://db:27017/ --defer-indexes
+
+Show the plan for a profile without touching MongoDB::
+
+    python -m python.cli --profile 100M --dry-run
+"""
+
+import argparse
+import sys
+from contextlib import nullcontext
+from typing import List, Optional
+
+from python import generate_fake_data as fake_data
+from python import profiles, value_pools
+
+MODES = ("auto", "eager", "streaming", "parallel", "pipelined", "async", "bson", "resumable", "dump")
+# Modes generating on this process; the others generate in worker processes or
+# reseed per batch, where one up-front set of pools does not apply.
+POOLED_MODES = ("eager", "streaming", "pipelined", "async")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m python.cli",
+        description="Generate fake users/products/transactions/logs and seed MongoDB.",
+    )
+    parser.add_argument("--profile", default="lab", choices=sorted(profiles.PROFILES), help="named scale profile")
+    parser.add_argument("--mode", default="auto", choices=MODES, help="seeding path (auto picks from the profile)")
+    parser.add_argument("--total", type=int, help="total documents, split with the profile ratios")
+    for name in profiles.COLLECTIONS:
+        parser.add_argument(f"--{name}", type=int, help=f"number of {name} documents")
+    parser.add_argument("--batch-size", type=int, help="documents per batch / insert_many call")
+    parser.add_argument("--workers", type=int, help="generation processes")
+    parser.add_argument("--uri", help="MongoDB connection string")
+    parser.add_argument("--database", help="target database name")
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="insert_many batches in flight in async and pipelined modes (default: 16 async, 8 pipelined)",
+    )
+    parser.add_argument("--insert-workers", type=int, help="insert threads in pipelined mode (default: 4)")
+    parser.add_argument(
+        "--seed", type=int, help="seed for reproducible data (parallel, bson, resumable and dump modes default to 0)"
+    )
+    parser.add_argument("--memory-budget-mb", type=int, help="memory the eager path may use (default: physical RAM)")
+    parser.add_argument(
+        "--pooled",
+        action="store_true",
+        help=f"draw slow text fields from pre-generated value pools ({', '.join(POOLED_MODES)} modes)",
+    )
+    parser.add_argument("--defer-indexes", action="store_true", help="build all indexes after loading")
+    parser.add_argument("--checkpoint", help="checkpoint file; implies --mode resumable")
+    parser.add_argument("--dump-dir", help="write a mongorestore dump instead of seeding; implies --mode dump")
+    parser.add_argument("--queries", action="store_true", help="run the example queries afterwards")
+    parser.add_argument("--dry-run", action="store_true", help="print the plan and exit")
+    return parser
+
+
+def resolve_profile(args: argparse.Namespace) -> profiles.ScaleProfile:
+    profile = profiles.get_profile(args.profile)
+    return profile.with_overrides(
+        total=args.total,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        uri=args.uri,
+        database=args.database,
+        **{name: getattr(args, name) for name in profiles.COLLECTIONS},
+    )
+
+
+def resolve_mode(args: argparse.Namespace, profile: profiles.ScaleProfile) -> str:
+    if args.checkpoint:
+        return "resumable"
+    if args.dump_dir:
+        return "dump"
+    if args.mode != "auto":
+        return args.mode
+    budget = args.memory_budget_mb * 1024 * 1024 if args.memory_budget_mb else None
+    return profiles.choose_strategy(profile, budget)
+
+
+def describe(profile: profiles.ScaleProfile, mode: str) -> str:
+    counts = ", ".join(f"{name}={count:,}" for name, count in profile.counts.items())
+    return (
+        f"Profile {profile.name}: {counts}\n"
+        f"  mode={mode} batch_size={profile.batch_size} workers={profile.workers}\n"
+        f"  target={profile.uri} db={profile.database}\n"
+        f"  eager memory estimate: {profile.estimated_memory_bytes() / 1024**2:,.0f} MB"
+    )
+
+
+def run(profile: profiles.ScaleProfile, mode: str, args: argparse.Namespace) -> None:
+    counts = profile.as_kwargs()
+    # Chunked modes derive per-chunk seeds from a master seed and always need one.
+    seed = 0 if args.seed is None else args.seed
+    if mode == "dump":
+        from python import bson_output
+
+        bson_output.dump_dataset(
+            args.dump_dir, profile.database, seed=seed, workers=profile.workers, chunk_size=profile.batch_size, **counts
+        )
+        return
+
+    fake_data.configure_database(profile.uri, profile.database)
+    if mode == "eager":
+        fake_data.insert_data_to_mongodb(defer_indexes=args.defer_indexes, **counts)
+    elif mode == "streaming":
+        fake_data.insert_data_streaming(batch_size=profile.batch_size, defer_indexes=args.defer_indexes, **counts)
+    elif mode == "parallel":
+        from python import parallel_generation
+
+        parallel_generation.insert_data_parallel(
+            seed=seed,
+            workers=profile.workers,
+            chunk_size=profile.batch_size,
+            defer_indexes=args.defer_indexes,
+            **counts,
+        )
+    elif mode == "pipelined":
+        from python import pipeline
+
+        limits = {"insert_workers": args.insert_workers, "max_in_flight": args.max_in_flight}
+        pipeline.insert_data_pipelined(
+            batch_size=profile.batch_size,
+            defer_indexes=args.defer_indexes,
+            **{key: value for key, value in limits.items() if value is not None},
+            **counts,
+        )
+    elif mode == "async":
+        from python import async_seed
+
+        async_seed.insert_data_async(
+            batch_size=profile.batch_size,
+            max_in_flight=async_seed.DEFAULT_MAX_IN_FLIGHT if args.max_in_flight is None else args.max_in_flight,
+            uri=profile.uri,
+            db_name=profile.database,
+            defer_indexes=args.defer_indexes,
+            **counts,
+        )
+    elif mode == "bson":
+        from python import bson_output
+
+        bson_output.insert_data_bson(
+            seed=seed,
+            workers=profile.workers,
+            chunk_size=profile.batch_size,
+            defer_indexes=args.defer_indexes,
+            **counts,
+        )
+    elif mode == "resumable":
+        from python import checkpoint
+
+        checkpoint.insert_data_resumable(
+            args.checkpoint, seed=seed, batch_size=profile.batch_size, defer_indexes=args.defer_indexes, **counts
+        )
+    else:
+        raise ValueError(f"unknown mode {mode!r}")
+
+    if args.queries:
+        fake_data.query_examples()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.mode == "resumable" and not args.checkpoint:
+        parser.error("--mode resumable requires --checkpoint")
+    if args.mode == "dump" and not args.dump_dir:
+        parser.error("--mode dump requires --dump-dir")
+    if args.defer_indexes and args.dump_dir:
+        parser.error("--defer-indexes does not apply to --dump-dir; mongorestore builds the dumped indexes after loading")
+
+    profile = resolve_profile(args)
+    mode = resolve_mode(args, profile)
+    if args.pooled and mode not in POOLED_MODES:
+        parser.error(f"--pooled does not apply to --mode {mode}")
+    print(describe(profile, mode))
+    if args.dry_run:
+        return 0
+
+    try:
+        if args.seed is not None:
+            # Seeds the in-process modes (and the value pools) before anything is drawn.
+            fake_data.seed_generators(args.seed)
+        with value_pools.pooled_generation() if args.pooled else nullcontext():
+            run(profile, mode, args)
+    except Exception as exc:
+        print(f"\n❌ Error: {exc}")
+        return 1
+    finally:
+        fake_data.close_client()
+    print("\n✅ All done! Check your MongoDB database.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
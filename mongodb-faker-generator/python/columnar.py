@@ -0,0 +1,205 @@
+"""NumPy columnar backend for the numeric and categorical fields of products and logs.
+
+Plain random draws (prices, discounts, inventory, ratings, dimensions, log
+levels, status codes, response times, timestamps) are generated as NumPy
+columns for a whole batch; Faker is only called for the free-text fields.
+Columns are converted with ``tolist()`` before assembly so the documents hold
+plain Python values that PyMongo can encode. The distributions match
+``generate_products`` / ``generate_logs``: 30% discount chance, 85% in stock
+with ``quantity`` forced to 0 otherwise, 80% of logs linked to a user, and so on.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from python import generate_fake_data as fake_data
+
+DEFAULT_BATCH_SIZE = 10_000
+
+PRODUCT_CATEGORIES = ["Electronics", "Books", "Clothing", "Home & Garden", "Sports", "Toys"]
+WAREHOUSES = ["Porto", "Lisboa", "Faro"]
+SIZES = ["S", "M", "L", "XL"]
+LEVEL_CYCLE = ["INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL", "INFO"]
+WEIGHTED_LEVELS = ["INFO", "INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL"]
+LOG_TYPES = ["login", "logout", "page_view", "api_call", "error", "performance"]
+HTTP_METHODS = ["GET", "POST", "PUT", "DELETE"]
+STATUS_CODES = [200, 201, 400, 401, 403, 404, 500]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("the columnar backend requires numpy (pip install numpy)")
+
+
+def _choice(rng, values: Sequence[Any], size: int) -> List[Any]:
+    return [values[i] for i in rng.integers(0, len(values), size).tolist()]
+
+
+def _datetimes_between(rng, start: datetime, end: datetime, size: int) -> List[datetime]:
+    """
+    Uniform datetimes in ``[start, end]`` at second resolution.
+    """
+    span = int((end - start).total_seconds())
+    return [start + timedelta(seconds=s) for s in rng.integers(0, span + 1, size).tolist()]
+
+
+def _batch_sizes(n: int, batch_size: int) -> Iterator[int]:
+    if batch_size < 1:
+        raise ValueError("batch size must be >= 1")
+    for start in range(0, n, batch_size):
+        yield min(batch_size, n - start)
+
+
+def iter_products_columnar(
+    n: int = 500, batch_size: int = DEFAULT_BATCH_SIZE, seed: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield product documents, drawing numeric/categorical fields per batch with NumPy.
+
+    Parameters
+    ----------
+    n : int, optional
+        Number of products to emit.
+    batch_size : int, optional
+        Rows generated per column draw.
+    seed : int, optional
+        Seed for the NumPy generator (Faker text fields follow ``fake``'s own seed).
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    fake = fake_data.get_faker()
+    image_url = fake_data._field_provider(fake, "products.images", "image_url")
+
+    for size in _batch_sizes(n, batch_size):
+        now = fake_data.reference_time()
+        category = _choice(rng, PRODUCT_CATEGORIES, size)
+        amount = np.round(rng.uniform(10, 1000, size), 2).tolist()
+        discounted = (rng.random(size) < 0.30).tolist()
+        # Undiscounted products get int 0, as in the row-wise generator.
+        discount = [d if hit else 0 for hit, d in zip(discounted, np.round(rng.uniform(0, 30, size), 2).tolist())]
+        in_stock = (rng.random(size) < 0.85).tolist()
+        quantity = np.where(in_stock, rng.integers(0, 1001, size), 0).tolist()
+        warehouse = _choice(rng, WAREHOUSES, size)
+        sizes = _choice(rng, SIZES, size)
+        weight = rng.uniform(0.1, 50, size).tolist()
+        length = rng.integers(10, 201, size).tolist()
+        width = rng.integers(10, 151, size).tolist()
+        height = rng.integers(5, 101, size).tolist()
+        rating = np.round(rng.uniform(1, 5, size), 1).tolist()
+        rating_count = rng.integers(0, 5001, size).tolist()
+        image_count = rng.integers(1, 6, size).tolist()
+        tag_count = rng.integers(3, 9, size).tolist()
+        created = _datetimes_between(rng, now - timedelta(days=2 * 365), now, size)
+        updated = _datetimes_between(rng, now - timedelta(days=30), now, size)
+
+        for i in range(size):
+            cat = category[i]
+            yield {
+                "sku": fake.ean13(),
+                "name": fake.catch_phrase(),
+                "description": fake.paragraph(nb_sentences=5),
+                "category": cat,
+                "subcategory": fake.word(),
+                "brand": fake.company(),
+                "price": {"amount": amount[i], "currency": "EUR", "discount": discount[i]},
+                "inventory": {"inStock": in_stock[i], "quantity": quantity[i], "warehouse": warehouse[i]},
+                "attributes": {
+                    "color": fake.color_name() if cat in ("Clothing", "Home & Garden") else None,
+                    "size": sizes[i] if cat == "Clothing" else None,
+                    "weight": f"{weight[i]:.2f} kg",
+                    "dimensions": {"length": length[i], "width": width[i], "height": height[i], "unit": "cm"},
+                },
+                "ratings": {"average": rating[i], "count": rating_count[i]},
+                "images": [image_url() for _ in range(image_count[i])],
+                "tags": fake.words(nb=tag_count[i]),
+                "createdAt": created[i],
+                "updatedAt": updated[i],
+            }
+
+
+def iter_logs_columnar(
+    users: Sequence[Dict],
+    n: int = 5000,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    seed: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield log documents, drawing numeric/categorical fields per batch with NumPy.
+
+    Parameters
+    ----------
+    users : sequence of dict
+        User documents (or reference stubs) providing ``_id`` values.
+    n : int, optional
+        Number of log entries to create.
+    batch_size : int, optional
+        Rows generated per column draw.
+    seed : int, optional
+        Seed for the NumPy generator.
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    fake = fake_data.get_faker()
+    session_id = fake_data._field_provider(fake, "logs.sessionId", "uuid4")
+    message = fake_data._field_provider(fake, "logs.message", "sentence")
+    ip = fake_data._field_provider(fake, "logs.metadata.ip", "ipv4")
+    user_agent = fake_data._field_provider(fake, "logs.metadata.userAgent", "user_agent")
+    user_ids = [user["_id"] for user in users]
+    offset = 0
+
+    for size in _batch_sizes(n, batch_size):
+        now = fake_data.reference_time()
+        level = _choice(rng, WEIGHTED_LEVELS, size)
+        for i in range(max(0, min(size, len(LEVEL_CYCLE) - offset))):
+            level[i] = LEVEL_CYCLE[offset + i]
+        log_type = _choice(rng, LOG_TYPES, size)
+        has_user = (rng.random(size) < 0.80).tolist()
+        user_idx = rng.integers(0, max(1, len(user_ids)), size).tolist()
+        method = _choice(rng, HTTP_METHODS, size)
+        status = _choice(rng, STATUS_CODES, size)
+        response_time = rng.integers(10, 3001, size).tolist()
+        has_error_type = (rng.random(size) < 0.20).tolist()
+        has_stack = (rng.random(size) < 0.20).tolist()
+        timestamp = _datetimes_between(rng, now - timedelta(days=7), now, size)
+
+        for i in range(size):
+            yield {
+                "timestamp": timestamp[i],
+                "level": level[i],
+                "type": log_type[i],
+                "userId": user_ids[user_idx[i]] if has_user[i] and user_ids else None,
+                "sessionId": session_id(),
+                "message": message(),
+                "metadata": {
+                    "ip": ip(),
+                    "userAgent": user_agent(),
+                    "endpoint": f"/api/{fake.word()}/{fake.word()}",
+                    "method": method[i],
+                    "statusCode": status[i],
+                    "responseTime": response_time[i],
+                },
+                "error": {
+                    "type": fake.word() if has_error_type[i] else None,
+                    "stack": fake.paragraph() if has_stack[i] else None,
+                },
+            }
+        offset += size
+
+
+def generate_products_columnar(n: int = 500, **kwargs) -> List[Dict[str, Any]]:
+    """
+    List form of ``iter_products_columnar``.
+    """
+    return list(iter_products_columnar(n, **kwargs))
+
+
+def generate_logs_columnar(users: Sequence[Dict], n: int = 5000, **kwargs) -> List[Dict[str, Any]]:
+    """
+    List form of ``iter_logs_columnar``.
+    """
+    return list(iter_logs_columnar(users, n, **kwargs))
@@ -0,0 +1,255 @@
+"""Opt-in per-field cost profiler for the Faker-driven generators.
+
+``profiled_generation`` temporarily routes ``generate_fake_data`` through a
+``ProfilingFaker``: every provider call (``fake.text``, ``fake.user_agent``,
+``fake.random.uniform``, ...) is timed and charged to the generator source
+line that made it. Lines are mapped to document field paths such as
+``profile.bio`` or ``metadata.userAgent`` by reading the document literals in
+``generate_fake_data.py``, so the report says which fields are worth pooling
+(``python.value_pools``), vectorising (``python.columnar``) or simplifying::
+
+    python -m python.field_profiler --users 2000 --logs 5000 --top 15
+
+Work done outside Faker (dict construction, ``datetime.combine``, stdlib
+``random``) is not attributed to a field; the table shows how much of the
+wall time the attributed calls cover.
+"""
+
+import argparse
+import linecache
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from python import generate_fake_data as fake_data
+
+GENERATOR_FILE = fake_data.__file__
+_KEY_LINE = re.compile(r'^(\s*)"(\w+)":')
+# Frames walked from a provider call back to the generator line that asked for it.
+_MAX_CALLER_DEPTH = 8
+
+
+def field_path(filename: str, lineno: int) -> Optional[str]:
+    """
+    Document field path written by a generator source line, e.g. ``profile.address.city``.
+
+    Walks up from ``lineno`` through less-indented ``"key": {`` / ``"key": [``
+    lines; returns ``None`` for lines outside a document literal.
+    """
+    line = linecache.getline(filename, lineno)
+    match = _KEY_LINE.match(line)
+    parts = [match.group(2)] if match else []
+    indent = len(line) - len(line.lstrip())
+    for number in range(lineno - 1, 0, -1):
+        text = linecache.getline(filename, number)
+        if not text.strip():
+            continue
+        text_indent = len(text) - len(text.lstrip())
+        if text_indent >= indent:
+            continue
+        match = _KEY_LINE.match(text)
+        if not match:
+            break
+        parts.append(match.group(2))
+        indent = text_indent
+    return ".".join(reversed(parts)) or None
+
+
+class FieldProfile:
+    """
+    Cumulative seconds and call counts per (generator function, source line).
+    """
+
+    def __init__(self, filename: str = GENERATOR_FILE):
+        self.filename = filename
+        self.costs: Dict[Tuple[str, int], List[float]] = {}
+        self.elapsed = 0.0
+
+    def record(self, function: str, lineno: int, seconds: float) -> None:
+        cost = self.costs.get((function, lineno))
+        if cost is None:
+            self.costs[(function, lineno)] = [1, seconds]
+        else:
+            cost[0] += 1
+            cost[1] += seconds
+
+    @property
+    def attributed_seconds(self) -> float:
+        return sum(seconds for _, seconds in self.costs.values())
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        """
+        Rows sorted by cumulative time: function, line, field, calls, seconds, share.
+        """
+        total = self.attributed_seconds or 1.0
+        rows = []
+        for (function, lineno), (calls, seconds) in self.costs.items():
+            rows.append(
+                {
+                    "function": function,
+                    "line": lineno,
+                    "field": field_path(self.filename, lineno),
+                    "source": linecache.getline(self.filename, lineno).strip(),
+                    "calls": calls,
+                    "seconds": seconds,
+                    "share": seconds / total,
+                }
+            )
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows
+
+    def format_table(self, top: Optional[int] = None) -> str:
+        rows = self.ranked()[:top]
+        lines = [f"{'#':>3} {'generator':<17} {'field':<38} {'calls':>9} {'total ms':>10} {'µs/call':>8} {'share':>6}"]
+        for rank, row in enumerate(rows, 1):
+            label = row["field"] or f"line {row['line']}: {row['source'][:28]}"
+            lines.append(
+                f"{rank:>3} {row['function']:<17} {label:<38} {row['calls']:>9,} {row['seconds'] * 1e3:>10.1f} "
+                f"{row['seconds'] / row['calls'] * 1e6:>8.1f} {row['share']:>6.1%}"
+            )
+        if self.elapsed:
+            lines.append(
+                f"Attributed Faker time: {self.attributed_seconds:.3f}s of {self.elapsed:.3f}s wall "
+                f"({self.attributed_seconds / self.elapsed:.0%})"
+            )
+        return "\n".join(lines)
+
+
+def _timed(profile: FieldProfile, method: Callable) -> Callable:
+    filename = profile.filename
+    perf_counter = time.perf_counter
+    getframe = sys._getframe
+
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        result = method(*args, **kwargs)
+        seconds = perf_counter() - start
+        frame = getframe(1)
+        for _ in range(_MAX_CALLER_DEPTH):
+            if frame is None:
+                return result
+            if frame.f_code.co_filename == filename:
+                profile.record(frame.f_code.co_name, frame.f_lineno, seconds)
+                return result
+            frame = frame.f_back
+        return result
+
+    return timed
+
+
+class _ProfilingProxy:
+    """
+    Forward attribute access to ``target``, timing every public callable.
+    """
+
+    def __init__(self, target, profile: FieldProfile):
+        self._target = target
+        self._profile = profile
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        timed = _timed(self._profile, attribute)
+        # Cache the wrapper so later lookups skip __getattr__.
+        setattr(self, name, timed)
+        return timed
+
+
+class ProfilingFaker(_ProfilingProxy):
+    """
+    Faker proxy charging each provider call to the generator line that made it.
+
+    ``fake.random`` is wrapped too, so ``fake.random.uniform`` and the
+    reference pickers are profiled as well.
+
+    Parameters
+    ----------
+    faker : faker.Faker
+        Instance (or ``PooledFaker``) whose calls are timed.
+    profile : FieldProfile, optional
+        Accumulator to record into; a fresh one by default.
+    """
+
+    def __init__(self, faker, profile: Optional[FieldProfile] = None):
+        profile = profile if profile is not None else FieldProfile()
+        super().__init__(faker, profile)
+        self.random = _ProfilingProxy(faker.random, profile)
+
+    @property
+    def profile(self) -> FieldProfile:
+        return self._profile
+
+    def field_provider(self, field: str, name: str) -> Callable:
+        """
+        Timed provider for one document field, keeping a ``PooledFaker``'s pools.
+        """
+        provider = fake_data._field_provider(self._target, field, name)
+        return _timed(self._profile, provider)
+
+
+@contextmanager
+def profiled_generation(profile: Optional[FieldProfile] = None) -> Iterator[FieldProfile]:
+    """
+    Temporarily route the generators through a ``ProfilingFaker``.
+
+    Examples
+    --------
+    >>> with profiled_generation() as profile:
+    ...     users = generate_users(1_000)
+    >>> print(profile.format_table(top=10))
+    """
+    original = fake_data.get_faker()
+    profiling = ProfilingFaker(original, profile)
+    fake_data.fake = profiling
+    start = time.perf_counter()
+    try:
+        yield profiling.profile
+    finally:
+        profiling.profile.elapsed += time.perf_counter() - start
+        fake_data.fake = original
+
+
+def profile_dataset(
+    n_users: int = 1000,
+    n_products: int = 1000,
+    n_transactions: int = 2000,
+    n_logs: int = 5000,
+    seed: Optional[int] = None,
+) -> FieldProfile:
+    """
+    Generate one in-memory dataset under the profiler and return the costs.
+    """
+    if seed is not None:
+        fake_data.seed_generators(seed)
+    with profiled_generation() as profile:
+        users = fake_data.UserTable(fake_data.iter_users(n_users))
+        products = fake_data.ProductTable(fake_data.iter_products(n_products))
+        for _ in fake_data.iter_transactions(users, products, n_transactions):
+            pass
+        for _ in fake_data.iter_logs(users, n_logs):
+            pass
+    return profile
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m python.field_profiler", description="Rank generator fields by Faker time."
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--transactions", type=int, default=2000)
+    parser.add_argument("--logs", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=25, help="rows to print")
+    args = parser.parse_args(argv)
+
+    profile = profile_dataset(args.users, args.products, args.transactions, args.logs, args.seed)
+    print(profile.format_table(args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,55 +1,229 @@
 """Utility to build and seed a sample MongoDB dataset for demos/tests."""
 
-from faker import Faker
-from pymongo import MongoClient, ASCENDING, DESCENDING
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 import random
-from typing import List, Dict, Any, Callable
+import threading
+import time
+import uuid
+from array import array
+from collections.abc import Sequence as SequenceABC
+from itertools import islice
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
 
-# Initialize Faker and MongoDB
-fake = Faker("pt_PT")
-client = MongoClient("mongodb://localhost:27017/")  # Adjust connection string as needed
-db = client["database_demo"]  # Database name
+FAKER_LOCALE = "pt_PT"
+DEFAULT_MONGO_URI = "mongodb://localhost:27017/"  # Adjust connection string as needed
+DEFAULT_DB_NAME = "database_demo"  # Database name
+# Runs of up to this many users (the classroom default) keep Faker's usernames
+# and emails as they are; larger runs suffix both with the row number, since
+# pt_PT Faker starts repeating them within a few hundred rows.
+PLAIN_USER_KEYS_LIMIT = 100
+
+# Same values as pymongo.ASCENDING / pymongo.DESCENDING; spelled out so that
+# importing the generators does not import pymongo.
+ASCENDING = 1
+DESCENDING = -1
+
+# ``fake``, ``client`` and ``db`` are created on first access (see ``__getattr__``)
+# so importing this module neither loads the Faker locale nor starts the
+# MongoClient monitor threads.
+_mongo_settings = {"uri": DEFAULT_MONGO_URI, "db_name": DEFAULT_DB_NAME}
+_lazy_lock = threading.RLock()
+
+
+def _create_faker():
+    from faker import Faker
+
+    return Faker(FAKER_LOCALE)
+
+
+def _create_client():
+    from pymongo import MongoClient
+
+    return MongoClient(_mongo_settings["uri"])
+
+
+def _create_db():
+    return get_client()[_mongo_settings["db_name"]]
+
+
+_LAZY_FACTORIES = {"fake": _create_faker, "client": _create_client, "db": _create_db}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build ``fake``, ``client`` or ``db`` the first time they are accessed (PEP 562).
+    """
+    factory = _LAZY_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _lazy_lock:
+        module_globals = globals()
+        if name not in module_globals:
+            module_globals[name] = factory()
+        return module_globals[name]
+
+
+def get_faker():
+    """
+    Return the shared Faker instance, creating it on first use.
+    """
+    fake = globals().get("fake")
+    return fake if fake is not None else __getattr__("fake")
+
+
+def get_client():
+    """
+    Return the shared MongoClient, creating it on first use.
+    """
+    client = globals().get("client")
+    return client if client is not None else __getattr__("client")
+
+
+def get_db():
+    """
+    Return the target database, connecting on first use.
+    """
+    db = globals().get("db")
+    return db if db is not None else __getattr__("db")
+
+
+def close_client() -> None:
+    """
+    Close the MongoClient if one was created; the next access reconnects.
+    """
+    with _lazy_lock:
+        client = globals().pop("client", None)
+        globals().pop("db", None)
+    if client is not None:
+        client.close()
+
+
+def configure_database(uri: str = DEFAULT_MONGO_URI, db_name: str = DEFAULT_DB_NAME) -> None:
+    """
+    Point the seeders at another MongoDB deployment/database.
+
+    The connection is opened lazily by the next ``get_db()`` / ``db`` access.
+    """
+    close_client()
+    _mongo_settings.update(uri=uri, db_name=db_name)
+
+
+def seed_generators(seed: int) -> None:
+    """
+    Seed both the Faker instance and the stdlib ``random`` module used by the generators.
+    """
+    get_faker().seed_instance(seed)
+    random.seed(seed)
+
+
+# Moment relative dates ("last 30 days", "next 30 days") are drawn against;
+# ``None`` follows the wall clock.
+_reference_time: Optional[datetime] = None
+
+# Days per unit in the Faker-style offsets used below ("-3y", "+30d"); 365.24 as in Faker.
+_OFFSET_DAYS = {"d": 1.0, "y": 365.24}
+
+
+def set_reference_time(now: Optional[datetime]) -> None:
+    """
+    Resolve relative dates against ``now`` instead of the wall clock; ``None`` restores it.
+
+    Seeders that must reproduce a run exactly (see ``python.checkpoint``) pin the
+    reference time so dates do not shift with the moment each batch is generated.
+    """
+    global _reference_time
+    _reference_time = now
+
+
+def reference_time() -> datetime:
+    """
+    Return the pinned reference time, or the current time when none is set.
+    """
+    return _reference_time if _reference_time is not None else datetime.now()
+
+
+def _at_offset(offset: str) -> datetime:
+    now = reference_time()
+    if offset == "now":
+        return now
+    return now + timedelta(days=int(offset[:-1]) * _OFFSET_DAYS[offset[-1]])
+
+
+def _date_time_between(fake, start: str, end: str = "now") -> datetime:
+    """
+    ``fake.date_time_between`` with its offsets taken from ``reference_time()``.
+    """
+    return fake.date_time_between(start_date=_at_offset(start), end_date=_at_offset(end))
+
+
+def _date_between(fake, start: str, end: str) -> date:
+    return fake.date_between_dates(date_start=_at_offset(start).date(), date_end=_at_offset(end).date())
 
 
 def _faker_attr(name: str, fallback: Callable[[], str]) -> str:
     """
     Call a Faker provider if it exists, otherwise fall back.
     """
-    provider = getattr(fake, name, None)
+    provider = getattr(get_faker(), name, None)
     if callable(provider):
         return provider()
     return fallback()
 
 
-def generate_users(n: int = 100) -> List[Dict[str, Any]]:
+def _field_provider(fake, field: str, name: str) -> Callable[[], Any]:
     """
-    Generate complex user documents containing profile, account, and metadata info.
+    Provider callable for one document field such as ``logs.metadata.userAgent``.
+
+    A ``value_pools.PooledFaker`` may serve the field from its own pool; any
+    other Faker just returns its ``name`` provider.
+    """
+    field_provider = getattr(fake, "field_provider", None)
+    if field_provider is not None:
+        return field_provider(field, name)
+    return getattr(fake, name)
+
+
+def iter_users(n: int = 100, start: int = 0, total: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield complex user documents containing profile, account, and metadata info.
+
+    In runs of more than ``PLAIN_USER_KEYS_LIMIT`` users, ``username`` and
+    ``email`` end in ``.<row>`` so the unique indexes on them hold at any scale.
 
     Parameters
     ----------
     n : int, optional
         Number of user records to create.
+    start : int, optional
+        Row number of the first user, for generators that split a run into chunks.
+    total : int, optional
+        Users in the whole run when this call yields one chunk of it; defaults
+        to ``start + n``.
 
-    Returns
-    -------
-    list[dict]
-        List of Mongo-style user documents ready for insertion.
+    Yields
+    ------
+    dict
+        Mongo-style user document ready for insertion.
     """
-    users = []
-
-    for _ in range(n):
-        birth_date = fake.date_of_birth(minimum_age=18, maximum_age=79)
+    fake = get_faker()
+    new_id = _field_provider(fake, "users._id", "uuid4")
+    avatar = _field_provider(fake, "users.profile.avatar", "image_url")
+    ip_address = _field_provider(fake, "users.metadata.ipAddress", "ipv4")
+    user_agent = _field_provider(fake, "users.metadata.userAgent", "user_agent")
+    unique_keys = (start + n if total is None else total) > PLAIN_USER_KEYS_LIMIT
+    for row in range(start, start + n):
+        birth_date = _date_between(fake, "-80y", "-18y")
         birth_datetime = datetime.combine(birth_date, datetime.min.time())
         user = {
-            "_id": fake.uuid4(),
+            "_id": new_id(),
             "username": fake.user_name(),
             "email": fake.email(),
             "profile": {
                 "firstName": fake.first_name(),
                 "lastName": fake.last_name(),
                 "fullName": fake.name(),
-                "avatar": fake.image_url(),
+                "avatar": avatar(),
                 "bio": fake.text(max_nb_chars=200),
                 "birthDate": birth_datetime,
                 "gender": fake.random_element(["M", "F", "Other", None]),
@@ -72,8 +246,8 @@ def generate_users(n: int = 100) -> List[Dict[str, Any]]:
             "account": {
                 "type": fake.random_element(["free", "premium", "enterprise"]),
                 "status": fake.random_element(["active", "inactive", "suspended"]),
-                "createdAt": fake.date_time_between(start_date="-3y", end_date="now"),
-                "lastLogin": fake.date_time_between(start_date="-30d", end_date="now"),
+                "createdAt": _date_time_between(fake, "-3y"),
+                "lastLogin": _date_time_between(fake, "-30d"),
                 "loginCount": fake.random_int(min=0, max=1000),
                 "preferences": {
                     "newsletter": fake.boolean(chance_of_getting_true=70),
@@ -85,26 +259,45 @@ def generate_users(n: int = 100) -> List[Dict[str, Any]]:
             "tags": fake.words(nb=random.randint(2, 6)),
             "metadata": {
                 "source": fake.random_element(["web", "mobile", "api"]),
-                "ipAddress": fake.ipv4(),
-                "userAgent": fake.user_agent(),
+                "ipAddress": ip_address(),
+                "userAgent": user_agent(),
             },
         }
-        users.append(user)
+        if unique_keys:
+            user["username"] = f"{user['username']}.{row}"
+            user["email"] = user["email"].replace("@", f".{row}@", 1)
+        yield user
 
-    return users
 
+def generate_users(n: int = 100) -> List[Dict[str, Any]]:
+    """
+    Generate complex user documents containing profile, account, and metadata info.
 
-def generate_products(n: int = 500) -> List[Dict[str, Any]]:
+    Parameters
+    ----------
+    n : int, optional
+        Number of user records to create.
+
+    Returns
+    -------
+    list[dict]
+        List of Mongo-style user documents ready for insertion.
     """
-    Generate product documents with nested pricing, inventory, and attribute fields.
+    return list(iter_users(n))
+
+
+def iter_products(n: int = 500) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield product documents with nested pricing, inventory, and attribute fields.
 
     Parameters
     ----------
     n : int, optional
         Number of products to emit.
     """
-    products = []
+    fake = get_faker()
     categories = ["Electronics", "Books", "Clothing", "Home & Garden", "Sports", "Toys"]
+    image_url = _field_provider(fake, "products.images", "image_url")
 
     for _ in range(n):
         category = fake.random_element(categories)
@@ -146,34 +339,250 @@ def generate_products(n: int = 500) -> List[Dict[str, Any]]:
                 "average": round(fake.random.uniform(1, 5), 1),
                 "count": fake.random_int(min=0, max=5000),
             },
-            "images": [fake.image_url() for _ in range(fake.random_int(1, 5))],
+            "images": [image_url() for _ in range(fake.random_int(1, 5))],
             "tags": fake.words(nb=random.randint(3, 8)),
-            "createdAt": fake.date_time_between(start_date="-2y", end_date="now"),
-            "updatedAt": fake.date_time_between(start_date="-30d", end_date="now"),
+            "createdAt": _date_time_between(fake, "-2y"),
+            "updatedAt": _date_time_between(fake, "-30d"),
         }
         if not product["inventory"]["inStock"]:
             product["inventory"]["quantity"] = 0
-        products.append(product)
+        yield product
 
-    return products
 
+def generate_products(n: int = 500) -> List[Dict[str, Any]]:
+    """
+    Generate product documents with nested pricing, inventory, and attribute fields.
 
-def generate_transactions(
-    users: List[Dict], products: List[Dict], n: int = 1000
-) -> List[Dict[str, Any]]:
+    Parameters
+    ----------
+    n : int, optional
+        Number of products to emit.
     """
-    Generate transactional orders that reference previously created users/products.
+    return list(iter_products(n))
+
+
+# Compact reference tables. ``iter_transactions`` only reads each user's ``_id``
+# and each product's ``sku``/``name``/``price.amount`` (``iter_logs`` only the
+# user ``_id``), so the streaming seeders copy just those keys into these tables
+# as batches go by and let the full documents be freed after insertion. Both
+# behave as read-only sequences of small stub dicts, and ``picker`` draws in
+# O(1) while consuming the RNG exactly like ``Faker.random_element`` on a list
+# (which copies the whole sequence into a tuple on every call).
+_UUID_BYTES = 16
+_UUID_TEXT_LENGTH = 36
+
+
+def _pack_uuid(value: Any) -> Optional[bytes]:
+    """
+    Return the 16 raw bytes of a canonical lowercase UUID string, else ``None``.
+    """
+    if type(value) is not str or len(value) != _UUID_TEXT_LENGTH:
+        return None
+    try:
+        parsed = uuid.UUID(value)
+    except ValueError:
+        return None
+    return parsed.bytes if str(parsed) == value else None
+
+
+class UserTable(SequenceABC):
+    """
+    Sequence of user ``_id`` values, packed as raw UUID bytes when possible.
+
+    Canonical UUID strings take 16 bytes each in a single ``bytearray``; the
+    first other id (e.g. an ObjectId read back from MongoDB) switches the
+    table to a plain list.
 
     Parameters
     ----------
-    users : list[dict]
-        User documents used to resolve userId references.
-    products : list[dict]
-        Product documents used to pull pricing/SKU details.
+    users : iterable of mapping, optional
+        Documents (or reference stubs) whose ``_id`` values seed the table.
+    """
+
+    __slots__ = ("_packed", "_ids")
+
+    def __init__(self, users: Iterable[Dict[str, Any]] = ()):
+        self._packed = bytearray()
+        self._ids: Optional[List[Any]] = None
+        self.extend(users)
+
+    def append_id(self, user_id: Any) -> None:
+        if self._ids is None:
+            packed = _pack_uuid(user_id)
+            if packed is not None:
+                self._packed += packed
+                return
+            # First non-UUID id: unpack what we have and keep a plain list from now on.
+            self._ids = [self.id_at(i) for i in range(len(self))]
+            self._packed = bytearray()
+        self._ids.append(user_id)
+
+    def extend(self, users: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append the ``_id`` of every document in ``users``.
+        """
+        for user in users:
+            self.append_id(user["_id"])
+
+    def id_at(self, index: int) -> Any:
+        if self._ids is not None:
+            return self._ids[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("user reference index out of range")
+        start = index * _UUID_BYTES
+        return str(uuid.UUID(bytes=bytes(self._packed[start : start + _UUID_BYTES])))
+
+    def ids(self) -> Iterator[Any]:
+        return (self.id_at(i) for i in range(len(self)))
+
+    def picker(self, rng) -> Callable[[], Any]:
+        """
+        Return a callable drawing a uniform ``_id`` with ``rng.randrange(len(self))``.
+        """
+        randrange = rng.randrange
+        size = len(self)
+        id_at = self.id_at
+        if self._ids is not None:
+            ids = self._ids
+            return lambda: ids[randrange(size)]
+        return lambda: id_at(randrange(size))
+
+    def __len__(self) -> int:
+        if self._ids is not None:
+            return len(self._ids)
+        return len(self._packed) // _UUID_BYTES
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {"_id": self.id_at(index)}
+
+    def __getstate__(self):
+        return self._packed, self._ids
+
+    def __setstate__(self, state):
+        self._packed, self._ids = state
+
+
+class ProductTable(SequenceABC):
+    """
+    Parallel arrays of product ``sku``, ``name`` and ``price.amount``.
+
+    Parameters
+    ----------
+    products : iterable of mapping, optional
+        Documents (or reference stubs) to copy the keys from.
+    """
+
+    __slots__ = ("skus", "names", "prices")
+
+    def __init__(self, products: Iterable[Dict[str, Any]] = ()):
+        self.skus: List[str] = []
+        self.names: List[str] = []
+        self.prices = array("d")
+        self.extend(products)
+
+    def extend(self, products: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append the reference keys of every document in ``products``.
+        """
+        for product in products:
+            self.skus.append(product["sku"])
+            self.names.append(product["name"])
+            self.prices.append(product["price"]["amount"])
+
+    def keys_at(self, index: int) -> Tuple[str, str, float]:
+        return self.skus[index], self.names[index], self.prices[index]
+
+    def picker(self, rng) -> Callable[[], Tuple[str, str, float]]:
+        """
+        Return a callable drawing uniform ``(sku, name, price)`` keys.
+        """
+        randrange = rng.randrange
+        size = len(self.skus)
+        skus, names, prices = self.skus, self.names, self.prices
+
+        def pick_product_keys():
+            index = randrange(size)
+            return skus[index], names[index], prices[index]
+
+        return pick_product_keys
+
+    def __len__(self) -> int:
+        return len(self.skus)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        sku, name, price = self.keys_at(index)
+        return {"sku": sku, "name": name, "price": {"amount": price}}
+
+    def __getstate__(self):
+        return self.skus, self.names, self.prices
+
+    def __setstate__(self, state):
+        self.skus, self.names, self.prices = state
+
+
+def _user_id_picker(fake, users: Sequence[Dict], user_sampler=None) -> Callable[[], Any]:
+    """
+    Return a zero-argument callable producing a referenced user ``_id``.
+    """
+    if user_sampler is not None:
+        return user_sampler.sample
+    if isinstance(users, UserTable):
+        return users.picker(fake.random)
+
+    def pick_user_id():
+        return fake.random_element(users)["_id"]
+
+    return pick_user_id
+
+
+def _product_keys_picker(fake, products: Sequence[Dict], product_sampler=None) -> Callable[[], tuple]:
+    """
+    Return a zero-argument callable producing ``(sku, name, price)`` for a referenced product.
+    """
+    if product_sampler is not None:
+        return product_sampler.sample
+    if isinstance(products, ProductTable):
+        return products.picker(fake.random)
+
+    def pick_product_keys():
+        product = fake.random_element(products)
+        return product["sku"], product["name"], product["price"]["amount"]
+
+    return pick_product_keys
+
+
+def iter_transactions(
+    users: Sequence[Dict],
+    products: Sequence[Dict],
+    n: int = 1000,
+    user_sampler=None,
+    product_sampler=None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield transactional orders that reference previously created users/products.
+
+    Parameters
+    ----------
+    users : sequence of dict
+        User documents or a ``UserTable`` used to resolve userId references.
+    products : sequence of dict
+        Product documents or a ``ProductTable`` used to pull pricing/SKU details.
     n : int, optional
         Number of transactions to produce.
+    user_sampler, product_sampler : sampling.KeySampler, optional
+        Precomputed key samplers (see ``python.sampling``) replacing the uniform
+        ``random_element`` lookups; ``users``/``products`` are ignored when given.
     """
-    transactions = []
+    fake = get_faker()
+    pick_user_id = _user_id_picker(fake, users, user_sampler)
+    pick_product_keys = _product_keys_picker(fake, products, product_sampler)
+    order_id = _field_provider(fake, "transactions.orderId", "uuid4")
 
     for _ in range(n):
         num_items = fake.random_int(min=1, max=5)
@@ -181,14 +590,13 @@ def generate_transactions(
         total = 0
 
         for _ in range(num_items):
-            product = fake.random_element(products)
+            sku, name, item_price = pick_product_keys()
             quantity = fake.random_int(min=1, max=3)
-            item_price = product["price"]["amount"]
             item_total = round(item_price * quantity, 2)
             items.append(
                 {
-                    "productSku": product["sku"],
-                    "productName": product["name"],
+                    "productSku": sku,
+                    "productName": name,
                     "quantity": quantity,
                     "unitPrice": item_price,
                     "total": item_total,
@@ -197,8 +605,8 @@ def generate_transactions(
             total += item_total
 
         transaction = {
-            "orderId": fake.uuid4(),
-            "userId": fake.random_element(users)["_id"],
+            "orderId": order_id(),
+            "userId": pick_user_id(),
             "status": fake.random_element(
                 ["pending", "processing", "shipped", "delivered", "cancelled"]
             ),
@@ -222,7 +630,7 @@ def generate_transactions(
                 if fake.boolean(chance_of_getting_true=70)
                 else None,
                 "estimatedDelivery": datetime.combine(
-                    fake.future_date(end_date="+30d"), datetime.min.time()
+                    _date_between(fake, "+1d", "+30d"), datetime.min.time()
                 ),
             },
             "totals": {
@@ -232,8 +640,8 @@ def generate_transactions(
                 "total": 0,  # Placeholder, set below
             },
             "timestamps": {
-                "created": fake.date_time_between(start_date="-1y", end_date="now"),
-                "updated": fake.date_time_between(start_date="-30d", end_date="now"),
+                "created": _date_time_between(fake, "-1y"),
+                "updated": _date_time_between(fake, "-30d"),
             },
         }
         transaction["shipping"]["cost"] = round(fake.random.uniform(0, 20), 2)
@@ -250,44 +658,88 @@ def generate_transactions(
             and transaction["status"] == "shipped"
         ):
             transaction["status"] = fake.random_element(["processing", "cancelled"])
-        transactions.append(transaction)
-
-    return transactions
+        yield transaction
 
 
-def generate_logs(users: List[Dict], n: int = 5000) -> List[Dict[str, Any]]:
+def generate_transactions(
+    users: List[Dict], products: List[Dict], n: int = 1000, **samplers
+) -> List[Dict[str, Any]]:
     """
-    Generate application log entries for auth, API, and error events.
+    Generate transactional orders that reference previously created users/products.
 
     Parameters
     ----------
     users : list[dict]
-        Source user documents to associate optional userId values.
+        User documents used to resolve userId references.
+    products : list[dict]
+        Product documents used to pull pricing/SKU details.
+    n : int, optional
+        Number of transactions to produce.
+    **samplers
+        ``user_sampler`` / ``product_sampler`` forwarded to ``iter_transactions``.
+    """
+    return list(iter_transactions(users, products, n, **samplers))
+
+
+def iter_logs(
+    users: Sequence[Dict],
+    n: int = 5000,
+    user_sampler=None,
+    timestamps: Optional[Iterable[datetime]] = None,
+    start: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield application log entries for auth, API, and error events.
+
+    Parameters
+    ----------
+    users : sequence of dict
+        Source user documents or a ``UserTable`` to associate optional userId values.
     n : int, optional
         Number of log entries to create.
+    user_sampler : sampling.KeySampler, optional
+        Precomputed (optionally skewed) ``_id`` sampler replacing ``random_element(users)``.
+    timestamps : iterable of datetime, optional
+        Pre-computed timestamps (e.g. sorted arrivals from ``python.timeseries_logs``)
+        used instead of uniform draws over the last 7 days; must yield ``n`` values.
+    start : int, optional
+        Row number of the first entry, for generators that split a run into
+        chunks; the fixed level sequence only covers the run's first rows.
     """
+    fake = get_faker()
+    pick_user_id = _user_id_picker(fake, users, user_sampler)
+    if timestamps is None:
+
+        def next_timestamp():
+            return _date_time_between(fake, "-7d")
+
+    else:
+        next_timestamp = iter(timestamps).__next__
     level_cycle = ["INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL", "INFO"]
     weighted_levels = ["INFO", "INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL"]
     log_types = ["login", "logout", "page_view", "api_call", "error", "performance"]
+    session_id = _field_provider(fake, "logs.sessionId", "uuid4")
+    message = _field_provider(fake, "logs.message", "sentence")
+    ip = _field_provider(fake, "logs.metadata.ip", "ipv4")
+    user_agent = _field_provider(fake, "logs.metadata.userAgent", "user_agent")
 
-    logs = []
-    for idx in range(n):
-        if idx < len(level_cycle):
-            level = level_cycle[idx]
+    for row in range(start, start + n):
+        if row < len(level_cycle):
+            level = level_cycle[row]
         else:
             level = fake.random_element(weighted_levels)
         log = {
-            "timestamp": fake.date_time_between(start_date="-7d", end_date="now"),
+            "timestamp": next_timestamp(),
             "level": level,
             "type": fake.random_element(log_types),
-            "userId": fake.random_element(users)["_id"]
+            "userId": pick_user_id()
             if fake.boolean(chance_of_getting_true=80)
             else None,
-            "sessionId": fake.uuid4(),
-            "message": fake.sentence(),
+            "sessionId": session_id(),
+            "message": message(),
             "metadata": {
-                "ip": fake.ipv4(),
-                "userAgent": fake.user_agent(),
+                "ip": ip(),
+                "userAgent": user_agent(),
                 "endpoint": f"/api/{fake.word()}/{fake.word()}",
                 "method": fake.random_element(["GET", "POST", "PUT", "DELETE"]),
                 "statusCode": fake.random_element([200, 201, 400, 401, 403, 404, 500]),
@@ -302,22 +754,156 @@ def generate_logs(users: List[Dict], n: int = 5000) -> List[Dict[str, Any]]:
                 else None,
             },
         }
-        logs.append(log)
+        yield log
+
+
+def generate_logs(users: List[Dict], n: int = 5000, **samplers) -> List[Dict[str, Any]]:
+    """
+    Generate application log entries for auth, API, and error events.
+
+    Parameters
+    ----------
+    users : list[dict]
+        Source user documents to associate optional userId values.
+    n : int, optional
+        Number of log entries to create.
+    **samplers
+        ``user_sampler`` forwarded to ``iter_logs``.
+    """
+    return list(iter_logs(users, n, **samplers))
+
+
+# Index definitions per collection, shared by the eager and streaming seeders.
+INDEX_SPECS: Dict[str, List[tuple]] = {
+    "users": [
+        ([("email", ASCENDING)], {"unique": True}),
+        ([("username", ASCENDING)], {"unique": True}),
+        ([("profile.address.coordinates", "2dsphere")], {}),  # Geospatial index
+    ],
+    "products": [
+        ([("sku", ASCENDING)], {"unique": True}),
+        ([("category", ASCENDING)], {}),
+        ([("price.amount", ASCENDING)], {}),
+        ([("name", "text"), ("description", "text")], {}),  # Text search
+    ],
+    "transactions": [
+        ([("orderId", ASCENDING)], {"unique": True}),
+        ([("userId", ASCENDING)], {}),
+        ([("timestamps.created", DESCENDING)], {}),
+    ],
+    "logs": [
+        ([("timestamp", DESCENDING)], {}),
+        ([("userId", ASCENDING)], {}),
+        ([("level", ASCENDING)], {}),
+        # TTL index - automatically delete logs older than 30 days
+        ([("timestamp", ASCENDING)], {"expireAfterSeconds": 30 * 24 * 60 * 60}),
+    ],
+}
 
-    return logs
+DEFAULT_BATCH_SIZE = 1000
 
 
-def insert_data_to_mongodb():
+def _create_collection_indexes(collection, name: str) -> None:
+    """
+    Create every index listed in ``INDEX_SPECS`` for the given collection.
+    """
+    for keys, options in INDEX_SPECS[name]:
+        collection.create_index(keys, **options)
+
+
+def _build_collection_indexes(name: str, index_batch_size: int) -> List[Dict[str, Any]]:
+    """
+    Issue ``create_indexes`` for one collection in batches and time each batch.
+    """
+    from pymongo import IndexModel
+
+    collection = get_db()[name]
+    models = [IndexModel(keys, **options) for keys, options in INDEX_SPECS[name]]
+    timings = []
+    for start in range(0, len(models), index_batch_size):
+        began = time.perf_counter()
+        created = collection.create_indexes(models[start : start + index_batch_size])
+        timings.append(
+            {"collection": name, "indexes": list(created), "seconds": time.perf_counter() - began}
+        )
+    return timings
+
+
+def build_indexes(
+    collections: Optional[Iterable[str]] = None,
+    index_batch_size: Optional[int] = None,
+    max_workers: int = 4,
+) -> List[Dict[str, Any]]:
+    """
+    Build the ``INDEX_SPECS`` indexes after loading, one collection per thread.
+
+    Parameters
+    ----------
+    collections : iterable of str, optional
+        Collections to index; defaults to every collection in ``INDEX_SPECS``.
+    index_batch_size : int, optional
+        Indexes per ``create_indexes`` call. The default sends a collection's
+        whole set in one command so the server scans the data once; ``1``
+        builds them one by one and gives a timing per index.
+    max_workers : int, optional
+        Number of collections indexed concurrently.
+
+    Returns
+    -------
+    list[dict]
+        One ``{"collection", "indexes", "seconds"}`` entry per ``create_indexes`` call.
+    """
+    names = list(collections or INDEX_SPECS)
+    if index_batch_size is None:
+        index_batch_size = max(len(INDEX_SPECS[name]) for name in names)
+    if index_batch_size < 1:
+        raise ValueError("index_batch_size must be >= 1")
+
+    print("\n🗂️  Building indexes...")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+        results = list(pool.map(lambda name: _build_collection_indexes(name, index_batch_size), names))
+
+    timings = [timing for result in results for timing in result]
+    for timing in timings:
+        print(f"  - {timing['collection']}: {', '.join(timing['indexes'])} ({timing['seconds']:.2f}s)")
+    return timings
+
+
+def _print_db_stats() -> None:
+    """
+    Print a short dbstats summary for the target database.
+    """
+    print("\n📈 Database statistics:")
+    stats = get_db().command("dbstats")
+    print(f"  - Database: {stats['db']}")
+    print(f"  - Collections: {stats['collections']}")
+    print(f"  - Data Size: {stats['dataSize'] / 1024 / 1024:.2f} MB")
+
+
+def insert_data_to_mongodb(
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    defer_indexes: bool = False,
+):
     """
     Regenerate every dataset, drop existing collections, insert data, and recreate indexes.
+
+    Parameters
+    ----------
+    n_users, n_products, n_transactions, n_logs : int, optional
+        Number of documents to generate per collection.
+    defer_indexes : bool, optional
+        Load every collection first, then create all indexes with ``build_indexes``.
     """
     print("🔄 Generating fake data...")
 
     # Generate data
-    users = generate_users(100)
-    products = generate_products(500)
-    transactions = generate_transactions(users, products, 1000)
-    logs = generate_logs(users, 5000)
+    users = generate_users(n_users)
+    products = generate_products(n_products)
+    transactions = generate_transactions(users, products, n_transactions)
+    logs = generate_logs(users, n_logs)
 
     print("📊 Data generated:")
     print(f"  - Users: {len(users)}")
@@ -327,57 +913,126 @@ def insert_data_to_mongodb():
 
     # Insert into MongoDB
     print("\n💾 Inserting into MongoDB...")
+    db = get_db()
+
+    for name, documents in (
+        ("users", users),
+        ("products", products),
+        ("transactions", transactions),
+        ("logs", logs),
+    ):
+        collection = db[name]
+        collection.drop()  # Clean existing data
+        collection.insert_many(documents)
+        if not defer_indexes:
+            _create_collection_indexes(collection, name)
+        print(f"✅ {name.capitalize()} inserted")
+
+    if defer_indexes:
+        build_indexes()
+    _print_db_stats()
+
+
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most ``size`` items without materialising it.
+    """
+    if size < 1:
+        raise ValueError("batch size must be >= 1")
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
 
-    # Users collection
-    users_collection = db["users"]
-    users_collection.drop()  # Clean existing data
-    users_collection.insert_many(users)
-    users_collection.create_index([("email", ASCENDING)], unique=True)
-    users_collection.create_index([("username", ASCENDING)], unique=True)
-    users_collection.create_index(
-        [("profile.address.coordinates", "2dsphere")]
-    )  # Geospatial index
-    print("✅ Users inserted")
-
-    # Products collection
-    products_collection = db["products"]
-    products_collection.drop()
-    products_collection.insert_many(products)
-    products_collection.create_index([("sku", ASCENDING)], unique=True)
-    products_collection.create_index([("category", ASCENDING)])
-    products_collection.create_index([("price.amount", ASCENDING)])
-    products_collection.create_index(
-        [("name", "text"), ("description", "text")]
-    )  # Text search
-    print("✅ Products inserted")
-
-    # Transactions collection
-    transactions_collection = db["transactions"]
-    transactions_collection.drop()
-    transactions_collection.insert_many(transactions)
-    transactions_collection.create_index([("orderId", ASCENDING)], unique=True)
-    transactions_collection.create_index([("userId", ASCENDING)])
-    transactions_collection.create_index([("timestamps.created", DESCENDING)])
-    print("✅ Transactions inserted")
-
-    # Logs collection with TTL
-    logs_collection = db["logs"]
-    logs_collection.drop()
-    logs_collection.insert_many(logs)
-    logs_collection.create_index([("timestamp", DESCENDING)])
-    logs_collection.create_index([("userId", ASCENDING)])
-    logs_collection.create_index([("level", ASCENDING)])
-    # TTL index - automatically delete logs older than 30 days
-    logs_collection.create_index(
-        [("timestamp", ASCENDING)], expireAfterSeconds=30 * 24 * 60 * 60
+def _stream_into_collection(
+    name: str,
+    documents: Iterable[Dict[str, Any]],
+    batch_size: int,
+    keep: Optional[Any] = None,
+    create_indexes: bool = True,
+) -> Any:
+    """
+    Drop ``name``, insert ``documents`` in bounded batches, then build its indexes.
+
+    Parameters
+    ----------
+    name : str
+        Target collection name.
+    documents : iterable of dict
+        Lazily produced documents; never materialised beyond one batch.
+    batch_size : int
+        Maximum number of documents held in memory per ``insert_many`` call.
+    keep : UserTable or ProductTable, optional
+        Reference table that receives the keys of every batch before it is
+        inserted, so dependent collections can reference the documents after
+        they have been freed.
+    create_indexes : bool, optional
+        Build the collection's indexes right after loading; pass ``False`` when
+        indexes are deferred to ``build_indexes``.
+
+    Returns
+    -------
+    UserTable, ProductTable or list
+        ``keep`` once filled (an empty list when it is not given).
+    """
+    collection = get_db()[name]
+    collection.drop()
+    inserted = 0
+    for batch in _batched(documents, batch_size):
+        if keep is not None:
+            keep.extend(batch)
+        collection.insert_many(batch)
+        inserted += len(batch)
+    if create_indexes:
+        _create_collection_indexes(collection, name)
+    print(f"✅ {name.capitalize()} inserted ({inserted})")
+    return keep if keep is not None else []
+
+
+def insert_data_streaming(
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    defer_indexes: bool = False,
+):
+    """
+    Seed every collection from lazy generators in bounded batches.
+
+    Only one batch of full documents is alive at any time; users and products
+    are reduced to the reference fields needed by transactions and logs, so peak
+    memory is independent of ``n_transactions`` and ``n_logs``.
+
+    Parameters
+    ----------
+    n_users, n_products, n_transactions, n_logs : int, optional
+        Number of documents to generate per collection.
+    batch_size : int, optional
+        Documents per ``insert_many`` call.
+    defer_indexes : bool, optional
+        Create all indexes concurrently once every collection is loaded.
+    """
+    print(f"🔄 Streaming fake data into MongoDB (batch size {batch_size})...")
+    build_now = not defer_indexes
+
+    users = _stream_into_collection(
+        "users", iter_users(n_users), batch_size, keep=UserTable(), create_indexes=build_now
+    )
+    products = _stream_into_collection(
+        "products", iter_products(n_products), batch_size, keep=ProductTable(), create_indexes=build_now
     )
-    print("✅ Logs inserted")
+    _stream_into_collection(
+        "transactions", iter_transactions(users, products, n_transactions), batch_size, create_indexes=build_now
+    )
+    _stream_into_collection("logs", iter_logs(users, n_logs), batch_size, create_indexes=build_now)
 
-    print("\n📈 Database statistics:")
-    stats = db.command("dbstats")
-    print(f"  - Database: {stats['db']}")
-    print(f"  - Collections: {stats['collections']}")
-    print(f"  - Data Size: {stats['dataSize'] / 1024 / 1024:.2f} MB")
+    if defer_indexes:
+        build_indexes()
+    _print_db_stats()
 
 
 def query_examples():
@@ -385,6 +1040,7 @@ def query_examples():
     Run several read/report examples so students can validate the dataset interactively.
     """
     print("\n🔍 Example Queries:")
+    db = get_db()
 
     # Example 1: Find premium users from Porto
     result = db.users.find(
@@ -449,4 +1105,4 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"\n❌ Error: {e}")
     finally:
-        client.close()
+        close_client()
@@ -0,0 +1,394 @@
+"""Continuous mixed read/write load generator built on the faker document shapes.
+
+Drives sustained traffic against a database seeded by ``generate_fake_data``:
+inserts of new transactions and logs, updates of ``account.lastLogin`` and
+``inventory.quantity``, and the reads from ``query_examples``. Operations are
+drawn from a weighted mix, paced to a global target rate across a pool of
+worker threads, and reported per operation type as throughput and
+p50/p95/p99 latency. Under a target rate, latency is measured from each
+operation's scheduled start slot, so time spent queued behind a slow server
+counts against it (no coordinated omission).
+
+Examples
+--------
+::
+
+    python -m python.load_generator --rate 500 --concurrency 8 --duration 60
+    python -m python.load_generator --mix insert_log=5,read_top_rated=1 --skew 1.1
+"""
+
+import argparse
+import math
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from python import generate_fake_data as fake_data
+from python import sampling
+
+DEFAULT_MIX: Dict[str, float] = {
+    "insert_transaction": 2,
+    "insert_log": 4,
+    "update_last_login": 2,
+    "update_inventory": 1,
+    "read_premium_porto": 1,
+    "read_top_rated": 1,
+    "read_user_orders": 2,
+    "count_errors": 0.5,
+}
+REFERENCE_LIMIT = 100_000
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram (~1% precision) with bounded memory.
+    """
+
+    GROWTH = 1.01
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self._log_growth = math.log(self.GROWTH)
+
+    def record(self, seconds: float) -> None:
+        micros = max(seconds * 1e6, 1.0)
+        bucket = int(math.log(micros) / self._log_growth)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.total += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.total += other.total
+
+    def percentile(self, pct: float) -> float:
+        """
+        Latency in seconds at percentile ``pct`` (0-100), nearest-rank.
+        """
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.total))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return self.GROWTH ** (bucket + 0.5) / 1e6
+        return self.GROWTH ** (max(self.counts) + 0.5) / 1e6
+
+
+class LoadContext:
+    """
+    Shared references and per-thread document generators for the operations.
+    """
+
+    def __init__(self, db, skew: Optional[float] = None, seed: Optional[int] = None):
+        self.db = db
+        users = list(db["users"].find({}, {"_id": 1}).limit(REFERENCE_LIMIT))
+        products = list(db["products"].find({}, {"sku": 1, "name": 1, "price.amount": 1}).limit(REFERENCE_LIMIT))
+        if not users or not products:
+            raise RuntimeError("users/products are empty; seed the database first")
+        self.user_ids = sampling.user_sampler(users, zipf=skew, seed=seed)
+        self.products = sampling.product_sampler(products, zipf=skew, seed=seed)
+        self._local = threading.local()
+
+    def _generator(self, name: str, factory: Callable[[], Any]):
+        generator = getattr(self._local, name, None)
+        if generator is None:
+            generator = factory()
+            setattr(self._local, name, generator)
+        return generator
+
+    def next_transaction(self) -> Dict[str, Any]:
+        return next(
+            self._generator(
+                "transactions",
+                lambda: fake_data.iter_transactions(
+                    [], [], sys.maxsize, user_sampler=self.user_ids, product_sampler=self.products
+                ),
+            )
+        )
+
+    def next_log(self) -> Dict[str, Any]:
+        return next(self._generator("logs", lambda: fake_data.iter_logs([], sys.maxsize, user_sampler=self.user_ids)))
+
+
+def _insert_transaction(ctx: LoadContext, rng: random.Random) -> None:
+    ctx.db["transactions"].insert_one(ctx.next_transaction())
+
+
+def _insert_log(ctx: LoadContext, rng: random.Random) -> None:
+    ctx.db["logs"].insert_one(ctx.next_log())
+
+
+def _update_last_login(ctx: LoadContext, rng: random.Random) -> None:
+    ctx.db["users"].update_one(
+        {"_id": ctx.user_ids.sample()},
+        {"$set": {"account.lastLogin": datetime.now()}, "$inc": {"account.loginCount": 1}},
+    )
+
+
+def _update_inventory(ctx: LoadContext, rng: random.Random) -> None:
+    sku = ctx.products.sample()[0]
+    ctx.db["products"].update_one({"sku": sku}, {"$set": {"inventory.quantity": rng.randint(0, 1000)}})
+
+
+def _read_premium_porto(ctx: LoadContext, rng: random.Random) -> None:
+    list(ctx.db["users"].find({"account.type": "premium", "profile.address.city": "Porto"}).limit(5))
+
+
+def _read_top_rated(ctx: LoadContext, rng: random.Random) -> None:
+    list(ctx.db["products"].find({"ratings.average": {"$gte": 4.5}}).limit(5))
+
+
+def _read_user_orders(ctx: LoadContext, rng: random.Random) -> None:
+    list(ctx.db["transactions"].find({"userId": ctx.user_ids.sample()}).limit(20))
+
+
+def _count_errors(ctx: LoadContext, rng: random.Random) -> None:
+    ctx.db["logs"].count_documents({"level": "ERROR"})
+
+
+OPERATIONS: Dict[str, Callable[[LoadContext, random.Random], None]] = {
+    "insert_transaction": _insert_transaction,
+    "insert_log": _insert_log,
+    "update_last_login": _update_last_login,
+    "update_inventory": _update_inventory,
+    "read_premium_porto": _read_premium_porto,
+    "read_top_rated": _read_top_rated,
+    "read_user_orders": _read_user_orders,
+    "count_errors": _count_errors,
+}
+
+
+class _Pacer:
+    """
+    Hands out evenly spaced start slots across threads for a global target rate.
+    """
+
+    def __init__(self, rate: Optional[float], clock: Callable[[], float], sleep: Callable[[float], None]):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self.started = clock()
+        self._issued = 0
+        self._lock = threading.Lock()
+
+    def wait_turn(self, deadline: Optional[float] = None) -> Optional[float]:
+        """
+        Sleep until the caller's slot and return its scheduled start time.
+
+        Returns ``None`` once slots reach ``deadline``; unthrottled callers start now.
+        """
+        if not self.interval:
+            return self.clock()
+        with self._lock:
+            slot = self.started + self._issued * self.interval
+            self._issued += 1
+        if deadline is not None and slot >= deadline:
+            return None
+        delay = slot - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+        return slot
+
+
+def _weighted_operations(mix: Dict[str, float]) -> List[str]:
+    """
+    Validate ``mix`` and return the operations it can draw, in mix order.
+    """
+    unknown = set(mix) - set(OPERATIONS)
+    if unknown:
+        raise ValueError(f"unknown operations: {', '.join(sorted(unknown))}")
+    negative = sorted(name for name, weight in mix.items() if weight < 0)
+    if negative:
+        raise ValueError(f"operation weights must be non-negative: {', '.join(negative)}")
+    names = [name for name, weight in mix.items() if weight > 0]
+    if not names:
+        raise ValueError("the operation mix needs at least one positive weight")
+    return names
+
+
+def _run_threads(target: Callable[[int], None], concurrency: int) -> None:
+    """
+    Run ``target(index)`` on ``concurrency`` threads and re-raise the first failure.
+    """
+    failures: List[BaseException] = []
+
+    def guarded(index: int) -> None:
+        try:
+            target(index)
+        except BaseException as exc:
+            failures.append(exc)
+
+    threads = [threading.Thread(target=guarded, args=(i,), name=f"load-{i}") for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if failures:
+        raise failures[0]
+
+
+def _build_report(names: List[str], results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Dict[str, float]]:
+    report: Dict[str, Dict[str, float]] = {}
+    for name in names:
+        histogram = LatencyHistogram()
+        errors = 0
+        for result in results:
+            histogram.merge(result["histograms"][name])
+            errors += result["errors"][name]
+        report[name] = {
+            "count": histogram.total,
+            "errors": errors,
+            "ops_per_sec": histogram.total / elapsed,
+            "p50_ms": histogram.percentile(50) * 1000,
+            "p95_ms": histogram.percentile(95) * 1000,
+            "p99_ms": histogram.percentile(99) * 1000,
+        }
+    return report
+
+
+def run_load(
+    mix: Optional[Dict[str, float]] = None,
+    rate: Optional[float] = None,
+    concurrency: int = 4,
+    duration: Optional[float] = 30.0,
+    max_ops: Optional[int] = None,
+    skew: Optional[float] = None,
+    seed: Optional[int] = None,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run a mixed workload and return per-operation statistics.
+
+    Parameters
+    ----------
+    mix : dict, optional
+        Operation name -> relative weight; defaults to ``DEFAULT_MIX``.
+    rate : float, optional
+        Target operations/second across all threads; unthrottled when omitted.
+    concurrency : int, optional
+        Worker threads sharing the client's connection pool.
+    duration : float, optional
+        Seconds to run.
+    max_ops : int, optional
+        Stop after this many operations (whichever limit comes first).
+    skew : float, optional
+        Zipf exponent for user/product keys (hot users and products).
+    seed : int, optional
+        Seed for the operation mix and key sampling.
+    clock, sleep : callable, optional
+        Injectable time source and sleeper.
+
+    Returns
+    -------
+    dict
+        Operation name -> ``count``, ``errors``, ``ops_per_sec``, ``p50_ms``, ``p95_ms``, ``p99_ms``.
+    """
+    mix = dict(mix or DEFAULT_MIX)
+    names = _weighted_operations(mix)
+    if duration is None and max_ops is None:
+        raise ValueError("pass duration and/or max_ops")
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    ctx = LoadContext(fake_data.get_db(), skew=skew, seed=seed)
+    pacer = _Pacer(rate, clock, sleep)
+    deadline = pacer.started + duration if duration is not None else None
+    budget = {"remaining": max_ops if max_ops is not None else -1}
+    budget_lock = threading.Lock()
+    results: List[Dict[str, Any]] = []
+
+    def take_slot() -> Optional[float]:
+        """
+        Claim the next operation and wait for its start slot; ``None`` means stop.
+        """
+        if deadline is not None and clock() >= deadline:
+            return None
+        with budget_lock:
+            if budget["remaining"] == 0:
+                return None
+            budget["remaining"] -= 1
+        return pacer.wait_turn(deadline)
+
+    def worker(index: int) -> None:
+        rng = random.Random(None if seed is None else seed * 1_000 + index)
+        table = sampling.AliasSampler([mix[name] for name in names], rng)
+        histograms = {name: LatencyHistogram() for name in names}
+        errors = {name: 0 for name in names}
+        for scheduled in iter(take_slot, None):
+            name = names[table.sample()]
+            try:
+                OPERATIONS[name](ctx, rng)
+            except Exception:
+                errors[name] += 1
+                continue
+            histograms[name].record(clock() - scheduled)
+        results.append({"histograms": histograms, "errors": errors})
+
+    _run_threads(worker, concurrency)
+    return _build_report(names, results, max(clock() - pacer.started, 1e-9))
+
+
+def format_report(report: Dict[str, Dict[str, float]]) -> str:
+    header = f"{'operation':<20} {'count':>8} {'errors':>6} {'ops/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    lines = [header, "-" * len(header)]
+    for name, stats in report.items():
+        lines.append(
+            f"{name:<20} {stats['count']:>8} {stats['errors']:>6} {stats['ops_per_sec']:>9.1f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Parse ``name=weight,name=weight`` into a mix dict.
+    """
+    mix = {}
+    for part in filter(None, (item.strip() for item in text.split(","))):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m python.load_generator", description=__doc__.splitlines()[0])
+    parser.add_argument("--uri", default=fake_data.DEFAULT_MONGO_URI, help="MongoDB connection string")
+    parser.add_argument("--database", default=fake_data.DEFAULT_DB_NAME, help="target database name")
+    parser.add_argument("--rate", type=float, help="target operations/second (default: unthrottled)")
+    parser.add_argument("--concurrency", type=int, default=4, help="worker threads")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run")
+    parser.add_argument("--max-ops", type=int, help="stop after this many operations")
+    parser.add_argument("--mix", type=parse_mix, help="operation weights, e.g. insert_log=4,read_top_rated=1")
+    parser.add_argument("--skew", type=float, help="Zipf exponent for hot users/products")
+    parser.add_argument("--seed", type=int, help="seed for the operation mix")
+    args = parser.parse_args(argv)
+
+    fake_data.configure_database(args.uri, args.database)
+    try:
+        report = run_load(
+            mix=args.mix,
+            rate=args.rate,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            max_ops=args.max_ops,
+            skew=args.skew,
+            seed=args.seed,
+        )
+    except Exception as exc:
+        print(f"\n❌ Error: {exc}")
+        return 1
+    finally:
+        fake_data.close_client()
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""Process-pool generation for the faker datasets with deterministic per-chunk seeding.
+
+The requested document count is split into fixed-size chunks. Every chunk gets
+its own seed derived from a master seed, so the output depends only on
+``seed`` and ``chunk_size`` -- never on scheduling -- and a serial run
+(``workers=1``) reproduces a parallel run document for document.
+"""
+
+import hashlib
+import multiprocessing.util
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import bson
+from bson.raw_bson import RawBSONDocument
+from pymongo import MongoClient
+
+from python import generate_fake_data as fake_data
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Per-process state populated by ``_init_worker``.
+_worker_users: Sequence[Dict[str, Any]] = ()
+_worker_products: Sequence[Dict[str, Any]] = ()
+_worker_target: Optional[Tuple[str, str]] = None
+_worker_client = None
+
+
+def derive_chunk_seed(master_seed: int, kind: str, chunk_index: int) -> int:
+    """
+    Derive a stable 64-bit seed for one chunk of one collection.
+
+    Parameters
+    ----------
+    master_seed : int
+        Seed chosen for the whole run.
+    kind : str
+        Collection name, so users and logs chunks never share a stream.
+    chunk_index : int
+        Zero-based chunk position.
+    """
+    digest = hashlib.sha256(f"{master_seed}:{kind}:{chunk_index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def chunk_counts(n: int, chunk_size: int) -> List[int]:
+    """
+    Split ``n`` into chunk sizes of at most ``chunk_size``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    full, rest = divmod(n, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def _documents_for(
+    kind: str,
+    count: int,
+    users: Sequence[Dict],
+    products: Sequence[Dict],
+    start: int = 0,
+    total: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    if kind == "users":
+        return fake_data.iter_users(count, start, total)
+    if kind == "products":
+        return fake_data.iter_products(count)
+    if kind == "transactions":
+        return fake_data.iter_transactions(users, products, count)
+    if kind == "logs":
+        return fake_data.iter_logs(users, count, start=start)
+    raise ValueError(f"unknown collection kind: {kind!r}")
+
+
+def generate_chunk(
+    kind: str,
+    count: int,
+    seed: int,
+    users: Sequence[Dict] = (),
+    products: Sequence[Dict] = (),
+    encode: bool = False,
+    start: int = 0,
+    total: Optional[int] = None,
+) -> List[Any]:
+    """
+    Generate one chunk in-process after seeding the generators with ``seed``.
+
+    Parameters
+    ----------
+    kind : str
+        Collection name.
+    count : int
+        Documents in the chunk.
+    seed : int
+        Chunk seed, normally from ``derive_chunk_seed``.
+    users, products : sequence of dict, optional
+        Reference documents for ``transactions`` and ``logs``.
+    encode : bool, optional
+        Return BSON ``bytes`` instead of dicts.
+    start : int, optional
+        Position of the chunk's first document in the whole collection.
+    total : int, optional
+        Documents in the whole collection; defaults to ``start + count``.
+    """
+    fake_data.seed_generators(seed)
+    docs = _documents_for(kind, count, users, products, start, total)
+    if encode:
+        return [bson.encode(doc) for doc in docs]
+    return list(docs)
+
+
+def _close_worker_client() -> None:
+    global _worker_client
+    if _worker_client is not None:
+        _worker_client.close()
+        _worker_client = None
+
+
+def _init_worker(users: Sequence[Dict], products: Sequence[Dict], target: Optional[Tuple[str, str]]) -> None:
+    global _worker_users, _worker_products, _worker_target
+    _worker_users = users
+    _worker_products = products
+    _worker_target = target
+    if target is not None:
+        # Pool workers leave through os._exit, skipping atexit; multiprocessing
+        # still runs its own finalizers, so close the direct-insert client there.
+        multiprocessing.util.Finalize(None, _close_worker_client, exitpriority=10)
+
+
+def _worker_chunk(kind: str, count: int, seed: int, encode: bool = False, start: int = 0, total: Optional[int] = None):
+    """
+    Generate one chunk inside a worker; insert it directly when a target is configured.
+    """
+    global _worker_client
+    docs = generate_chunk(kind, count, seed, _worker_users, _worker_products, encode, start, total)
+    if _worker_target is None:
+        return docs
+    if _worker_client is None:
+        _worker_client = MongoClient(_worker_target[0])
+    if encode:
+        docs = [RawBSONDocument(raw) for raw in docs]
+    _worker_client[_worker_target[1]][kind].insert_many(docs, ordered=False)
+    return len(docs)
+
+
+def _run_chunks(
+    kind: str,
+    n: int,
+    seed: int,
+    workers: int,
+    chunk_size: int,
+    users: Sequence[Dict],
+    products: Sequence[Dict],
+    target: Optional[Tuple[str, str]] = None,
+    encode: bool = False,
+) -> Iterator[Any]:
+    counts = chunk_counts(n, chunk_size)
+    seeds = [derive_chunk_seed(seed, kind, idx) for idx in range(len(counts))]
+    starts = [idx * chunk_size for idx in range(len(counts))]
+
+    if workers <= 1 and target is None:
+        for count, chunk_seed, start in zip(counts, seeds, starts):
+            yield generate_chunk(kind, count, chunk_seed, users, products, encode, start, n)
+        return
+
+    # Bound the number of chunks in flight so results never pile up in the parent.
+    max_pending = max(1, workers) * 2
+    with ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        initializer=_init_worker,
+        initargs=(users, products, target),
+    ) as pool:
+        pending = deque()
+        for count, chunk_seed, start in zip(counts, seeds, starts):
+            pending.append(pool.submit(_worker_chunk, kind, count, chunk_seed, encode, start, n))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_parallel_batches(
+    kind: str,
+    n: int,
+    seed: int = 0,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    users: Sequence[Dict] = (),
+    products: Sequence[Dict] = (),
+    encode: bool = False,
+) -> Iterator[List[Any]]:
+    """
+    Yield generated documents chunk by chunk, in chunk order, from a process pool.
+
+    Parameters
+    ----------
+    kind : str
+        One of ``"users"``, ``"products"``, ``"transactions"`` or ``"logs"``.
+    n : int
+        Total number of documents.
+    seed : int, optional
+        Master seed; each chunk derives its own seed from it.
+    workers : int, optional
+        Worker processes; ``1`` runs in-process with identical output.
+    chunk_size : int, optional
+        Documents per chunk (and per yielded batch).
+    users, products : sequence of dict, optional
+        Reference documents for ``transactions`` and ``logs``.
+    encode : bool, optional
+        Return each document as BSON ``bytes`` encoded inside the worker.
+    """
+    return _run_chunks(kind, n, seed, workers, chunk_size, users, products, encode=encode)
+
+
+def generate_parallel(kind: str, n: int, **kwargs) -> List[Dict[str, Any]]:
+    """
+    Materialise ``iter_parallel_batches`` into a single list.
+    """
+    return list(chain.from_iterable(iter_parallel_batches(kind, n, **kwargs)))
+
+
+def insert_data_parallel(
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    seed: int = 0,
+    workers: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    direct_uri: Optional[str] = None,
+    defer_indexes: bool = False,
+):
+    """
+    Seed every collection using a process pool.
+
+    Users and products are streamed back to the parent so their reference
+    fields can be shared with the transaction/log workers. When ``direct_uri``
+    is given, transactions and logs are inserted by the workers themselves
+    instead of being sent back over the pipe.
+
+    Parameters
+    ----------
+    n_users, n_products, n_transactions, n_logs : int, optional
+        Number of documents to generate per collection.
+    seed : int, optional
+        Master seed for reproducible output.
+    workers : int, optional
+        Number of worker processes.
+    chunk_size : int, optional
+        Documents per chunk and per ``insert_many`` call.
+    direct_uri : str, optional
+        MongoDB URI the workers connect to for direct inserts.
+    defer_indexes : bool, optional
+        Create all indexes concurrently once every collection is loaded.
+    """
+    print(f"🔄 Generating fake data with {workers} workers (seed {seed})...")
+    db = fake_data.get_db()
+
+    def stream(kind, n, keep=None, users=(), products=()):
+        docs = chain.from_iterable(
+            iter_parallel_batches(kind, n, seed=seed, workers=workers, chunk_size=chunk_size, users=users, products=products)
+        )
+        return fake_data._stream_into_collection(kind, docs, chunk_size, keep=keep, create_indexes=not defer_indexes)
+
+    users = stream("users", n_users, keep=fake_data.UserTable())
+    products = stream("products", n_products, keep=fake_data.ProductTable())
+
+    for kind, n in (("transactions", n_transactions), ("logs", n_logs)):
+        if direct_uri is None:
+            stream(kind, n, users=users, products=products)
+            continue
+        collection = db[kind]
+        collection.drop()
+        inserted = sum(
+            _run_chunks(kind, n, seed, workers, chunk_size, users, products, target=(direct_uri, db.name))
+        )
+        if not defer_indexes:
+            fake_data._create_collection_indexes(collection, kind)
+        print(f"✅ {kind.capitalize()} inserted ({inserted})")
+
+    if defer_indexes:
+        fake_data.build_indexes()
+    fake_data._print_db_stats()
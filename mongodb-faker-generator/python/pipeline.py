@@ -0,0 +1,180 @@
+"""Pipelined seeder that overlaps generation with unordered bulk inserts.
+
+Collections are generated one after another on the calling thread: every
+generator draws from the shared Faker instance and ``random`` module, and only
+a fixed draw order keeps seeded runs reproducible. Finished batches are handed
+to a shared insert pool that writes them with ``insert_many(ordered=False)``
+over the single ``MongoClient`` connection pool, so generating one batch
+overlaps with inserting the previous ones. A semaphore caps the number of
+batches in flight, so the generator blocks (backpressure) instead of queueing
+unbounded work for a slow server.
+
+A collection's inserts are not waited for before the next collection is
+generated, so the loads of users and products overlap, and so do those of
+transactions and logs. Transactions and logs only need the reference tables,
+which are complete as soon as users and products are generated; a
+collection's inserts are waited for only before its indexes are built.
+"""
+
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, List
+
+from python import generate_fake_data as fake_data
+
+DEFAULT_INSERT_WORKERS = 4
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+class InsertPipeline:
+    """
+    Bounded pool of background ``insert_many`` calls shared by several collections.
+
+    Parameters
+    ----------
+    db : pymongo.database.Database
+        Target database; its client's connection pool is shared by all workers.
+    insert_workers : int, optional
+        Threads issuing inserts concurrently.
+    max_in_flight : int, optional
+        Maximum batches submitted but not yet inserted, across all collections.
+    """
+
+    def __init__(self, db, insert_workers: int = DEFAULT_INSERT_WORKERS, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        if insert_workers < 1 or max_in_flight < 1:
+            raise ValueError("insert_workers and max_in_flight must be >= 1")
+        self.db = db
+        self.inserted: Counter = Counter()
+        self._pool = ThreadPoolExecutor(max_workers=insert_workers, thread_name_prefix="seed-insert")
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "InsertPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def _insert(self, name: str, batch: List[Dict[str, Any]]) -> None:
+        try:
+            self.db[name].insert_many(batch, ordered=False)
+            with self._lock:
+                self.inserted[name] += len(batch)
+        finally:
+            self._slots.release()
+
+    def submit(self, name: str, batch: List[Dict[str, Any]]):
+        """
+        Queue one batch, blocking while ``max_in_flight`` batches are pending.
+        """
+        self._slots.acquire()
+        try:
+            return self._pool.submit(self._insert, name, batch)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def feed(
+        self,
+        name: str,
+        documents: Iterable[Dict[str, Any]],
+        batch_size: int,
+        keep=None,
+    ) -> Deque[Future]:
+        """
+        Generate ``documents`` on the calling thread and queue their inserts.
+
+        Returns the inserts still pending once generation is done; pass them to
+        ``settle`` before relying on the collection's contents. ``keep`` is
+        filled as batches are generated, so it is complete on return.
+        """
+        pending: Deque[Future] = deque()
+        for batch in fake_data._batched(documents, batch_size):
+            if keep is not None:
+                keep.extend(batch)
+            pending.append(self.submit(name, batch))
+            while pending and pending[0].done():
+                pending.popleft().result()
+        return pending
+
+    @staticmethod
+    def settle(pending: Iterable[Future]) -> None:
+        """
+        Wait for queued inserts, re-raising the first insert error.
+        """
+        for future in pending:
+            future.result()
+
+    def load(
+        self,
+        name: str,
+        documents: Iterable[Dict[str, Any]],
+        batch_size: int,
+        keep=None,
+    ):
+        """
+        ``feed`` then ``settle`` one collection.
+
+        Returns the filled ``keep`` reference table, like ``_stream_into_collection``; any
+        insert error is re-raised once the collection's batches have settled.
+        """
+        self.settle(self.feed(name, documents, batch_size, keep))
+        return keep if keep is not None else []
+
+
+def insert_data_pipelined(
+    n_users: int = 100,
+    n_products: int = 500,
+    n_transactions: int = 1000,
+    n_logs: int = 5000,
+    batch_size: int = fake_data.DEFAULT_BATCH_SIZE,
+    insert_workers: int = DEFAULT_INSERT_WORKERS,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    defer_indexes: bool = False,
+):
+    """
+    Seed every collection with generation and insertion overlapped.
+
+    Parameters
+    ----------
+    n_users, n_products, n_transactions, n_logs : int, optional
+        Number of documents to generate per collection.
+    batch_size : int, optional
+        Documents per ``insert_many`` call.
+    insert_workers : int, optional
+        Threads issuing inserts.
+    max_in_flight : int, optional
+        Batches allowed in flight before generators block.
+    defer_indexes : bool, optional
+        Create all indexes concurrently once every collection is loaded.
+    """
+    print(f"🔄 Pipelined seeding ({insert_workers} insert workers, {max_in_flight} batches in flight)...")
+    db = fake_data.get_db()
+    for name in fake_data.INDEX_SPECS:
+        db[name].drop()
+
+    with InsertPipeline(db, insert_workers, max_in_flight) as pipeline:
+        users, products = fake_data.UserTable(), fake_data.ProductTable()
+        pending = {
+            "users": pipeline.feed("users", fake_data.iter_users(n_users), batch_size, users),
+            "products": pipeline.feed("products", fake_data.iter_products(n_products), batch_size, products),
+        }
+        # The reference tables are complete here, while users/products inserts may still run.
+        pending["transactions"] = pipeline.feed(
+            "transactions", fake_data.iter_transactions(users, products, n_transactions), batch_size
+        )
+        pending["logs"] = pipeline.feed("logs", fake_data.iter_logs(users, n_logs), batch_size)
+
+        for name, inserts in pending.items():
+            pipeline.settle(inserts)
+            if not defer_indexes:
+                fake_data._create_collection_indexes(db[name], name)
+            print(f"✅ {name.capitalize()} inserted ({pipeline.inserted[name]})")
+
+    if defer_indexes:
+        fake_data.build_indexes()
+    fake_data._print_db_stats()
@@ -0,0 +1,158 @@
+"""Named scale profiles for the faker seeder.
+
+A profile fixes per-collection counts (derived from a total and the lab
+ratios 100:500:1000:5000), the batch size, the worker count and the target
+URI/database. ``choose_strategy`` turns a profile into a seeding path: the
+original eager path while the whole dataset comfortably fits in memory,
+streaming or process-pool paths once it does not.
+"""
+
+import os
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional
+
+from python import generate_fake_data as fake_data
+
+COLLECTIONS = ("users", "products", "transactions", "logs")
+LAB_RATIOS: Dict[str, int] = {"users": 100, "products": 500, "transactions": 1000, "logs": 5000}
+
+# Measured (tracemalloc) footprint of one generated document held as a Python dict.
+DOC_MEMORY_BYTES: Dict[str, int] = {"users": 3_200, "products": 2_600, "transactions": 2_600, "logs": 1_300}
+
+# Approximate footprint of one entry in the compact UserTable / ProductTable that the
+# parallel path copies into every worker process.
+REFERENCE_MEMORY_BYTES: Dict[str, int] = {"users": 16, "products": 160}
+
+# Keep the eager path only while the dataset needs less than this share of the budget.
+EAGER_MEMORY_FRACTION = 0.25
+
+
+def counts_for_total(total: int, ratios: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """
+    Split ``total`` documents across the collections following ``ratios``.
+
+    Every collection gets at least one document so references always resolve.
+    """
+    ratios = ratios or LAB_RATIOS
+    weight = sum(ratios.values())
+    return {name: max(1, round(total * ratios[name] / weight)) for name in COLLECTIONS}
+
+
+@dataclass(frozen=True)
+class ScaleProfile:
+    """
+    Seeding configuration for one dataset size.
+
+    Attributes
+    ----------
+    name : str
+        Profile name used on the command line.
+    counts : dict
+        Documents per collection.
+    batch_size : int
+        Documents per batch/chunk and per ``insert_many`` call.
+    workers : int
+        Generation processes; ``1`` keeps everything in-process.
+    uri : str
+        MongoDB connection string.
+    database : str
+        Target database name.
+    """
+
+    name: str
+    counts: Dict[str, int]
+    batch_size: int = fake_data.DEFAULT_BATCH_SIZE
+    workers: int = 1
+    uri: str = fake_data.DEFAULT_MONGO_URI
+    database: str = fake_data.DEFAULT_DB_NAME
+    ratios: Dict[str, int] = field(default_factory=lambda: dict(LAB_RATIOS))
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def estimated_memory_bytes(self) -> int:
+        """
+        Memory needed to hold the whole dataset as Python dicts (the eager path).
+        """
+        return sum(DOC_MEMORY_BYTES[name] * count for name, count in self.counts.items())
+
+    def parallel_memory_bytes(self) -> int:
+        """
+        Memory needed for the reference tables held by the parent and every worker.
+        """
+        tables = sum(REFERENCE_MEMORY_BYTES[name] * self.counts[name] for name in REFERENCE_MEMORY_BYTES)
+        return tables * (self.workers + 1)
+
+    def with_overrides(self, **overrides) -> "ScaleProfile":
+        """
+        Copy the profile, dropping ``None`` overrides; ``total`` rescales all counts.
+        """
+        overrides = {key: value for key, value in overrides.items() if value is not None}
+        total = overrides.pop("total", None)
+        counts = dict(self.counts)
+        if total is not None:
+            counts = counts_for_total(total, self.ratios)
+        for name in COLLECTIONS:
+            if name in overrides:
+                counts[name] = overrides.pop(name)
+        return replace(self, counts=counts, **overrides)
+
+    def as_kwargs(self) -> Dict[str, int]:
+        """
+        Counts in the ``n_users=...`` form the seeders accept.
+        """
+        return {f"n_{name}": count for name, count in self.counts.items()}
+
+
+def _cpu_workers() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+PROFILES: Dict[str, ScaleProfile] = {
+    "tiny": ScaleProfile("tiny", counts_for_total(660), batch_size=100),
+    "lab": ScaleProfile("lab", dict(LAB_RATIOS), batch_size=1000),
+    "1M": ScaleProfile("1M", counts_for_total(1_000_000), batch_size=5_000, workers=_cpu_workers()),
+    "100M": ScaleProfile("100M", counts_for_total(100_000_000), batch_size=10_000, workers=_cpu_workers()),
+}
+
+
+def get_profile(name: str) -> ScaleProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"unknown profile {name!r}; choose from {', '.join(PROFILES)}") from None
+
+
+def available_memory_bytes() -> Optional[int]:
+    """
+    Physical memory of the machine, or ``None`` when the platform does not expose it.
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def choose_strategy(profile: ScaleProfile, memory_budget: Optional[int] = None) -> str:
+    """
+    Pick ``"eager"``, ``"streaming"`` or ``"parallel"`` for a profile.
+
+    ``"parallel"`` needs more than one worker and room for a copy of the
+    reference tables per worker; otherwise the eager path is kept while the
+    dataset fits and streaming takes over once it does not.
+
+    Parameters
+    ----------
+    profile : ScaleProfile
+        Profile to seed.
+    memory_budget : int, optional
+        Bytes the seeder may use; defaults to the machine's physical memory.
+    """
+    budget = memory_budget if memory_budget is not None else available_memory_bytes()
+    if budget is None:
+        return "streaming"
+    limit = budget * EAGER_MEMORY_FRACTION
+    if profile.workers > 1 and profile.parallel_memory_bytes() <= limit:
+        return "parallel"
+    return "eager" if profile.estimated_memory_bytes() <= limit else "streaming"
@@ -0,0 +1,165 @@
+"""O(1) weighted sampling of referential keys for transactions and logs.
+
+``generate_transactions`` and ``generate_logs`` pick referenced products and
+users with ``fake.random_element`` over full document lists. A ``KeySampler``
+instead holds a precomputed array of just the keys those generators copy
+(``_id`` for users, ``(sku, name, price)`` for products) and draws from it with
+Vose's alias method, so every draw costs two random numbers whatever the
+weights. Zipf weights reproduce production-like hot keys: a few very popular
+products and a handful of heavy users.
+
+Examples
+--------
+>>> products_sampler = product_sampler(products, zipf=1.1, seed=7)
+>>> users_sampler = user_sampler(users, zipf=0.8, seed=7)
+>>> orders = generate_transactions([], [], 10_000, user_sampler=users_sampler, product_sampler=products_sampler)
+"""
+
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class AliasSampler:
+    """
+    Vose alias table drawing indexes ``0..n-1`` proportionally to ``weights``.
+
+    Parameters
+    ----------
+    weights : sequence of float
+        Non-negative weights with a positive sum.
+    rng : random.Random, optional
+        Random source; a fresh ``random.Random()`` is used when omitted.
+    """
+
+    __slots__ = ("prob", "alias", "_n", "_random")
+
+    def __init__(self, weights: Sequence[float], rng: Optional[random.Random] = None):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("weights must not be empty")
+        if any(w < 0 for w in weights):
+            raise ValueError("weights must be non-negative")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("weights must have a positive sum")
+
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        while small and large:
+            lo = small.pop()
+            hi = large.pop()
+            prob[lo] = scaled[lo]
+            alias[lo] = hi
+            scaled[hi] = scaled[hi] + scaled[lo] - 1.0
+            (small if scaled[hi] < 1.0 else large).append(hi)
+        # Leftovers are 1.0 up to floating point error.
+
+        self.prob = prob
+        self.alias = alias
+        self._n = n
+        self._random = (rng or random.Random()).random
+
+    def sample(self) -> int:
+        i = int(self._random() * self._n)
+        return i if self._random() < self.prob[i] else self.alias[i]
+
+
+def zipf_weights(n: int, exponent: float = 1.0) -> List[float]:
+    """
+    Zipf weights ``1 / rank**exponent`` for ranks ``1..n``.
+    """
+    if exponent < 0:
+        raise ValueError("exponent must be >= 0")
+    return [1.0 / (rank**exponent) for rank in range(1, n + 1)]
+
+
+class KeySampler:
+    """
+    Draw precomputed reference keys uniformly or by weight.
+
+    Parameters
+    ----------
+    keys : sequence
+        Key values returned by ``sample`` (kept as a list).
+    weights : sequence of float, optional
+        Per-key weights; uniform when omitted.
+    seed : int, optional
+        Seed for the sampler's private ``random.Random``.
+    """
+
+    __slots__ = ("keys", "sample")
+
+    def __init__(self, keys: Sequence[Any], weights: Optional[Sequence[float]] = None, seed: Optional[int] = None):
+        self.keys = list(keys)
+        if not self.keys:
+            raise ValueError("keys must not be empty")
+        rng = random.Random(seed)
+        if weights is None:
+            self.sample = self._uniform(self.keys, rng)
+        else:
+            if len(weights) != len(self.keys):
+                raise ValueError("weights and keys must have the same length")
+            self.sample = self._weighted(self.keys, AliasSampler(weights, rng))
+
+    @staticmethod
+    def _uniform(keys, rng):
+        n = len(keys)
+        rand = rng.random
+
+        def sample():
+            return keys[int(rand() * n)]
+
+        return sample
+
+    @staticmethod
+    def _weighted(keys, table):
+        draw = table.sample
+
+        def sample():
+            return keys[draw()]
+
+        return sample
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def _weights_for(n: int, weights: Optional[Sequence[float]], zipf: Optional[float]) -> Optional[Sequence[float]]:
+    if weights is not None and zipf is not None:
+        raise ValueError("pass either weights or zipf, not both")
+    if zipf is not None:
+        return zipf_weights(n, zipf)
+    return weights
+
+
+def user_sampler(
+    users: Sequence[Dict],
+    weights: Optional[Sequence[float]] = None,
+    zipf: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> KeySampler:
+    """
+    Build a ``_id`` sampler from user documents or reference stubs.
+
+    ``zipf`` ranks users in list order, so the first users become the heavy ones.
+    """
+    ids = [user["_id"] for user in users]
+    return KeySampler(ids, _weights_for(len(ids), weights, zipf), seed)
+
+
+def product_sampler(
+    products: Sequence[Dict],
+    weights: Optional[Sequence[float]] = None,
+    zipf: Optional[float] = None,
+    seed: Optional[int] = None,
+) -> KeySampler:
+    """
+    Build a ``(sku, name, price)`` sampler from product documents or reference stubs.
+
+    ``zipf`` ranks products in list order, so the first products become the popular ones.
+    """
+    keys = [(product["sku"], product["name"], product["price"]["amount"]) for product in products]
+    return KeySampler(keys, _weights_for(len(keys), weights, zipf), seed)
@@ -0,0 +1,306 @@
+"""Time-series-aware log generation with diurnal and bursty arrival patterns.
+
+``generate_logs`` draws each timestamp uniformly over the last 7 days. Here
+timestamps come from a non-homogeneous arrival process instead: the window is
+cut into buckets whose weight follows a daily cycle (peaking at ``peak_hour``)
+multiplied by occasional bursts. Arrivals are emitted already sorted, in
+O(1) memory, by walking sequential uniform order statistics through the
+cumulative bucket weights.
+
+The output can be bulk-loaded into a MongoDB time-series collection keyed on
+``timestamp`` with ``metaField="meta"`` holding ``level`` and ``type``
+(``backfill_timeseries_logs``), or paced into it as a live stream of N
+events/second (``stream_logs_live``) to load-test ingestion.
+"""
+
+import math
+import random
+import sys
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import accumulate, repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from python import generate_fake_data as fake_data
+
+DEFAULT_COLLECTION = "logs_timeseries"
+TIME_FIELD = "timestamp"
+META_FIELD = "meta"
+TTL_SECONDS = 30 * 24 * 60 * 60
+
+TIMESERIES_INDEXES = [
+    ([("meta.level", fake_data.ASCENDING), (TIME_FIELD, fake_data.DESCENDING)], {}),
+    ([("userId", fake_data.ASCENDING), (TIME_FIELD, fake_data.DESCENDING)], {}),
+]
+
+
+@dataclass(frozen=True)
+class ArrivalPattern:
+    """
+    Shape of the arrival rate over time.
+
+    Attributes
+    ----------
+    bucket_seconds : int
+        Resolution of the rate curve.
+    peak_hour : float
+        Hour of day (0-24) with the highest traffic.
+    amplitude : float
+        Diurnal swing in ``[0, 1)``; 0 gives a flat rate.
+    burst_probability : float
+        Chance that a burst starts in any bucket.
+    burst_multiplier : float
+        Rate multiplier while a burst lasts.
+    burst_buckets : int
+        Burst length in buckets.
+    """
+
+    bucket_seconds: int = 60
+    peak_hour: float = 14.0
+    amplitude: float = 0.6
+    burst_probability: float = 0.002
+    burst_multiplier: float = 8.0
+    burst_buckets: int = 5
+
+    def diurnal_factor(self, moment: datetime) -> float:
+        hour = moment.hour + moment.minute / 60 + moment.second / 3600
+        return 1.0 + self.amplitude * math.cos(2 * math.pi * (hour - self.peak_hour) / 24)
+
+    def bucket_weights(self, start: datetime, end: datetime, rng: random.Random) -> List[float]:
+        """
+        Relative arrival rate of every bucket in ``[start, end)``.
+        """
+        if end <= start:
+            raise ValueError("end must be after start")
+        if not 0 <= self.amplitude < 1:
+            raise ValueError("amplitude must be in [0, 1)")
+        step = timedelta(seconds=self.bucket_seconds)
+        buckets = math.ceil((end - start) / step)
+        weights = []
+        burst_left = 0
+        for index in range(buckets):
+            if burst_left == 0 and rng.random() < self.burst_probability:
+                burst_left = self.burst_buckets
+            multiplier = self.burst_multiplier if burst_left else 1.0
+            burst_left = max(0, burst_left - 1)
+            weights.append(self.diurnal_factor(start + index * step) * multiplier)
+        return weights
+
+
+def iter_arrival_times(
+    n: int,
+    start: datetime,
+    end: datetime,
+    pattern: ArrivalPattern = ArrivalPattern(),
+    seed: Optional[int] = None,
+) -> Iterator[datetime]:
+    """
+    Yield ``n`` sorted timestamps in ``[start, end)`` following ``pattern``.
+
+    Parameters
+    ----------
+    n : int
+        Number of arrivals.
+    start, end : datetime
+        Window to fill.
+    pattern : ArrivalPattern, optional
+        Diurnal/burst rate curve.
+    seed : int, optional
+        Seed for bursts and arrival draws.
+    """
+    rng = random.Random(seed)
+    weights = pattern.bucket_weights(start, end, rng)
+    cumulative = list(accumulate(weights))
+    total = cumulative[-1]
+    window = (end - start).total_seconds()
+    bucket_seconds = pattern.bucket_seconds
+
+    # Sequential order statistics: the k-th smallest of n uniforms, generated in order.
+    position = 0.0
+    bucket = 0
+    for remaining in range(n, 0, -1):
+        position = 1.0 - (1.0 - position) * rng.random() ** (1.0 / remaining)
+        target = position * total
+        bucket = bisect_right(cumulative, target, lo=bucket)
+        bucket = min(bucket, len(cumulative) - 1)
+        before = cumulative[bucket - 1] if bucket else 0.0
+        fraction = (target - before) / weights[bucket]
+        offset = min((bucket + fraction) * bucket_seconds, window - 1e-6)
+        yield start + timedelta(seconds=offset)
+
+
+def to_timeseries_document(log: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Move ``level`` and ``type`` under the ``meta`` field used as the time-series metaField.
+    """
+    doc = dict(log)
+    doc[META_FIELD] = {"level": doc.pop("level"), "type": doc.pop("type")}
+    return doc
+
+
+def iter_timeseries_logs(
+    users: Sequence[Dict],
+    n: int,
+    start: datetime,
+    end: datetime,
+    pattern: ArrivalPattern = ArrivalPattern(),
+    seed: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield time-series log documents in timestamp order.
+    """
+    arrivals = iter_arrival_times(n, start, end, pattern, seed)
+    for log in fake_data.iter_logs(users, n, timestamps=arrivals):
+        yield to_timeseries_document(log)
+
+
+def create_timeseries_collection(
+    db, name: str = DEFAULT_COLLECTION, granularity: str = "seconds", expire_after_seconds: Optional[int] = TTL_SECONDS
+):
+    """
+    (Re)create a time-series collection keyed on ``timestamp`` with ``meta`` as metaField.
+    """
+    db.drop_collection(name)
+    options: Dict[str, Any] = {
+        "timeseries": {"timeField": TIME_FIELD, "metaField": META_FIELD, "granularity": granularity}
+    }
+    if expire_after_seconds is not None:
+        options["expireAfterSeconds"] = expire_after_seconds
+    collection = db.create_collection(name, **options)
+    for keys, index_options in TIMESERIES_INDEXES:
+        collection.create_index(keys, **index_options)
+    return collection
+
+
+def backfill_timeseries_logs(
+    users: Sequence[Dict],
+    n: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    pattern: ArrivalPattern = ArrivalPattern(),
+    seed: Optional[int] = None,
+    batch_size: int = fake_data.DEFAULT_BATCH_SIZE,
+    collection_name: str = DEFAULT_COLLECTION,
+) -> int:
+    """
+    Bulk-load ``n`` time-ordered logs into a fresh time-series collection.
+
+    Parameters
+    ----------
+    users : sequence of dict
+        User documents or reference stubs for ``userId``.
+    n : int
+        Number of log entries.
+    start, end : datetime, optional
+        Backfill window; defaults to the last 7 days.
+    pattern : ArrivalPattern, optional
+        Arrival rate curve.
+    seed : int, optional
+        Seed for the arrival process.
+    batch_size : int, optional
+        Documents per ``insert_many``.
+    collection_name : str, optional
+        Target time-series collection.
+
+    Returns
+    -------
+    int
+        Number of inserted documents.
+    """
+    end = end or datetime.now()
+    start = start or end - timedelta(days=7)
+    collection = create_timeseries_collection(fake_data.get_db(), collection_name)
+    inserted = 0
+    for batch in fake_data._batched(iter_timeseries_logs(users, n, start, end, pattern, seed), batch_size):
+        collection.insert_many(batch)
+        inserted += len(batch)
+    print(f"✅ Backfilled {inserted} logs into time-series collection '{collection_name}'")
+    return inserted
+
+
+def stream_logs_live(
+    users: Sequence[Dict],
+    rate: float,
+    duration: Optional[float] = None,
+    max_events: Optional[int] = None,
+    poisson: bool = True,
+    flush_interval: float = 0.1,
+    seed: Optional[int] = None,
+    collection_name: str = DEFAULT_COLLECTION,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, float]:
+    """
+    Insert logs stamped with the current time at ``rate`` events/second.
+
+    Events are scheduled on a fixed timeline (evenly spaced, or with exponential
+    gaps when ``poisson`` is true) and flushed every ``flush_interval`` seconds,
+    so a slow insert is caught up rather than silently lowering the rate.
+
+    Parameters
+    ----------
+    users : sequence of dict
+        User documents or reference stubs for ``userId``.
+    rate : float
+        Target events per second.
+    duration : float, optional
+        Stop after this many seconds.
+    max_events : int, optional
+        Stop after this many events; one of ``duration``/``max_events`` is required.
+    poisson : bool, optional
+        Use Poisson arrivals instead of a constant spacing.
+    flush_interval : float, optional
+        Seconds between ``insert_many`` calls.
+    seed : int, optional
+        Seed for the arrival gaps.
+    collection_name : str, optional
+        Existing (time-series) collection to write to.
+    clock, sleep : callable, optional
+        Injectable time source and sleeper.
+
+    Returns
+    -------
+    dict
+        ``events``, ``seconds`` and achieved ``rate``.
+    """
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    if duration is None and max_events is None:
+        raise ValueError("pass duration and/or max_events")
+
+    rng = random.Random(seed)
+    collection = fake_data.get_db()[collection_name]
+    n = max_events if max_events is not None else sys.maxsize
+    documents = fake_data.iter_logs(users, n, timestamps=repeat(None))
+    wall_start = datetime.now()
+    started = clock()
+    pending: List[Dict[str, Any]] = []
+    next_due = 0.0
+    next_flush = flush_interval
+    events = 0
+
+    def flush(at: float) -> None:
+        wait = at - (clock() - started)
+        if wait > 0:
+            sleep(wait)
+        if pending:
+            collection.insert_many(pending)
+            pending.clear()
+
+    while events < n:
+        next_due = next_due + rng.expovariate(rate) if poisson else (events + 1) / rate
+        if duration is not None and next_due > duration:
+            break
+        if next_due > next_flush:
+            flush(next_flush)
+            next_flush += math.ceil((next_due - next_flush) / flush_interval) * flush_interval
+        log = next(documents)
+        log[TIME_FIELD] = wall_start + timedelta(seconds=next_due)
+        pending.append(to_timeseries_document(log))
+        events += 1
+
+    flush(min(next_flush, next_due) if duration is None else min(next_flush, duration))
+    elapsed = max(clock() - started, 1e-9)
+    return {"events": events, "seconds": elapsed, "rate": events / elapsed}
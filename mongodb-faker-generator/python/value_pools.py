@@ -0,0 +1,146 @@
+"""Pre-generated value pools that replace expensive per-field Faker calls.
+
+In pooled mode each selected document field (``<collection>.<path>``) gets
+its own vocabulary, filled by calling the field's provider ``pool_size`` times
+up front; documents then draw from it by random index. The generators bind one
+provider per field through ``generate_fake_data._field_provider``, so pooling
+``logs.metadata.userAgent`` leaves ``users.metadata.userAgent`` untouched.
+Everything else is forwarded to the wrapped Faker.
+
+Poolable fields and the provider filling them are listed in ``FIELD_PROVIDERS``.
+"""
+
+import random
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from python import generate_fake_data as fake_data
+
+DEFAULT_POOL_SIZE = 1024
+FIELD_PROVIDERS = {
+    "users._id": "uuid4",
+    "users.profile.avatar": "image_url",
+    "users.metadata.ipAddress": "ipv4",
+    "users.metadata.userAgent": "user_agent",
+    "products.images": "image_url",
+    "transactions.orderId": "uuid4",
+    "logs.sessionId": "uuid4",
+    "logs.message": "sentence",
+    "logs.metadata.ip": "ipv4",
+    "logs.metadata.userAgent": "user_agent",
+}
+DEFAULT_POOLED_FIELDS = tuple(FIELD_PROVIDERS)
+
+# uuid4 feeds unique keys (_id, orderId), so it is never drawn from a finite
+# pool; it is replaced by a cheap random-bits UUID instead.
+_FAST_PROVIDERS = ("uuid4",)
+
+
+class ValuePool:
+    """
+    Fixed-size vocabulary filled once from a provider and sampled by index.
+
+    Parameters
+    ----------
+    provider : callable
+        Zero-argument callable producing one value.
+    size : int
+        Number of values to pre-generate.
+    rng : random.Random
+        Generator used to pick indexes.
+    """
+
+    __slots__ = ("values", "_size", "_random")
+
+    def __init__(self, provider, size: int, rng: random.Random):
+        if size < 1:
+            raise ValueError("pool size must be >= 1")
+        self.values: List[Any] = [provider() for _ in range(size)]
+        self._size = size
+        self._random = rng.random
+
+    def draw(self) -> Any:
+        return self.values[int(self._random() * self._size)]
+
+
+class PooledFaker:
+    """
+    Faker proxy serving selected document fields from ``ValuePool`` instances.
+
+    Parameters
+    ----------
+    faker : faker.Faker
+        Instance used to fill the pools and to serve every other provider.
+    fields : iterable of str, optional
+        Field paths to pool, keys of ``FIELD_PROVIDERS``.
+    pool_size : int, optional
+        Values per pool.
+    seed : int, optional
+        Seed for index draws; defaults to bits taken from ``faker.random`` so a
+        seeded Faker yields a reproducible pooled run.
+    """
+
+    def __init__(
+        self,
+        faker,
+        fields: Iterable[str] = DEFAULT_POOLED_FIELDS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        seed: Optional[int] = None,
+    ):
+        self._faker = faker
+        rng = random.Random(faker.random.getrandbits(64) if seed is None else seed)
+        self.pools: Dict[str, ValuePool] = {}
+        self._fields: Dict[str, Callable[[], Any]] = {}
+        for field in fields:
+            name = FIELD_PROVIDERS.get(field)
+            if name is None:
+                raise ValueError(f"unknown pooled field: {field!r}")
+            if name in _FAST_PROVIDERS:
+                self._fields[field] = self._fast_uuid4(rng)
+                continue
+            pool = ValuePool(getattr(faker, name), pool_size, rng)
+            self.pools[field] = pool
+            self._fields[field] = pool.draw
+
+    def field_provider(self, field: str, name: str) -> Callable[[], Any]:
+        """
+        Callable serving ``field``: its pool when pooled, else Faker's ``name`` provider.
+        """
+        provider = self._fields.get(field)
+        return provider if provider is not None else getattr(self._faker, name)
+
+    @staticmethod
+    def _fast_uuid4(rng: random.Random):
+        getrandbits = rng.getrandbits
+
+        def uuid4() -> str:
+            return str(uuid.UUID(int=getrandbits(128), version=4))
+
+        return uuid4
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._faker, name)
+
+
+@contextmanager
+def pooled_generation(
+    fields: Iterable[str] = DEFAULT_POOLED_FIELDS,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    seed: Optional[int] = None,
+) -> Iterator[PooledFaker]:
+    """
+    Temporarily route the generators through a ``PooledFaker``.
+
+    Examples
+    --------
+    >>> with pooled_generation(fields=("logs.metadata.userAgent", "logs.metadata.ip")):
+    ...     logs = generate_logs(users, 1_000_000)
+    """
+    original = fake_data.get_faker()
+    pooled = PooledFaker(original, fields=fields, pool_size=pool_size, seed=seed)
+    fake_data.fake = pooled
+    try:
+        yield pooled
+    finally:
+        fake_data.fake = original
@@ -1,63 +1,580 @@
 #!/usr/bin/env python3
 """
 Performance benchmark script for data generation
+
+Without arguments this times the in-memory generator functions and writes
+``benchmark_results.txt``; the memory figure is the ``tracemalloc`` peak of
+one extra untimed call, with the process RSS change kept as a secondary,
+allocator-dependent number. ``--suite`` benchmarks seeding end to end against
+mongomock (default) or a local mongod (``--uri``): for every batch size and
+worker count it reports generation, BSON encoding and insertion/indexing
+separately and writes the runs as JSON so they can be compared::
+
+    python scripts/benchmark.py --suite --profile tiny --batch-sizes 100,1000 --workers 1,2
+    python scripts/benchmark.py --suite --uri mongodb://localhost:27017/ --json results.json
+
+``--memory`` profiles the generators with ``tracemalloc`` instead: peak and
+retained bytes per generated document, and the generator source lines (mapped
+to document field paths such as ``profile.bio``) that own the most memory::
+
+    python scripts/benchmark.py --memory --top 15
+
+``--scaling`` streams ``generate_transactions`` (for several product-catalog
+sizes) and ``generate_logs`` from 1k up to 10M documents and tabulates
+records/sec and BSON bytes/doc against N, so non-linear behaviour shows up
+before it does in a production seed. The full default curve takes hours;
+pass smaller ``--sizes`` for a quick look::
+
+    python scripts/benchmark.py --scaling --sizes 1k,10k,100k --catalog-sizes 100,10k,1M --plot scaling.png
 """
 
-import time
-import psutil
+import argparse
+import contextlib
+import io
+import json
+import linecache
 import os
+import platform
 import sys
+import time
+import tracemalloc
+import uuid
+from itertools import chain
 from statistics import mean, stdev
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optional dependency
+    psutil = None
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from python.generate_fake_data import (
+from python import generate_fake_data as fake_data  # noqa: E402
+from python import parallel_generation, profiles  # noqa: E402
+from python.field_profiler import field_path  # noqa: E402
+from python.generate_fake_data import (  # noqa: E402
     generate_users,
     generate_products,
     generate_transactions,
     generate_logs,
 )
 
+SUITE_DB_NAME = "benchmark_suite"
+PHASES = ("generation", "encoding", "insertion", "indexing")
+
+# Frames kept per allocation so Faker internals can be traced back to the
+# generator line that called them (Faker allocates at most ~7 frames deeper).
+TRACE_FRAMES = 12
+GENERATOR_FILE = fake_data.__file__
+
 
 def get_memory_usage():
-    """Get current memory usage in MB"""
+    """Get current memory usage in MB (0 when psutil is not installed)"""
+    if psutil is None:
+        return 0.0
     process = psutil.Process(os.getpid())
     return process.memory_info().rss / 1024 / 1024
 
 
+def machine_info():
+    """Describe the machine a run was measured on"""
+    return {
+        "cpus": os.cpu_count(),
+        "memory_gb": round(psutil.virtual_memory().total / 1024**3, 1) if psutil is not None else None,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def traced_peak_mb(func, *args):
+    """
+    Peak Python allocation (MB) during one call of ``func``, from tracemalloc.
+
+    Unlike an RSS delta this does not depend on what the allocator already
+    holds or returns to the OS, so it is the figure the reports lead with.
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
 def benchmark_function(func, *args, iterations=5):
-    """Benchmark a function multiple times"""
+    """Benchmark a function multiple times, then trace one extra untimed call for its peak memory"""
     times = []
-    memory_usages = []
+    rss_deltas = []
 
     for i in range(iterations):
         start_memory = get_memory_usage()
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        result = func(*args)
+        func(*args)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         end_memory = get_memory_usage()
 
         times.append(end_time - start_time)
-        memory_usages.append(end_memory - start_memory)
+        rss_deltas.append(end_memory - start_memory)
 
     return {
         "avg_time": mean(times),
         "std_time": stdev(times) if len(times) > 1 else 0,
-        "avg_memory": mean(memory_usages),
+        "peak_memory": traced_peak_mb(func, *args),
+        "avg_rss_delta": mean(rss_deltas),
         "min_time": min(times),
         "max_time": max(times),
     }
 
 
-def main():
-    """Run performance benchmarks"""
-    print("🚀 MongoDB Faker Generator - Performance Benchmark\n")
-    print(
-        f"System: {psutil.cpu_count()} CPUs, {psutil.virtual_memory().total / 1024**3:.1f} GB RAM"
-    )
-    print(f"Python: {sys.version.split()[0]}\n")
+def measure_generation_peak(counts, batch_size, seed=0):
+    """
+    Peak traced allocation (bytes) while streaming the dataset through the generators.
+
+    Mirrors ``insert_data_streaming`` without a database: documents are produced
+    in ``batch_size`` batches and dropped, users/products feed compact reference
+    tables. Faker is created before tracing starts so its locale data is not
+    counted.
+    """
+    fake_data.seed_generators(seed)
+    users = fake_data.UserTable()
+    products = fake_data.ProductTable()
+    tracemalloc.start()
+    try:
+        for batch in fake_data._batched(fake_data.iter_users(counts["users"]), batch_size):
+            users.extend(batch)
+        for batch in fake_data._batched(fake_data.iter_products(counts["products"]), batch_size):
+            products.extend(batch)
+        for documents in (
+            fake_data.iter_transactions(users, products, counts["transactions"]),
+            fake_data.iter_logs(users, counts["logs"]),
+        ):
+            for batch in fake_data._batched(documents, batch_size):
+                pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def attribute_call_sites(snapshot, filename=GENERATOR_FILE):
+    """
+    Group live allocations by the innermost ``filename`` line on their traceback.
+
+    Returns
+    -------
+    list of dict
+        ``{"line", "field", "source", "bytes", "blocks"}`` sorted by bytes; the
+        last entry (``line`` None) sums allocations with no generator frame.
+    """
+    sites = {}
+    other = {"bytes": 0, "blocks": 0}
+    for trace in snapshot.traces:
+        frame = next((frame for frame in reversed(trace.traceback) if frame.filename == filename), None)
+        entry = other if frame is None else sites.setdefault(frame.lineno, {"bytes": 0, "blocks": 0})
+        entry["bytes"] += trace.size
+        entry["blocks"] += 1
+    ranked = [
+        {
+            "line": lineno,
+            "field": field_path(filename, lineno),
+            "source": linecache.getline(filename, lineno).strip(),
+            **entry,
+        }
+        for lineno, entry in sorted(sites.items(), key=lambda item: item[1]["bytes"], reverse=True)
+    ]
+    ranked.append({"line": None, "field": None, "source": "<outside the generators>", **other})
+    return ranked
+
 
+def profile_memory(func, *args, count, top=10):
+    """
+    Trace one call: peak and retained bytes (total and per document) plus call sites.
+
+    ``peak`` is the high-water mark of traced memory during the call; ``retained``
+    is what the returned documents still hold, which is what the call sites
+    and per-section totals break down.
+    """
+    tracemalloc.start(TRACE_FRAMES)
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func(*args)
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    sites = attribute_call_sites(snapshot)
+    sections = {}
+    for site in sites:
+        section = (site["field"] or "(other)").split(".")[0]
+        sections[section] = sections.get(section, 0) + site["bytes"]
+    peak -= start
+    retained = current - start
+    return {
+        "count": count,
+        "peak_bytes": peak,
+        "retained_bytes": retained,
+        "peak_bytes_per_doc": peak / count if count else 0.0,
+        "retained_bytes_per_doc": retained / count if count else 0.0,
+        "call_sites": sites[:-1][:top] + sites[-1:],
+        "sections": dict(sorted(sections.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def run_memory_profile(top=10):
+    """Profile each generator's memory and print the heaviest fields"""
+    # Warm Faker's lazily loaded providers so they are not charged to the first benchmark.
+    fake_data.seed_generators(0)
+    warm_users, warm_products = generate_users(1), generate_products(1)
+    generate_transactions(warm_users, warm_products, 1)
+    generate_logs(warm_users, 1)
+
+    # Tracing slows Faker down ~10x; per-document figures are stable at these sizes.
+    users, products = generate_users(100), generate_products(500)
+    benchmarks = [
+        ("Generate 500 users", generate_users, (500,), 500),
+        ("Generate 2000 products", generate_products, (2000,), 2000),
+        ("Generate 2000 transactions", generate_transactions, (users, products, 2000), 2000),
+        ("Generate 2000 logs", generate_logs, (users, 2000), 2000),
+    ]
+    results = []
+    for name, func, args, count in benchmarks:
+        stats = profile_memory(func, *args, count=count, top=top)
+        print(f"🧠 {name}")
+        print(
+            f"   Peak: {stats['peak_bytes'] / 1024**2:.2f} MB ({stats['peak_bytes_per_doc']:,.0f} B/doc), "
+            f"retained: {stats['retained_bytes'] / 1024**2:.2f} MB ({stats['retained_bytes_per_doc']:,.0f} B/doc)"
+        )
+        total = stats["retained_bytes"] or 1
+        for rank, site in enumerate(stats["call_sites"], 1):
+            label = site["field"] or (f"line {site['line']}" if site["line"] else "other")
+            print(
+                f"   {rank:>2}. {label:<34} {site['bytes'] / count:>8,.0f} B/doc {site['bytes'] / total:>6.1%}  "
+                f"{site['source'][:50]}"
+            )
+        shares = ", ".join(f"{section} {size / total:.0%}" for section, size in stats["sections"].items())
+        print(f"   Sections: {shares}\n")
+        results.append({"operation": name, **stats})
+    return results
+
+
+SCALING_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+SCALING_CATALOG_SIZES = [100, 10_000, 1_000_000]
+_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+
+
+def _size(value):
+    value = value.strip().lower()
+    multiplier = _SUFFIXES.get(value[-1:], 1)
+    number = value[:-1] if multiplier > 1 else value
+    return int(float(number) * multiplier)
+
+
+def _size_list(value):
+    return [_size(item) for item in value.split(",") if item.strip()]
+
+
+def reference_stubs(n_users, n_products, form="table", seed=0):
+    """
+    Synthetic user/product references, built without Faker so large catalogs are cheap.
+
+    ``form="table"`` returns ``UserTable``/``ProductTable`` (what the seeders
+    use); ``form="list"`` returns lists of stub dicts, which go through
+    ``Faker.random_element`` and show its per-pick cost growing with the catalog.
+    """
+    rng = fake_data.random.Random(seed)
+    users = [{"_id": str(uuid.UUID(int=rng.getrandbits(128), version=4))} for _ in range(n_users)]
+    products = [
+        {"sku": f"{index:013d}", "name": f"Product {index}", "price": {"amount": round(rng.uniform(10, 1000), 2)}}
+        for index in range(n_products)
+    ]
+    if form == "table":
+        return fake_data.UserTable(users), fake_data.ProductTable(products)
+    if form == "list":
+        return users, products
+    raise ValueError(f"unknown reference form {form!r}")
+
+
+def measure_scaling_point(documents, n, sample_every=100):
+    """
+    Drain ``documents`` (``n`` of them), timing generation and sampling BSON sizes.
+
+    Every ``sample_every``-th document is encoded; encoding time is excluded
+    from the rate.
+    """
+    import bson
+
+    encode = bson.encode
+    sampled_bytes = sampled = 0
+    encoding = 0.0
+    start = time.perf_counter()
+    for index, doc in enumerate(documents):
+        if index % sample_every == 0:
+            encode_start = time.perf_counter()
+            sampled_bytes += len(encode(doc))
+            encoding += time.perf_counter() - encode_start
+            sampled += 1
+    seconds = time.perf_counter() - start - encoding
+    return {
+        "n": n,
+        "seconds": seconds,
+        "records_per_sec": n / seconds if seconds else None,
+        "bson_bytes_per_doc": sampled_bytes / sampled if sampled else None,
+    }
+
+
+def run_scaling(sizes, catalog_sizes, n_users=10_000, form="table", seed=0, sample_every=100, echo=print):
+    """
+    Scaling curves for transactions (per catalog size) and logs.
+
+    Returns
+    -------
+    dict
+        ``{"transactions": [point, ...], "logs": [point, ...]}``; transaction
+        points carry their ``catalog`` size.
+    """
+    results = {"transactions": [], "logs": []}
+    for catalog in catalog_sizes:
+        users, products = reference_stubs(n_users, catalog, form, seed)
+        for n in sizes:
+            fake_data.seed_generators(seed)
+            point = measure_scaling_point(fake_data.iter_transactions(users, products, n), n, sample_every)
+            point["catalog"] = catalog
+            results["transactions"].append(point)
+            echo(f"   transactions N={n:>11,} catalog={catalog:>10,}: {point['records_per_sec']:>9,.0f} rec/s")
+    users, _ = reference_stubs(n_users, 0, form, seed)
+    for n in sizes:
+        fake_data.seed_generators(seed)
+        point = measure_scaling_point(fake_data.iter_logs(users, n), n, sample_every)
+        results["logs"].append(point)
+        echo(f"   logs         N={n:>11,}: {point['records_per_sec']:>9,.0f} rec/s")
+    return results
+
+
+def format_scaling(results):
+    """Tabulate records/sec and bytes/doc against N, with throughput relative to the smallest N"""
+    lines = [f"{'generator':<13} {'catalog':>10} {'N':>12} {'seconds':>9} {'records/s':>10} {'bytes/doc':>9} {'vs first':>8}"]
+    for kind, points in results.items():
+        first_rates = {}
+        for point in points:
+            catalog = point.get("catalog")
+            first = first_rates.setdefault(catalog, point["records_per_sec"])
+            relative = point["records_per_sec"] / first if first and point["records_per_sec"] else 0.0
+            catalog_label = f"{catalog:,}" if catalog is not None else "-"
+            lines.append(
+                f"{kind:<13} {catalog_label:>10} {point['n']:>12,} {point['seconds']:>9.2f} "
+                f"{point['records_per_sec']:>10,.0f} {point['bson_bytes_per_doc']:>9,.0f} {relative:>7.0%}"
+            )
+    return "\n".join(lines)
+
+
+def plot_scaling(results, path):
+    """Plot records/sec and bytes/doc against N on log axes (needs matplotlib)"""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise SystemExit("--plot requires matplotlib (pip install matplotlib)") from exc
+
+    figure, (rate_axis, size_axis) = plt.subplots(1, 2, figsize=(12, 4.5))
+    series = {}
+    for kind, points in results.items():
+        for point in points:
+            label = f"{kind} (catalog {point['catalog']:,})" if "catalog" in point else kind
+            series.setdefault(label, []).append(point)
+    for label, points in series.items():
+        ns = [point["n"] for point in points]
+        rate_axis.plot(ns, [point["records_per_sec"] for point in points], marker="o", label=label)
+        size_axis.plot(ns, [point["bson_bytes_per_doc"] for point in points], marker="o", label=label)
+    for axis, ylabel in ((rate_axis, "records/sec"), (size_axis, "BSON bytes/doc")):
+        axis.set_xscale("log")
+        axis.set_xlabel("N documents")
+        axis.set_ylabel(ylabel)
+        axis.grid(True, which="both", alpha=0.3)
+    rate_axis.legend(fontsize="small")
+    figure.tight_layout()
+    figure.savefig(path)
+    plt.close(figure)
+
+
+def open_target(uri=None, db_name=SUITE_DB_NAME):
+    """
+    Return ``(client, db, raw_inserts)`` for mongod (``uri`` given) or mongomock.
+
+    Real servers receive ``RawBSONDocument`` batches so the insertion phase does
+    not re-encode; mongomock only accepts dicts.
+    """
+    if uri is not None:
+        from pymongo import MongoClient
+
+        client = MongoClient(uri)
+        return client, client[db_name], True
+    try:
+        import mongomock
+    except ImportError as exc:
+        raise SystemExit("mongomock is required without --uri (pip install mongomock)") from exc
+    client = mongomock.MongoClient()
+    return client, client[db_name], False
+
+
+def run_phases(db, counts, batch_size, workers, seed=0, raw_inserts=False):
+    """
+    Seed ``db`` collection by collection, timing each phase separately.
+
+    Every collection is fully generated (through ``parallel_generation`` with
+    ``workers`` processes), then encoded, then inserted in ``batch_size``
+    batches, then indexed, so each phase is measured in isolation.
+
+    Returns
+    -------
+    dict
+        ``{"phases": {phase: seconds}, "collections": {name: {...}}, "documents",
+        "bson_bytes"}``.
+    """
+    import bson
+    from bson.raw_bson import RawBSONDocument
+
+    phases = dict.fromkeys(PHASES, 0.0)
+    collections = {}
+    users = fake_data.UserTable()
+    products = fake_data.ProductTable()
+    references = {
+        "users": {},
+        "products": {},
+        "transactions": {"users": users, "products": products},
+        "logs": {"users": users},
+    }
+
+    for kind in profiles.COLLECTIONS:
+        n = counts[kind]
+        start = time.perf_counter()
+        batches = list(
+            parallel_generation.iter_parallel_batches(
+                kind, n, seed=seed, workers=workers, chunk_size=batch_size, **references[kind]
+            )
+        )
+        generation = time.perf_counter() - start
+        if kind == "users":
+            users.extend(chain.from_iterable(batches))
+        elif kind == "products":
+            products.extend(chain.from_iterable(batches))
+
+        start = time.perf_counter()
+        encoded = [[bson.encode(doc) for doc in batch] for batch in batches]
+        encoding = time.perf_counter() - start
+        bson_bytes = sum(len(raw) for batch in encoded for raw in batch)
+
+        collection = db[kind]
+        collection.drop()
+        start = time.perf_counter()
+        for batch, raw_batch in zip(batches, encoded):
+            if not batch:
+                continue
+            docs = [RawBSONDocument(raw) for raw in raw_batch] if raw_inserts else batch
+            collection.insert_many(docs, ordered=False)
+        insertion = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fake_data._create_collection_indexes(collection, kind)
+        indexing = time.perf_counter() - start
+
+        timings = {"generation": generation, "encoding": encoding, "insertion": insertion, "indexing": indexing}
+        for phase, seconds in timings.items():
+            phases[phase] += seconds
+        collections[kind] = {"documents": n, "bson_bytes": bson_bytes, **timings}
+        del batches, encoded
+
+    return {
+        "phases": phases,
+        "collections": collections,
+        "documents": sum(counts.values()),
+        "bson_bytes": sum(entry["bson_bytes"] for entry in collections.values()),
+    }
+
+
+def run_end_to_end(uri, counts, batch_size, workers, seed=0, db_name=SUITE_DB_NAME):
+    """
+    Time the real seeding entry point (streaming or parallel) against mongod.
+    """
+    fake_data.configure_database(uri, db_name)
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if workers > 1:
+                parallel_generation.insert_data_parallel(seed=seed, workers=workers, chunk_size=batch_size, **counts)
+            else:
+                fake_data.insert_data_streaming(batch_size=batch_size, **counts)
+    finally:
+        fake_data.close_client()
+    return time.perf_counter() - start
+
+
+def run_suite(counts, batch_sizes, worker_counts, repeat=1, uri=None, seed=0):
+    """
+    Sweep batch sizes and worker counts, ``repeat`` times each.
+
+    Returns
+    -------
+    dict
+        JSON-serialisable report with the machine, the configuration and one
+        entry per (batch_size, workers, repetition).
+    """
+    client, db, raw_inserts = open_target(uri)
+    runs = []
+    try:
+        for batch_size in batch_sizes:
+            for workers in worker_counts:
+                for repetition in range(repeat):
+                    result = run_phases(db, counts, batch_size, workers, seed, raw_inserts)
+                    total = sum(result["phases"].values())
+                    run = {
+                        "batch_size": batch_size,
+                        "workers": workers,
+                        "repetition": repetition,
+                        "seconds": total,
+                        "docs_per_sec": result["documents"] / total if total else None,
+                        **result,
+                    }
+                    if uri is not None:
+                        run["end_to_end_seconds"] = run_end_to_end(uri, counts, batch_size, workers, seed)
+                    runs.append(run)
+        client.drop_database(SUITE_DB_NAME)
+    finally:
+        client.close()
+    return {
+        "machine": machine_info(),
+        "config": {
+            "target": "mongod" if uri is not None else "mongomock",
+            "counts": dict(counts),
+            "batch_sizes": list(batch_sizes),
+            "workers": list(worker_counts),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "runs": runs,
+    }
+
+
+def format_suite(report):
+    """Render the suite runs as a fixed-width table"""
+    header = f"{'batch':>7} {'workers':>7} " + " ".join(f"{phase:>11}" for phase in PHASES) + f" {'docs/s':>10}"
+    lines = [header, "-" * len(header)]
+    for run in report["runs"]:
+        phases = " ".join(f"{run['phases'][phase]:>10.3f}s" for phase in PHASES)
+        rate = f"{run['docs_per_sec']:>10.0f}" if run["docs_per_sec"] else f"{'-':>10}"
+        lines.append(f"{run['batch_size']:>7} {run['workers']:>7} {phases} {rate}")
+    return "\n".join(lines)
+
+
+def run_generator_benchmarks():
+    """Time the in-memory generators and write benchmark_results.txt"""
     benchmarks = [
         ("Generate 100 users", generate_users, 100),
         ("Generate 1000 users", generate_users, 1000),
@@ -72,30 +589,34 @@ def main():
         stats = benchmark_function(func, count)
 
         print(f"   Average time: {stats['avg_time']:.3f}s ± {stats['std_time']:.3f}s")
-        print(f"   Memory usage: {stats['avg_memory']:.1f} MB")
+        print(f"   Peak memory (tracemalloc): {stats['peak_memory']:.1f} MB")
+        print(f"   RSS change (secondary, allocator-dependent): {stats['avg_rss_delta']:.1f} MB")
         print(f"   Records/sec: {count / stats['avg_time']:.0f}\n")
 
         results.append({"operation": name, "count": count, **stats})
 
     # Complex operations
     print("⏱️  Benchmarking: Generate full dataset")
-    start_time = time.time()
-    start_memory = get_memory_usage()
 
-    # Generate the entire dataset to highlight combined memory/time usage.
-    users = generate_users(100)
-    products = generate_products(500)
-    transactions = generate_transactions(users, products, 1000)
-    logs = generate_logs(users, 5000)
+    def generate_dataset():
+        # Generate the entire dataset to highlight combined memory/time usage.
+        users = generate_users(100)
+        products = generate_products(500)
+        transactions = generate_transactions(users, products, 1000)
+        logs = generate_logs(users, 5000)
+        return len(users) + len(products) + len(transactions) + len(logs)
 
-    total_time = time.time() - start_time
-    total_memory = get_memory_usage() - start_memory
+    start_time = time.perf_counter()
+    start_memory = get_memory_usage()
+    total_records = generate_dataset()
+    total_time = time.perf_counter() - start_time
+    total_rss_delta = get_memory_usage() - start_memory
+    total_peak = traced_peak_mb(generate_dataset)
 
     print(f"   Total time: {total_time:.2f}s")
-    print(f"   Total memory: {total_memory:.1f} MB")
-    print(
-        f"   Total records: {len(users) + len(products) + len(transactions) + len(logs)}"
-    )
+    print(f"   Peak memory (tracemalloc): {total_peak:.1f} MB")
+    print(f"   RSS change (secondary, allocator-dependent): {total_rss_delta:.1f} MB")
+    print(f"   Total records: {total_records}")
 
     # Save results
     with open("benchmark_results.txt", "w") as f:
@@ -106,13 +627,85 @@ def main():
             f.write(f"{result['operation']}:\n")
             f.write(f"  Count: {result['count']}\n")
             f.write(f"  Avg Time: {result['avg_time']:.3f}s\n")
-            f.write(f"  Memory: {result['avg_memory']:.1f} MB\n")
+            f.write(f"  Peak memory (tracemalloc): {result['peak_memory']:.1f} MB\n")
+            f.write(f"  RSS change (secondary): {result['avg_rss_delta']:.1f} MB\n")
             f.write(
                 f"  Rate: {result['count'] / result['avg_time']:.0f} records/sec\n\n"
             )
 
     print("\n✅ Benchmark complete! Results saved to benchmark_results.txt")
+    return results
+
+
+def _int_list(value):
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark data generation and seeding.")
+    parser.add_argument("--suite", action="store_true", help="run the seeding suite instead of the generator timings")
+    parser.add_argument("--memory", action="store_true", help="profile generator memory with tracemalloc")
+    parser.add_argument("--top", type=int, default=10, help="call sites listed per generator in --memory mode")
+    parser.add_argument("--scaling", action="store_true", help="run the transactions/logs scaling curves")
+    parser.add_argument("--sizes", type=_size_list, default=SCALING_SIZES, help="N values for --scaling (1k,10M,...)")
+    parser.add_argument(
+        "--catalog-sizes", type=_size_list, default=SCALING_CATALOG_SIZES, help="product catalog sizes for transactions"
+    )
+    parser.add_argument("--scaling-users", type=_size, default=10_000, help="users referenced by transactions/logs")
+    parser.add_argument(
+        "--references", choices=("table", "list"), default="table", help="reference form used for --scaling"
+    )
+    parser.add_argument("--plot", help="also plot the scaling curves to this image (needs matplotlib)")
+    parser.add_argument("--profile", default="tiny", choices=sorted(profiles.PROFILES), help="document counts for the suite")
+    parser.add_argument("--total", type=int, help="total documents, split with the profile ratios")
+    parser.add_argument("--batch-sizes", type=_int_list, default=[100, 1000], help="comma-separated batch sizes")
+    parser.add_argument("--workers", type=_int_list, default=[1], help="comma-separated worker counts")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per configuration")
+    parser.add_argument("--uri", help="benchmark a local mongod instead of mongomock")
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--json", default="benchmark_results.json", help="where to write the suite/memory/scaling report")
+    return parser
+
+
+def main(argv=None):
+    """Run performance benchmarks"""
+    args = build_parser().parse_args(argv)
+    machine = machine_info()
+    print("🚀 MongoDB Faker Generator - Performance Benchmark\n")
+    memory = f", {machine['memory_gb']:.1f} GB RAM" if machine["memory_gb"] is not None else ""
+    print(f"System: {machine['cpus']} CPUs{memory}")
+    print(f"Python: {machine['python']}\n")
+
+    if args.scaling:
+        print("📈 Scaling curves")
+        results = run_scaling(args.sizes, args.catalog_sizes, args.scaling_users, args.references, args.seed)
+        print()
+        print(format_scaling(results))
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"machine": machine, "references": args.references, "scaling": results}, handle, indent=2)
+        if args.plot:
+            plot_scaling(results, args.plot)
+            print(f"🖼️  Plot saved to {args.plot}")
+        print(f"\n✅ Scaling run complete! Results saved to {args.json}")
+        return 0
+    if args.memory:
+        results = run_memory_profile(args.top)
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({"machine": machine, "memory": results}, handle, indent=2)
+        print(f"✅ Memory profile complete! Results saved to {args.json}")
+        return 0
+    if not args.suite:
+        run_generator_benchmarks()
+        return 0
+
+    profile = profiles.get_profile(args.profile).with_overrides(total=args.total)
+    report = run_suite(profile.counts, args.batch_sizes, args.workers, args.repeat, args.uri, args.seed)
+    print(format_suite(report))
+    with open(args.json, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\n✅ Suite complete! Results saved to {args.json}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Benchmark regression gate for CI
+
+Runs the seeding suite from ``benchmark.py`` several times, stores the samples
+as a baseline per machine fingerprint (OS, architecture, CPU count, Python
+implementation and version) and compares later runs against it:
+
+* throughput: documents/sec for every (batch size, workers) configuration;
+* memory: peak traced allocation while streaming the dataset, per batch size.
+
+A metric regresses when a one-sided Mann-Whitney U test rejects "no change" at
+``--alpha`` *and* the median moved by more than the allowed fraction, so noise
+alone does not fail the build. Exit codes: 0 pass (or baseline recorded),
+1 regression, 2 baseline recorded with a different configuration::
+
+    python scripts/benchmark_gate.py --profile tiny --repeat 5          # first run records
+    python scripts/benchmark_gate.py --profile tiny --repeat 5          # later runs gate
+    python scripts/benchmark_gate.py --profile tiny --repeat 5 --update # accept new numbers
+"""
+
+import json
+import math
+import os
+import platform
+import sys
+import time
+from functools import lru_cache
+from statistics import NormalDist, median
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import benchmark  # noqa: E402
+
+DEFAULT_BASELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "baselines")
+BASELINE_VERSION = 1
+
+# Sample-size limit for the exact U distribution; larger samples use the normal approximation.
+EXACT_LIMIT = 30
+
+
+def machine_fingerprint():
+    """Fields a baseline must match before its numbers are comparable"""
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "implementation": platform.python_implementation(),
+        "python": ".".join(platform.python_version_tuple()[:2]),
+    }
+
+
+def fingerprint_slug(fingerprint):
+    return (
+        f"{fingerprint['system']}-{fingerprint['machine']}-{fingerprint['cpus']}cpu-"
+        f"{fingerprint['implementation']}{fingerprint['python']}"
+    ).lower()
+
+
+def baseline_path(baseline_dir, fingerprint):
+    return os.path.join(baseline_dir, f"{fingerprint_slug(fingerprint)}.json")
+
+
+@lru_cache(maxsize=None)
+def _u_frequencies(m, n):
+    """
+    Number of orderings of ``m`` vs ``n`` untied values giving each U = 0..m*n.
+
+    Recurrence on the largest value: it belongs to the first sample (adding
+    ``n`` to U) or to the second (adding nothing).
+    """
+    if m == 0 or n == 0:
+        return (1,)
+    frequencies = [0] * (m * n + 1)
+    for u, count in enumerate(_u_frequencies(m - 1, n)):
+        frequencies[u + n] += count
+    for u, count in enumerate(_u_frequencies(m, n - 1)):
+        frequencies[u] += count
+    return tuple(frequencies)
+
+
+def mann_whitney_less(sample, reference):
+    """
+    One-sided Mann-Whitney U test that ``sample`` tends to be smaller than ``reference``.
+
+    Returns
+    -------
+    tuple
+        ``(u, p_value)`` where ``u`` counts pairs with ``sample > reference``
+        (ties count one half); small ``u`` and ``p_value`` mean ``sample`` is lower.
+    """
+    m, n = len(sample), len(reference)
+    if not m or not n:
+        raise ValueError("both samples need at least one value")
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in sample for y in reference)
+
+    values = sorted(list(sample) + list(reference))
+    tied = any(a == b for a, b in zip(values, values[1:]))
+    if not tied and m <= EXACT_LIMIT and n <= EXACT_LIMIT:
+        frequencies = _u_frequencies(m, n)
+        return u, sum(frequencies[: int(u) + 1]) / math.comb(m + n, m)
+
+    total = m + n
+    tie_term = 0
+    run = 1
+    for a, b in zip(values, values[1:] + [None]):
+        if a == b:
+            run += 1
+            continue
+        tie_term += run**3 - run
+        run = 1
+    variance = m * n / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - m * n / 2 + 0.5) / math.sqrt(variance)
+    return u, NormalDist().cdf(z)
+
+
+def collect_samples(counts, batch_sizes, worker_counts, repeat, uri=None, seed=0):
+    """
+    Run the suite and the memory pass ``repeat`` times and group the samples.
+
+    Returns
+    -------
+    dict
+        ``{"throughput": {"batch=B,workers=W": [docs/sec, ...]},
+        "memory": {"batch=B": [peak bytes, ...]}}``.
+    """
+    report = benchmark.run_suite(counts, batch_sizes, worker_counts, repeat, uri, seed)
+    throughput = {}
+    for run in report["runs"]:
+        key = f"batch={run['batch_size']},workers={run['workers']}"
+        throughput.setdefault(key, []).append(run["docs_per_sec"])
+    memory = {
+        f"batch={batch_size}": [benchmark.measure_generation_peak(counts, batch_size, seed) for _ in range(repeat)]
+        for batch_size in batch_sizes
+    }
+    return {"throughput": throughput, "memory": memory}
+
+
+def compare(baseline, current, alpha=0.05, max_slowdown=0.10, max_memory_growth=0.10):
+    """
+    Compare sample groups; throughput must not drop, memory must not grow.
+
+    Returns
+    -------
+    list of dict
+        One finding per metric/configuration present in both runs, with the
+        medians, relative ``change``, ``p_value`` and ``regression`` flag.
+    """
+    findings = []
+    for metric, limit in (("throughput", max_slowdown), ("memory", max_memory_growth)):
+        for key, current_values in sorted(current.get(metric, {}).items()):
+            baseline_values = baseline.get(metric, {}).get(key)
+            if not baseline_values:
+                continue
+            base, now = median(baseline_values), median(current_values)
+            change = (now - base) / base if base else 0.0
+            if metric == "throughput":
+                _, p_value = mann_whitney_less(current_values, baseline_values)
+                worse = -change > limit
+            else:
+                _, p_value = mann_whitney_less(baseline_values, current_values)
+                worse = change > limit
+            findings.append(
+                {
+                    "metric": metric,
+                    "key": key,
+                    "baseline": base,
+                    "current": now,
+                    "change": change,
+                    "p_value": p_value,
+                    "regression": worse and p_value < alpha,
+                }
+            )
+    return findings
+
+
+def format_findings(findings):
+    lines = [f"{'metric':<11} {'configuration':<22} {'baseline':>12} {'current':>12} {'change':>8} {'p':>7}"]
+    for finding in findings:
+        flag = "  ❌ REGRESSION" if finding["regression"] else ""
+        lines.append(
+            f"{finding['metric']:<11} {finding['key']:<22} {finding['baseline']:>12.1f} {finding['current']:>12.1f} "
+            f"{finding['change']:>+7.1%} {finding['p_value']:>7.3f}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser():
+    parser = benchmark.build_parser()
+    parser.description = "Gate benchmark runs against a stored per-machine baseline."
+    parser.set_defaults(repeat=5, json=None)
+    parser.add_argument("--baseline-dir", default=DEFAULT_BASELINE_DIR, help="directory holding baseline files")
+    parser.add_argument("--update", action="store_true", help="record this run as the new baseline")
+    parser.add_argument("--alpha", type=float, default=0.05, help="significance level of the U test")
+    parser.add_argument("--max-slowdown", type=float, default=0.10, help="tolerated median throughput drop")
+    parser.add_argument("--max-memory-growth", type=float, default=0.10, help="tolerated median peak-memory growth")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    fingerprint = machine_fingerprint()
+    profile = benchmark.profiles.get_profile(args.profile).with_overrides(total=args.total)
+    config = {
+        "target": "mongod" if args.uri else "mongomock",
+        "counts": dict(profile.counts),
+        "batch_sizes": args.batch_sizes,
+        "workers": args.workers,
+        "seed": args.seed,
+    }
+    path = baseline_path(args.baseline_dir, fingerprint)
+    print(f"🖥️  Machine: {fingerprint_slug(fingerprint)}")
+
+    baseline = None
+    if os.path.exists(path) and not args.update:
+        with open(path, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        if baseline.get("config") != config:
+            print(f"⚠️  Baseline {path} was recorded with a different configuration:")
+            print(f"   baseline: {baseline.get('config')}\n   current:  {config}")
+            return 2
+
+    samples = collect_samples(profile.counts, args.batch_sizes, args.workers, args.repeat, args.uri, args.seed)
+
+    if baseline is None:
+        os.makedirs(args.baseline_dir, exist_ok=True)
+        record = {
+            "version": BASELINE_VERSION,
+            "fingerprint": fingerprint,
+            "config": config,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "samples": samples,
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(record, handle, indent=2)
+        print(f"📌 Baseline recorded in {path}")
+        return 0
+
+    findings = compare(baseline["samples"], samples, args.alpha, args.max_slowdown, args.max_memory_growth)
+    print(format_findings(findings))
+    regressions = [finding for finding in findings if finding["regression"]]
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            report = {"fingerprint": fingerprint, "config": config, "samples": samples, "findings": findings}
+            json.dump(report, handle, indent=2)
+    if regressions:
+        print(f"\n❌ {len(regressions)} significant regression(s) against {path}")
+        return 1
+    print("\n✅ No significant regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
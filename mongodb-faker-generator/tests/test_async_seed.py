@@ -0,0 +1,142 @@
+"""Tests for the asyncio seeding path using an in-memory async database."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import async_seed  # noqa: E402
+from python import generate_fake_data as fake_data  # noqa: E402
+
+
+class AsyncCollection:
+    def __init__(self, db, fail=False):
+        self.db = db
+        self.docs = []
+        self.indexes = []
+        self.fail = fail
+
+    async def drop(self):
+        self.docs = []
+
+    async def insert_many(self, docs, ordered=True):
+        assert ordered is False
+        self.db.in_flight += 1
+        self.db.peak = max(self.db.peak, self.db.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self.fail:
+                raise RuntimeError("write concern timeout")
+            self.docs.extend(docs)
+        finally:
+            self.db.in_flight -= 1
+
+    async def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+
+class AsyncDB(dict):
+    def __init__(self, fail=False):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+        self.fail = fail
+
+    def __missing__(self, name):
+        self[name] = AsyncCollection(self, self.fail)
+        return self[name]
+
+
+class SyncCollection:
+    def __init__(self):
+        self.docs = []
+
+    def drop(self):
+        self.docs = []
+
+    def insert_many(self, docs):
+        self.docs.extend(docs)
+
+    def create_index(self, keys, **kwargs):
+        pass
+
+
+class SyncDB(dict):
+    def __missing__(self, name):
+        self[name] = SyncCollection()
+        return self[name]
+
+    def command(self, cmd):
+        return {"db": "sync", "collections": len(self), "dataSize": 0}
+
+
+def test_async_seed_bounds_in_flight_batches():
+    db = AsyncDB()
+    asyncio.run(async_seed.seed_async(db, 4, 4, 30, 40, batch_size=3, max_in_flight=3))
+    assert [len(db[name].docs) for name in ("users", "products", "transactions", "logs")] == [4, 4, 30, 40]
+    assert 1 < db.peak <= 3
+    assert all(db[name].indexes for name in fake_data.INDEX_SPECS)
+
+
+def test_async_seed_matches_sync_documents(monkeypatch):
+    fake_data.seed_generators(11)
+    async_db = AsyncDB()
+    asyncio.run(async_seed.seed_async(async_db, 3, 4, 6, 8, batch_size=2, max_in_flight=4))
+
+    sync_db = SyncDB()
+    monkeypatch.setattr(fake_data, "db", sync_db)
+    fake_data.seed_generators(11)
+    fake_data.insert_data_streaming(3, 4, 6, 8, batch_size=2)
+
+    assert [u["_id"] for u in async_db["users"].docs] == [u["_id"] for u in sync_db["users"].docs]
+    assert [t["orderId"] for t in async_db["transactions"].docs] == [t["orderId"] for t in sync_db["transactions"].docs]
+    assert [t["items"] for t in async_db["transactions"].docs] == [t["items"] for t in sync_db["transactions"].docs]
+    assert [log["sessionId"] for log in async_db["logs"].docs] == [log["sessionId"] for log in sync_db["logs"].docs]
+
+
+def test_async_seed_propagates_insert_errors():
+    with pytest.raises(RuntimeError):
+        asyncio.run(async_seed.seed_async(AsyncDB(fail=True), 2, 2, 2, 2, batch_size=1))
+    with pytest.raises(ValueError):
+        asyncio.run(async_seed.seed_async(AsyncDB(), max_in_flight=0))
+
+
+def test_deferred_indexes_are_built_after_loading(monkeypatch):
+    db = AsyncDB()
+    logs_at_index_time = []
+
+    class FakeMotorClient:
+        def __init__(self, uri):
+            self.uri = uri
+
+        def __getitem__(self, name):
+            return db
+
+        def close(self):
+            pass
+
+    async def dbstats(cmd):
+        return {"db": "async", "collections": len(db), "dataSize": 0}
+
+    original = AsyncCollection.create_index
+
+    async def create_index(self, keys, **kwargs):
+        logs_at_index_time.append(len(db["logs"].docs))
+        await original(self, keys, **kwargs)
+
+    monkeypatch.setattr(AsyncCollection, "create_index", create_index)
+    db.command = dbstats
+    motor = type(sys)("motor")
+    motor.motor_asyncio = type(sys)("motor.motor_asyncio")
+    motor.motor_asyncio.AsyncIOMotorClient = FakeMotorClient
+    monkeypatch.setitem(sys.modules, "motor", motor)
+    monkeypatch.setitem(sys.modules, "motor.motor_asyncio", motor.motor_asyncio)
+
+    async_seed.insert_data_async(2, 2, 3, 4, batch_size=2, uri="mongodb://x/", db_name="async", defer_indexes=True)
+    assert all(db[name].indexes for name in fake_data.INDEX_SPECS)
+    assert logs_at_index_time and set(logs_at_index_time) == {4}
@@ -0,0 +1,97 @@
+"""Tests for the seeding benchmark suite in scripts/benchmark.py."""
+
+import importlib.util
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "scripts", "benchmark.py")
+
+pytest.importorskip("mongomock")
+
+
+def load_benchmark():
+    spec = importlib.util.spec_from_file_location("benchmark_script", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+COUNTS = {"users": 6, "products": 8, "transactions": 12, "logs": 20}
+
+
+def test_suite_reports_each_phase_per_configuration():
+    benchmark = load_benchmark()
+    report = benchmark.run_suite(COUNTS, batch_sizes=[5, 50], worker_counts=[1], repeat=2)
+
+    assert report["config"]["target"] == "mongomock"
+    assert [(run["batch_size"], run["repetition"]) for run in report["runs"]] == [(5, 0), (5, 1), (50, 0), (50, 1)]
+    for run in report["runs"]:
+        assert set(run["phases"]) == set(benchmark.PHASES)
+        assert run["documents"] == sum(COUNTS.values())
+        assert run["collections"]["logs"]["bson_bytes"] > 0
+    json.loads(json.dumps(report))
+    assert "batch" in benchmark.format_suite(report)
+
+
+def test_main_writes_suite_json(tmp_path):
+    benchmark = load_benchmark()
+    target = tmp_path / "suite.json"
+    assert benchmark.main(["--suite", "--total", "40", "--batch-sizes", "10", "--json", str(target)]) == 0
+    report = json.loads(target.read_text())
+    assert report["runs"][0]["workers"] == 1
+    assert report["machine"]["cpus"] == os.cpu_count()
+
+
+def test_benchmark_function_leads_with_the_traced_peak():
+    benchmark = load_benchmark()
+    stats = benchmark.benchmark_function(lambda n: [bytes(1024) for _ in range(n)], 2048, iterations=2)
+    assert stats["peak_memory"] >= 2.0
+    assert "avg_rss_delta" in stats
+
+
+def test_field_path_maps_generator_lines_to_document_fields():
+    benchmark = load_benchmark()
+    source = open(benchmark.GENERATOR_FILE, encoding="utf-8").read().splitlines()
+    bio = next(i for i, line in enumerate(source, 1) if '"bio": fake.text' in line)
+    longitude = next(i for i, line in enumerate(source, 1) if "float(fake.longitude())" in line)
+    assert benchmark.field_path(benchmark.GENERATOR_FILE, bio) == "profile.bio"
+    assert benchmark.field_path(benchmark.GENERATOR_FILE, longitude) == "profile.address.coordinates.coordinates"
+    assert benchmark.field_path(benchmark.GENERATOR_FILE, 1) is None
+
+
+def test_profile_memory_reports_per_document_bytes_and_call_sites():
+    benchmark = load_benchmark()
+    benchmark.fake_data.seed_generators(1)
+    benchmark.generate_users(1)
+    stats = benchmark.profile_memory(benchmark.generate_users, 20, count=20, top=5)
+
+    assert stats["peak_bytes"] >= stats["retained_bytes"] > 0
+    assert stats["retained_bytes_per_doc"] == stats["retained_bytes"] / 20
+    assert len(stats["call_sites"]) == 6 and stats["call_sites"][-1]["line"] is None
+    assert "profile" in stats["sections"]
+    fields = [site["field"] for site in stats["call_sites"]]
+    assert any(field and field.startswith("profile") for field in fields)
+
+
+def test_scaling_curves_cover_catalog_sizes_and_logs():
+    benchmark = load_benchmark()
+    assert benchmark._size_list("1k, 2.5M,300") == [1_000, 2_500_000, 300]
+
+    results = benchmark.run_scaling([20, 40], [5, 50], n_users=10, sample_every=10, echo=lambda line: None)
+    assert [(p["catalog"], p["n"]) for p in results["transactions"]] == [(5, 20), (5, 40), (50, 20), (50, 40)]
+    assert [p["n"] for p in results["logs"]] == [20, 40]
+    assert all(p["records_per_sec"] > 0 and p["bson_bytes_per_doc"] > 0 for points in results.values() for p in points)
+    assert "transactions" in benchmark.format_scaling(results)
+
+
+def test_reference_stubs_forms_hold_the_same_keys():
+    benchmark = load_benchmark()
+    user_table, product_table = benchmark.reference_stubs(3, 4, "table", seed=2)
+    users, products = benchmark.reference_stubs(3, 4, "list", seed=2)
+    assert list(user_table) == users
+    assert [p["sku"] for p in product_table] == [p["sku"] for p in products]
+    with pytest.raises(ValueError):
+        benchmark.reference_stubs(1, 1, "tuple")
@@ -0,0 +1,73 @@
+"""Tests for the benchmark regression gate in scripts/benchmark_gate.py."""
+
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = os.path.join(ROOT, "scripts")
+
+pytest.importorskip("mongomock")
+
+
+@pytest.fixture(scope="module")
+def gate():
+    sys.path.insert(0, SCRIPTS)
+    try:
+        spec = importlib.util.spec_from_file_location("benchmark_gate", os.path.join(SCRIPTS, "benchmark_gate.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.path.remove(SCRIPTS)
+
+
+def test_mann_whitney_exact_and_tied_p_values(gate):
+    assert gate.mann_whitney_less([1, 2, 3], [4, 5, 6]) == (0.0, pytest.approx(1 / 20))
+    assert gate.mann_whitney_less([4, 5, 6], [1, 2, 3])[1] == pytest.approx(1.0)
+    _, p_tied = gate.mann_whitney_less([1, 1, 2, 2, 3], [3, 4, 4, 5, 5])
+    assert p_tied < 0.05
+    assert gate.mann_whitney_less([7, 7], [7, 7])[1] == 1.0
+
+
+def test_compare_requires_significance_and_threshold(gate):
+    baseline = {"throughput": {"b": [100, 101, 99, 100, 102]}, "memory": {"b": [1000] * 5}}
+    slower = {"throughput": {"b": [80, 81, 79, 82, 80]}, "memory": {"b": [1001] * 5}}
+    findings = {f["metric"]: f for f in gate.compare(baseline, slower)}
+    assert findings["throughput"]["regression"]
+    assert not findings["memory"]["regression"]  # significant but within 10%
+
+    noisy = {"throughput": {"b": [95, 104, 98, 101, 99]}, "memory": {"b": [1300] * 5}}
+    findings = {f["metric"]: f for f in gate.compare(baseline, noisy)}
+    assert not findings["throughput"]["regression"]
+    assert findings["memory"]["regression"]
+
+
+def test_main_records_then_gates(gate, tmp_path, monkeypatch):
+    runs = iter(
+        [
+            {"throughput": {"batch=10,workers=1": [100.0, 101.0, 102.0, 99.0, 100.0]}, "memory": {"batch=10": [500] * 5}},
+            {"throughput": {"batch=10,workers=1": [60.0, 61.0, 59.0, 62.0, 60.0]}, "memory": {"batch=10": [500] * 5}},
+        ]
+    )
+    monkeypatch.setattr(gate, "collect_samples", lambda *args: next(runs))
+    argv = ["--total", "40", "--batch-sizes", "10", "--baseline-dir", str(tmp_path)]
+
+    assert gate.main(argv) == 0
+    (baseline_file,) = tmp_path.iterdir()
+    assert baseline_file.name == gate.fingerprint_slug(gate.machine_fingerprint()) + ".json"
+    assert json.loads(baseline_file.read_text())["fingerprint"]["cpus"] == os.cpu_count()
+
+    assert gate.main(argv) == 1
+    assert gate.main(argv + ["--seed", "3"]) == 2
+
+
+def test_collect_samples_groups_by_configuration(gate):
+    counts = {"users": 3, "products": 3, "transactions": 4, "logs": 4}
+    samples = gate.collect_samples(counts, [2], [1], 2)
+    assert list(samples["throughput"]) == ["batch=2,workers=1"]
+    assert len(samples["throughput"]["batch=2,workers=1"]) == 2
+    assert all(peak > 0 for peak in samples["memory"]["batch=2"])
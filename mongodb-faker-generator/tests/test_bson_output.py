@@ -0,0 +1,120 @@
+"""Tests for pre-encoded BSON seeding and .bson dump round-trips."""
+
+import json
+import os
+import sys
+
+import bson
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import bson_output  # noqa: E402
+from python import generate_fake_data as fake_data  # noqa: E402
+
+
+class RawRecorder:
+    """Collection stand-in that decodes RawBSONDocument inserts (mongomock rejects them)."""
+
+    def __init__(self):
+        self.calls = []
+        self.docs = []
+        self.indexes = []
+
+    def drop(self):
+        self.docs = []
+
+    def insert_many(self, docs, ordered=True):
+        docs = list(docs)
+        self.calls.append((docs, ordered))
+        self.docs.extend(bson.decode(doc.raw) for doc in docs)
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+
+class RawRecordingDB(dict):
+    def __missing__(self, name):
+        self[name] = RawRecorder()
+        return self[name]
+
+
+@pytest.fixture
+def mock_db(monkeypatch):
+    db = RawRecordingDB()
+    monkeypatch.setattr(fake_data, "db", db)
+    monkeypatch.setattr(fake_data, "_print_db_stats", lambda: None)
+    return db
+
+
+def test_insert_raw_batches_wraps_bytes():
+    recorder = RawRecorder()
+    batches = [[bson.encode({"a": 1}), bson.encode({"a": 2})], [], [bson.encode({"a": 3})]]
+    assert bson_output.insert_raw_batches(recorder, batches) == 3
+    assert len(recorder.calls) == 2
+    docs, ordered = recorder.calls[0]
+    assert not ordered
+    assert [doc["a"] for doc in docs] == [1, 2]
+    assert [doc["a"] for doc in recorder.docs] == [1, 2, 3]
+
+
+def test_bson_file_round_trip(tmp_path):
+    path = str(tmp_path / "docs.bson")
+    raw = [bson.encode({"n": i, "nested": {"x": [i, i]}}) for i in range(7)]
+    assert bson_output.write_bson_file(path, [raw[:4], raw[4:]]) == 7
+    batches = list(bson_output.iter_bson_file(path, batch_size=3))
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert [doc for batch in batches for doc in batch] == raw
+
+
+def test_truncated_bson_file_is_rejected(tmp_path):
+    path = tmp_path / "broken.bson"
+    path.write_bytes(bson.encode({"a": 1})[:-2])
+    with pytest.raises(ValueError):
+        list(bson_output.iter_bson_file(str(path)))
+
+
+def test_dump_and_replay_reproduce_dataset(tmp_path, mock_db):
+    paths = bson_output.dump_dataset(
+        str(tmp_path), db_name="demo", n_users=4, n_products=5, n_transactions=6, n_logs=7, chunk_size=3
+    )
+    assert sorted(paths) == sorted(bson_output.COLLECTIONS)
+
+    bson_output.insert_from_dump(str(tmp_path / "demo"))
+    assert len(mock_db["users"].docs) == 4
+    assert len(mock_db["logs"].docs) == 7
+    assert mock_db["logs"].indexes
+    user_ids = {user["_id"] for user in mock_db["users"].docs}
+    assert {order["userId"] for order in mock_db["transactions"].docs} <= user_ids
+
+
+def test_insert_data_bson_matches_dump(tmp_path, mock_db):
+    bson_output.insert_data_bson(n_users=3, n_products=3, n_transactions=4, n_logs=5, seed=2, chunk_size=2)
+    orders = sorted(doc["orderId"] for doc in mock_db["transactions"].docs)
+    assert len(orders) == 4
+
+    bson_output.dump_dataset(
+        str(tmp_path), db_name="d", n_users=3, n_products=3, n_transactions=4, n_logs=5, seed=2, chunk_size=2
+    )
+    batches = bson_output.iter_bson_file(str(tmp_path / "d" / "transactions.bson"))
+    dumped = [bson.decode(raw) for batch in batches for raw in batch]
+    assert sorted(doc["orderId"] for doc in dumped) == orders
+
+
+def test_dump_writes_index_metadata_for_mongorestore(tmp_path):
+    bson_output.dump_dataset(str(tmp_path), n_users=1, n_products=1, n_transactions=1, n_logs=1)
+    target = tmp_path / fake_data.DEFAULT_DB_NAME
+    with open(target / "users.metadata.json", encoding="utf-8") as handle:
+        metadata = json.load(handle)
+
+    assert metadata["collectionName"] == "users"
+    indexes = {index["name"]: index for index in metadata["indexes"]}
+    assert indexes["_id_"]["key"] == {"_id": 1}
+    assert indexes["email_1"] == {"v": 2, "key": {"email": 1}, "name": "email_1", "unique": True}
+    assert indexes["profile.address.coordinates_2dsphere"]["key"] == {"profile.address.coordinates": "2dsphere"}
+    for name in bson_output.COLLECTIONS:
+        assert (target / f"{name}.metadata.json").exists()
+    logs = bson_output.index_metadata("logs")["indexes"]
+    assert {"timestamp": 1} in [index["key"] for index in logs if "expireAfterSeconds" in index]
@@ -0,0 +1,117 @@
+"""Tests for resumable, checkpointed seeding."""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import checkpoint  # noqa: E402
+from python import generate_fake_data as fake_data  # noqa: E402
+
+mongomock = pytest.importorskip("mongomock")
+
+COUNTS = dict(n_users=5, n_products=6, n_transactions=9, n_logs=11, seed=4, batch_size=4)
+REFERENCE_TIME = datetime(2024, 3, 1, 12, 0)
+
+
+def _snapshot(db):
+    """Full collection contents keyed by _id."""
+    return {name: {str(doc["_id"]): doc for doc in db[name].find()} for name in checkpoint.COLLECTIONS}
+
+
+@pytest.fixture
+def mock_db(monkeypatch):
+    db = mongomock.MongoClient()["checkpoint_test"]
+    monkeypatch.setattr(fake_data, "db", db)
+    monkeypatch.setattr(fake_data, "_print_db_stats", lambda: None)
+    return db
+
+
+def test_uninterrupted_run_completes_checkpoint(tmp_path, mock_db):
+    path = str(tmp_path / "seed.json")
+    state = checkpoint.insert_data_resumable(path, **COUNTS)
+    assert state.complete
+    assert mock_db.logs.count_documents({}) == 11
+    saved = json.load(open(path))
+    assert saved["collections"]["logs"]["next_batch"] == 3
+    assert saved["collections"]["logs"]["rng_seed"] is None
+
+
+def test_resume_after_crash_matches_uninterrupted(tmp_path, mock_db, monkeypatch):
+    checkpoint.insert_data_resumable(str(tmp_path / "full.json"), now=REFERENCE_TIME, **COUNTS)
+    expected = _snapshot(mock_db)
+    for name in checkpoint.COLLECTIONS:
+        mock_db[name].drop()
+
+    # Crash on the second transactions batch after half of it reached the server.
+    collection_cls = type(mock_db.transactions)
+    original = collection_cls.insert_many
+    calls = {"n": 0}
+
+    def flaky_insert(self, docs, *args, **kwargs):
+        if self.name == "transactions":
+            calls["n"] += 1
+            if calls["n"] == 2:
+                original(self, docs[:2], *args, **kwargs)
+                raise RuntimeError("connection lost")
+        return original(self, docs, *args, **kwargs)
+
+    monkeypatch.setattr(collection_cls, "insert_many", flaky_insert)
+    path = str(tmp_path / "crash.json")
+    with pytest.raises(RuntimeError):
+        checkpoint.insert_data_resumable(path, now=REFERENCE_TIME, **COUNTS)
+    saved = json.load(open(path))
+    assert saved["collections"]["transactions"]["next_batch"] == 1
+    assert saved["collections"]["transactions"]["rng_seed"] is not None
+
+    # The resumed run keeps the checkpoint's reference time, not the wall clock.
+    monkeypatch.setattr(collection_cls, "insert_many", original)
+    state = checkpoint.insert_data_resumable(path, **COUNTS)
+    assert state.complete
+    assert state.params["now"] == REFERENCE_TIME.isoformat()
+    assert _snapshot(mock_db) == expected
+    assert fake_data.reference_time() != REFERENCE_TIME
+
+
+def test_resume_clears_stale_data_in_collections_not_reached_before_the_crash(tmp_path, mock_db, monkeypatch):
+    checkpoint.insert_data_resumable(str(tmp_path / "full.json"), now=REFERENCE_TIME, **COUNTS)
+    expected = _snapshot(mock_db)
+    for name in checkpoint.COLLECTIONS:
+        mock_db[name].drop()
+    # Leftovers from an earlier seed, without the orderId the unique index needs.
+    mock_db.transactions.insert_many([{"stale": i} for i in range(50)])
+
+    collection_cls = type(mock_db.users)
+    original = collection_cls.insert_many
+    calls = {"n": 0}
+
+    def flaky_insert(self, docs, *args, **kwargs):
+        if self.name == "users":
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise RuntimeError("connection lost")
+        return original(self, docs, *args, **kwargs)
+
+    monkeypatch.setattr(collection_cls, "insert_many", flaky_insert)
+    path = str(tmp_path / "crash.json")
+    with pytest.raises(RuntimeError):
+        checkpoint.insert_data_resumable(path, now=REFERENCE_TIME, **COUNTS)
+    assert mock_db.transactions.count_documents({}) == 50
+
+    monkeypatch.setattr(collection_cls, "insert_many", original)
+    checkpoint.insert_data_resumable(path, **COUNTS)
+    assert mock_db.transactions.count_documents({"stale": {"$exists": True}}) == 0
+    assert _snapshot(mock_db) == expected
+
+
+def test_mismatched_parameters_are_rejected(tmp_path, mock_db):
+    path = str(tmp_path / "seed.json")
+    checkpoint.insert_data_resumable(path, **COUNTS)
+    with pytest.raises(ValueError):
+        checkpoint.insert_data_resumable(path, **{**COUNTS, "seed": 5})
@@ -0,0 +1,113 @@
+"""Tests for scale profiles and the seeder CLI."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import cli  # noqa: E402
+from python import generate_fake_data as fake_data  # noqa: E402
+from python import profiles, value_pools  # noqa: E402
+
+
+def test_lab_profile_matches_classroom_sizes():
+    lab = profiles.get_profile("lab")
+    assert lab.counts == {"users": 100, "products": 500, "transactions": 1000, "logs": 5000}
+    assert profiles.counts_for_total(660) == {"users": 10, "products": 50, "transactions": 100, "logs": 500}
+    assert profiles.get_profile("100M").total == pytest.approx(100_000_000, rel=1e-6)
+    with pytest.raises(ValueError):
+        profiles.get_profile("huge")
+
+
+def test_overrides_rescale_and_replace_counts():
+    profile = profiles.get_profile("lab").with_overrides(total=6600, logs=7, batch_size=None, uri="mongodb://x/")
+    assert profile.counts["users"] == 100
+    assert profile.counts["logs"] == 7
+    assert profile.batch_size == profiles.get_profile("lab").batch_size
+    assert profile.uri == "mongodb://x/"
+
+
+def test_strategy_switches_when_data_does_not_fit():
+    lab = profiles.get_profile("lab")
+    assert profiles.choose_strategy(lab, memory_budget=8 * 1024**3) == "eager"
+    assert profiles.choose_strategy(lab, memory_budget=1024) == "streaming"
+    mid = profiles.get_profile("1M").with_overrides(workers=4)
+    assert profiles.choose_strategy(mid, memory_budget=8 * 1024**3) == "parallel"
+
+
+def test_parallel_needs_room_for_a_reference_table_per_worker():
+    big = profiles.get_profile("100M").with_overrides(workers=4)
+    assert big.parallel_memory_bytes() > 8 * 1024**3 * profiles.EAGER_MEMORY_FRACTION
+    assert profiles.choose_strategy(big, memory_budget=8 * 1024**3) == "streaming"
+    assert profiles.choose_strategy(big, memory_budget=64 * 1024**3) == "parallel"
+
+
+def test_dry_run_prints_plan(capsys):
+    assert cli.main(["--profile", "tiny", "--dry-run", "--memory-budget-mb", "1024"]) == 0
+    out = capsys.readouterr().out
+    assert "mode=eager" in out
+    assert "users=10" in out
+
+
+def test_checkpoint_implies_resumable_mode():
+    args = cli.build_parser().parse_args(["--checkpoint", "seed.json"])
+    assert cli.resolve_mode(args, cli.resolve_profile(args)) == "resumable"
+    with pytest.raises(SystemExit):
+        cli.main(["--mode", "resumable"])
+
+
+def test_main_dispatches_to_streaming_seeder(monkeypatch):
+    calls = {}
+    monkeypatch.setattr(fake_data, "configure_database", lambda uri, name: calls.setdefault("db", (uri, name)))
+    monkeypatch.setattr(fake_data, "insert_data_streaming", lambda **kwargs: calls.setdefault("seed", kwargs))
+
+    code = cli.main(["--profile", "tiny", "--mode", "streaming", "--database", "cli_db", "--users", "3"])
+
+    assert code == 0
+    assert calls["db"] == (fake_data.DEFAULT_MONGO_URI, "cli_db")
+    assert calls["seed"]["n_users"] == 3
+    assert calls["seed"]["batch_size"] == 100
+
+
+def test_pipelined_mode_forwards_insert_limits(monkeypatch):
+    from python import pipeline
+
+    calls = {}
+    monkeypatch.setattr(fake_data, "configure_database", lambda uri, name: None)
+    monkeypatch.setattr(pipeline, "insert_data_pipelined", lambda **kwargs: calls.setdefault("seed", kwargs))
+
+    assert cli.main(["--profile", "tiny", "--mode", "pipelined", "--insert-workers", "6", "--max-in-flight", "12"]) == 0
+    assert calls["seed"]["insert_workers"] == 6
+    assert calls["seed"]["max_in_flight"] == 12
+
+
+def test_pooled_flag_routes_generation_through_value_pools(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(fake_data, "configure_database", lambda uri, name: None)
+    monkeypatch.setattr(fake_data, "insert_data_streaming", lambda **kwargs: seen.setdefault("fake", fake_data.fake))
+    original = fake_data.get_faker()
+
+    assert cli.main(["--profile", "tiny", "--mode", "streaming", "--pooled"]) == 0
+    assert isinstance(seen["fake"], value_pools.PooledFaker)
+    assert fake_data.fake is original
+
+
+def test_pooled_flag_is_rejected_for_worker_process_modes():
+    with pytest.raises(SystemExit):
+        cli.main(["--profile", "tiny", "--mode", "parallel", "--pooled"])
+
+
+def test_seed_makes_in_process_modes_reproducible(monkeypatch):
+    runs = []
+    monkeypatch.setattr(fake_data, "configure_database", lambda uri, name: None)
+    monkeypatch.setattr(
+        fake_data, "insert_data_streaming", lambda **kwargs: runs.append([u["_id"] for u in fake_data.generate_users(3)])
+    )
+
+    for _ in range(2):
+        assert cli.main(["--profile", "tiny", "--mode", "streaming", "--seed", "5"]) == 0
+    assert runs[0] == runs[1]
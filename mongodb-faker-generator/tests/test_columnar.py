@@ -0,0 +1,62 @@
+"""Tests for the NumPy columnar products/logs backend."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+pytest.importorskip("numpy")
+
+from bson import BSON  # noqa: E402
+
+from python import columnar  # noqa: E402
+from python import generate_fake_data as fake_data  # noqa: E402
+
+
+def test_products_keep_inventory_and_discount_rules():
+    products = columnar.generate_products_columnar(400, batch_size=150, seed=5)
+    assert len(products) == 400
+    discounted = 0
+    for product in products:
+        assert 10 <= product["price"]["amount"] <= 1000
+        assert 0 <= product["price"]["discount"] <= 30
+        discounted += product["price"]["discount"] > 0
+        if not product["price"]["discount"]:
+            assert type(product["price"]["discount"]) is int
+        if not product["inventory"]["inStock"]:
+            assert product["inventory"]["quantity"] == 0
+        assert 1 <= len(product["images"]) <= 5
+        assert 1 <= product["ratings"]["average"] <= 5
+        if product["category"] != "Clothing":
+            assert product["attributes"]["size"] is None
+    # 30% discount chance: allow generous slack for 400 samples.
+    assert 60 < discounted < 180
+    # Values must be plain Python types so PyMongo can encode them.
+    BSON.encode(products[0])
+
+
+def test_logs_follow_level_cycle_and_user_references():
+    users = fake_data.generate_users(4)
+    logs = columnar.generate_logs_columnar(users, 50, batch_size=4, seed=1)
+    assert [log["level"] for log in logs[:6]] == columnar.LEVEL_CYCLE
+    user_ids = {user["_id"] for user in users}
+    for log in logs:
+        assert log["userId"] is None or log["userId"] in user_ids
+        assert log["metadata"]["statusCode"] in columnar.STATUS_CODES
+        assert 10 <= log["metadata"]["responseTime"] <= 3000
+    BSON.encode(logs[0])
+
+
+def test_seed_makes_numeric_columns_reproducible():
+    first = columnar.generate_products_columnar(20, seed=9)
+    second = columnar.generate_products_columnar(20, seed=9)
+    assert [p["price"] for p in first] == [p["price"] for p in second]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        columnar.generate_products_columnar(1, batch_size=0)
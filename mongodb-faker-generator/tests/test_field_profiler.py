@@ -0,0 +1,57 @@
+"""Tests for the per-field generation cost profiler."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import field_profiler  # noqa: E402
+from python import generate_fake_data as fake_data  # noqa: E402
+from python.value_pools import pooled_generation  # noqa: E402
+
+
+def _line_of(fragment):
+    with open(field_profiler.GENERATOR_FILE, encoding="utf-8") as handle:
+        return next(i for i, line in enumerate(handle, 1) if fragment in line)
+
+
+def test_field_path_follows_nested_document_literals():
+    assert field_profiler.field_path(field_profiler.GENERATOR_FILE, _line_of('"bio": fake.text')) == "profile.bio"
+    assert (
+        field_profiler.field_path(field_profiler.GENERATOR_FILE, _line_of("float(fake.longitude())"))
+        == "profile.address.coordinates.coordinates"
+    )
+    assert field_profiler.field_path(field_profiler.GENERATOR_FILE, 1) is None
+
+
+def test_profiled_generation_counts_calls_per_field_and_restores_faker():
+    original = fake_data.get_faker()
+    with field_profiler.profiled_generation() as profile:
+        assert isinstance(fake_data.get_faker(), field_profiler.ProfilingFaker)
+        fake_data.generate_users(4)
+        fake_data.generate_products(3)
+    assert fake_data.get_faker() is original
+
+    rows = {(row["function"], row["field"]): row for row in profile.ranked()}
+    assert rows[("iter_users", "profile.bio")]["calls"] == 4
+    assert rows[("iter_users", "metadata.userAgent")]["calls"] == 4
+    # fake.random.uniform is profiled through the wrapped Random instance.
+    assert rows[("iter_products", "price.amount")]["calls"] == 3
+    assert profile.elapsed >= profile.attributed_seconds > 0
+    assert "profile.bio" in profile.format_table(top=50)
+
+
+def test_profiling_keeps_seeded_output_and_composes_with_pools():
+    fake_data.seed_generators(21)
+    plain = fake_data.generate_users(3)
+    fake_data.seed_generators(21)
+    with field_profiler.profiled_generation():
+        profiled = fake_data.generate_users(3)
+    assert [u["_id"] for u in profiled] == [u["_id"] for u in plain]
+
+    with pooled_generation(fields=("logs.metadata.userAgent",), pool_size=4, seed=1):
+        profile = field_profiler.profile_dataset(2, 2, 3, 5, seed=4)
+    fields = {row["field"] for row in profile.ranked()}
+    assert {"orderId", "sessionId", "metadata.userAgent"} <= fields
@@ -0,0 +1,73 @@
+"""Import-time budget for python.generate_fake_data.
+
+Importing the generators must stay cheap: no Faker locale loading, no pymongo
+import and no MongoClient monitor threads until something actually needs them.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous enough for slow CI runners; eager Faker + MongoClient setup took ~0.25s.
+IMPORT_BUDGET_SECONDS = 0.15
+
+PROBE = """
+import json, sys, threading, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import python.generate_fake_data as module
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "threads": threading.active_count(),
+    "faker_loaded": "faker" in sys.modules,
+    "pymongo_loaded": "pymongo" in sys.modules,
+    "lazy_globals": sorted(name for name in ("fake", "client", "db") if name in vars(module)),
+}}))
+"""
+
+
+def _probe():
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(root=ROOT)], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+@pytest.mark.performance
+def test_import_is_lazy_and_under_budget():
+    runs = [_probe() for _ in range(3)]
+    fastest = min(runs, key=lambda run: run["seconds"])
+    assert fastest["lazy_globals"] == []
+    assert not fastest["faker_loaded"]
+    assert not fastest["pymongo_loaded"]
+    assert fastest["threads"] == 1
+    assert fastest["seconds"] < IMPORT_BUDGET_SECONDS
+
+
+def test_lazy_globals_are_created_on_first_use(monkeypatch):
+    sys.path.insert(0, ROOT)
+    from python import generate_fake_data as fake_data
+
+    monkeypatch.delitem(vars(fake_data), "fake", raising=False)
+    assert "fake" not in vars(fake_data)
+    faker = fake_data.get_faker()
+    assert fake_data.fake is faker
+    assert fake_data.get_faker() is faker
+
+
+def test_configure_database_defers_connection(monkeypatch):
+    sys.path.insert(0, ROOT)
+    from python import generate_fake_data as fake_data
+
+    monkeypatch.setattr(fake_data, "_mongo_settings", dict(fake_data._mongo_settings))
+    fake_data.configure_database("mongodb://example.invalid:27017/", "lazy_db")
+    assert "client" not in vars(fake_data)
+    assert fake_data.get_db().name == "lazy_db"
+    fake_data.close_client()
+    assert "db" not in vars(fake_data)
@@ -0,0 +1,132 @@
+"""Tests for the continuous mixed-workload load generator."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import generate_fake_data as fake_data  # noqa: E402
+from python import load_generator as lg  # noqa: E402
+
+mongomock = pytest.importorskip("mongomock")
+
+
+@pytest.fixture
+def seeded_db(monkeypatch):
+    db = mongomock.MongoClient()["load_test"]
+    users = fake_data.generate_users(5)
+    products = fake_data.generate_products(5)
+    db.users.insert_many(users)
+    db.products.insert_many(products)
+    db.transactions.insert_many(fake_data.generate_transactions(users, products, 5))
+    db.logs.insert_many(fake_data.generate_logs(users, 10))
+    monkeypatch.setattr(fake_data, "db", db)
+    return db
+
+
+def test_histogram_percentiles_are_close():
+    histogram = lg.LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    assert histogram.total == 100
+    assert histogram.percentile(50) == pytest.approx(0.050, rel=0.02)
+    assert histogram.percentile(99) == pytest.approx(0.099, rel=0.02)
+    assert lg.LatencyHistogram().percentile(50) == 0.0
+
+
+def test_parse_mix():
+    assert lg.parse_mix("insert_log=3, read_top_rated") == {"insert_log": 3.0, "read_top_rated": 1.0}
+
+
+def test_run_load_executes_every_operation(seeded_db):
+    before_logs = seeded_db.logs.count_documents({})
+    report = lg.run_load(concurrency=2, duration=None, max_ops=200, seed=1)
+
+    assert sum(stats["count"] + stats["errors"] for stats in report.values()) == 200
+    assert set(report) == set(lg.DEFAULT_MIX)
+    assert all(stats["errors"] == 0 for stats in report.values())
+    inserted = report["insert_log"]["count"]
+    assert seeded_db.logs.count_documents({}) == before_logs + inserted
+    assert report["insert_log"]["p99_ms"] >= report["insert_log"]["p50_ms"]
+    assert "insert_log" in lg.format_report(report)
+
+
+def test_rate_limit_paces_operations(seeded_db):
+    class Clock:
+        now = 0.0
+
+        def __call__(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.now += seconds
+
+    clock = Clock()
+    lg.run_load(mix={"read_top_rated": 1}, rate=100, concurrency=1, duration=None, max_ops=50, clock=clock, sleep=clock.sleep)
+    assert clock.now == pytest.approx(0.49)
+
+
+def test_invalid_configuration(seeded_db):
+    with pytest.raises(ValueError):
+        lg.run_load(mix={"drop_everything": 1}, max_ops=1)
+    with pytest.raises(ValueError):
+        lg.run_load(duration=None)
+    with pytest.raises(ValueError, match="positive weight"):
+        lg.run_load(mix={"insert_log": 0, "read_top_rated": 0}, max_ops=1)
+    with pytest.raises(ValueError, match="non-negative"):
+        lg.run_load(mix={"insert_log": 1, "read_top_rated": -1}, max_ops=1)
+
+
+def test_worker_failures_reach_the_caller(seeded_db, monkeypatch):
+    def broken_sampler(weights, rng):
+        raise RuntimeError("sampler exploded")
+
+    monkeypatch.setattr(lg.sampling, "AliasSampler", broken_sampler)
+    with pytest.raises(RuntimeError, match="sampler exploded"):
+        lg.run_load(mix={"read_top_rated": 1}, concurrency=2, duration=None, max_ops=5)
+
+
+def test_paced_latency_counts_time_behind_schedule(seeded_db, monkeypatch):
+    class Clock:
+        now = 0.0
+
+        def __call__(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.now += seconds
+
+    clock = Clock()
+
+    def stalled_read(ctx, rng):
+        # Each call takes 30 ms against a 10 ms schedule, so operations fall further behind.
+        clock.now += 0.030
+
+    monkeypatch.setitem(lg.OPERATIONS, "read_top_rated", stalled_read)
+    report = lg.run_load(
+        mix={"read_top_rated": 1}, rate=100, concurrency=1, duration=None, max_ops=10, clock=clock, sleep=clock.sleep
+    )
+    # Service time alone is 30 ms; the last operation started 180 ms after its slot.
+    assert report["read_top_rated"]["p99_ms"] == pytest.approx(210, rel=0.05)
+
+
+def test_paced_workers_stop_at_the_deadline(seeded_db):
+    class Clock:
+        now = 0.0
+
+        def __call__(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.now += seconds
+
+    clock = Clock()
+    report = lg.run_load(
+        mix={"read_top_rated": 1}, rate=100, concurrency=4, duration=0.5, clock=clock, sleep=clock.sleep
+    )
+    assert report["read_top_rated"]["count"] == 50
+    assert clock.now < 0.5
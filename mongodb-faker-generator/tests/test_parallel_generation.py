@@ -0,0 +1,121 @@
+"""Tests for the process-pool generator and its deterministic chunk seeding."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import parallel_generation as pg  # noqa: E402
+
+
+def test_chunk_counts_cover_total():
+    assert pg.chunk_counts(10, 4) == [4, 4, 2]
+    assert pg.chunk_counts(8, 4) == [4, 4]
+    assert pg.chunk_counts(0, 4) == []
+    with pytest.raises(ValueError):
+        pg.chunk_counts(5, 0)
+
+
+def test_derive_chunk_seed_is_stable_and_distinct():
+    assert pg.derive_chunk_seed(1, "users", 0) == pg.derive_chunk_seed(1, "users", 0)
+    assert pg.derive_chunk_seed(1, "users", 0) != pg.derive_chunk_seed(1, "users", 1)
+    assert pg.derive_chunk_seed(1, "users", 0) != pg.derive_chunk_seed(1, "logs", 0)
+
+
+def test_serial_run_is_reproducible():
+    first = pg.generate_parallel("users", 12, seed=42, workers=1, chunk_size=5)
+    second = pg.generate_parallel("users", 12, seed=42, workers=1, chunk_size=5)
+    assert len(first) == 12
+    assert [u["_id"] for u in first] == [u["_id"] for u in second]
+    other = pg.generate_parallel("users", 12, seed=43, workers=1, chunk_size=5)
+    assert [u["_id"] for u in first] != [u["_id"] for u in other]
+
+
+def test_process_pool_matches_serial_output():
+    users = pg.generate_parallel("users", 6, seed=3, workers=1, chunk_size=4)
+    refs = [{"_id": u["_id"]} for u in users]
+    serial = pg.generate_parallel("logs", 25, seed=3, workers=1, chunk_size=10, users=refs)
+    pooled = pg.generate_parallel("logs", 25, seed=3, workers=2, chunk_size=10, users=refs)
+    assert [log["sessionId"] for log in pooled] == [log["sessionId"] for log in serial]
+    assert {log["userId"] for log in pooled} <= {u["_id"] for u in users} | {None}
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError):
+        pg.generate_parallel("orders", 1)
+
+
+def test_insert_data_parallel_seeds_all_collections(monkeypatch):
+    mongomock = pytest.importorskip("mongomock")
+    db = mongomock.MongoClient()["parallel_test"]
+    monkeypatch.setattr(pg.fake_data, "db", db)
+    monkeypatch.setattr(pg.fake_data, "_print_db_stats", lambda: None)
+
+    pg.insert_data_parallel(n_users=5, n_products=6, n_transactions=7, n_logs=9, seed=1, workers=1, chunk_size=4)
+
+    assert db.users.count_documents({}) == 5
+    assert db.products.count_documents({}) == 6
+    assert db.transactions.count_documents({}) == 7
+    assert db.logs.count_documents({}) == 9
+
+
+def test_users_keep_unique_indexes_across_chunks(monkeypatch):
+    mongomock = pytest.importorskip("mongomock")
+    db = mongomock.MongoClient()["parallel_test"]
+    monkeypatch.setattr(pg.fake_data, "db", db)
+    monkeypatch.setattr(pg.fake_data, "_print_db_stats", lambda: None)
+
+    pg.insert_data_parallel(
+        n_users=3000, n_products=1, n_transactions=0, n_logs=0, seed=7, workers=1, chunk_size=500, defer_indexes=True
+    )
+    pg.fake_data.build_indexes(["users"])
+
+    users = list(db.users.find({}, {"username": 1, "email": 1}))
+    assert len({user["username"] for user in users}) == 3000
+    assert len({user["email"] for user in users}) == 3000
+    unique = [list(info["key"]) for info in db.users.index_information().values() if info.get("unique")]
+    assert [("email", 1)] in unique and [("username", 1)] in unique
+
+
+def test_user_keys_are_suffixed_only_above_the_classroom_size():
+    limit = pg.fake_data.PLAIN_USER_KEYS_LIMIT
+    plain = pg.generate_parallel("users", limit, seed=3, workers=1, chunk_size=30)
+    assert not any(user["username"].endswith(f".{row}") for row, user in enumerate(plain))
+
+    # Every chunk of a larger run suffixes, including the first one.
+    chunked = pg.generate_parallel("users", limit + 1, seed=3, workers=1, chunk_size=30)
+    assert [user["username"].rsplit(".", 1)[1] for user in chunked] == [str(row) for row in range(limit + 1)]
+    assert all(f".{row}@" in user["email"] for row, user in enumerate(chunked))
+
+
+def test_chunked_logs_force_the_level_cycle_only_at_the_start_of_the_run():
+    cycle = ["INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL", "INFO"]
+    users = [{"_id": "u1"}, {"_id": "u2"}]
+    levels = [log["level"] for log in pg.generate_parallel("logs", 60, seed=5, workers=1, chunk_size=4, users=users)]
+    assert levels[:6] == cycle
+    # Later chunks draw weighted levels instead of restarting the cycle.
+    assert levels[6:] != (cycle * 10)[6:60]
+
+
+def test_worker_client_is_closed_when_the_worker_exits(monkeypatch):
+    class FakeClient:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    finalizers = []
+    monkeypatch.setattr(pg.multiprocessing.util, "Finalize", lambda obj, callback, **kwargs: finalizers.append(callback))
+    monkeypatch.setattr(pg, "_worker_client", FakeClient())
+    client = pg._worker_client
+
+    pg._init_worker((), (), None)
+    assert finalizers == []
+    pg._init_worker((), (), ("mongodb://example:27017/", "db"))
+    for callback in finalizers:
+        callback()
+    assert client.closed and pg._worker_client is None
@@ -0,0 +1,140 @@
+"""Tests for the pipelined insert seeder."""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import generate_fake_data as fake_data  # noqa: E402
+from python import pipeline  # noqa: E402
+
+
+class SlowCollection:
+    """Collection stand-in that tracks concurrent insert_many calls."""
+
+    def __init__(self, tracker, fail=False, name=None):
+        self.name = name
+        self.tracker = tracker
+        self.docs = []
+        self.indexes = []
+        self.fail = fail
+
+    def drop(self):
+        self.docs = []
+
+    def insert_many(self, docs, ordered=True):
+        assert ordered is False
+        self.tracker.enter(self.name)
+        try:
+            time.sleep(0.005)
+            if self.fail:
+                raise RuntimeError("insert failed")
+            self.docs.extend(docs)
+        finally:
+            self.tracker.leave(self.name)
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+
+class Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+        self.active = {}
+        self.overlaps = set()
+
+    def enter(self, name=None):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            self.overlaps.update((other, name) for other, count in self.active.items() if count and other != name)
+            self.active[name] = self.active.get(name, 0) + 1
+
+    def leave(self, name=None):
+        with self.lock:
+            self.current -= 1
+            self.active[name] -= 1
+
+
+class SlowDB(dict):
+    def __init__(self, fail=False):
+        super().__init__()
+        self.tracker = Tracker()
+        self.fail = fail
+
+    def __missing__(self, name):
+        self[name] = SlowCollection(self.tracker, self.fail, name)
+        return self[name]
+
+
+def test_max_in_flight_bounds_concurrent_inserts():
+    db = SlowDB()
+    with pipeline.InsertPipeline(db, insert_workers=4, max_in_flight=2) as pipe:
+        pipe.load("numbers", ({"n": i} for i in range(40)), batch_size=3)
+    assert len(db["numbers"].docs) == 40
+    assert db.tracker.peak <= 2
+    assert pipe.inserted["numbers"] == 40
+
+
+def test_insert_errors_propagate():
+    db = SlowDB(fail=True)
+    with pipeline.InsertPipeline(db, insert_workers=2, max_in_flight=2) as pipe:
+        with pytest.raises(RuntimeError):
+            pipe.load("numbers", ({"n": i} for i in range(10)), batch_size=2)
+
+
+def test_invalid_limits_rejected():
+    with pytest.raises(ValueError):
+        pipeline.InsertPipeline(SlowDB(), max_in_flight=0)
+
+
+def test_insert_data_pipelined_loads_every_collection(monkeypatch):
+    db = SlowDB()
+    monkeypatch.setattr(fake_data, "db", db)
+    monkeypatch.setattr(fake_data, "_print_db_stats", lambda: None)
+
+    pipeline.insert_data_pipelined(
+        n_users=6, n_products=7, n_transactions=9, n_logs=11, batch_size=4, insert_workers=3, max_in_flight=3
+    )
+
+    assert [len(db[name].docs) for name in ("users", "products", "transactions", "logs")] == [6, 7, 9, 11]
+    assert all(db[name].indexes for name in fake_data.INDEX_SPECS)
+    user_ids = {user["_id"] for user in db["users"].docs}
+    assert {order["userId"] for order in db["transactions"].docs} <= user_ids
+
+
+def test_seeded_runs_are_reproducible(monkeypatch):
+    monkeypatch.setattr(fake_data, "_print_db_stats", lambda: None)
+    keys = {"users": ("_id", "username"), "products": ("sku", "name"), "transactions": ("orderId", "userId")}
+
+    def seeded_run():
+        db = SlowDB()
+        monkeypatch.setattr(fake_data, "db", db)
+        fake_data.seed_generators(11)
+        pipeline.insert_data_pipelined(
+            n_users=6, n_products=7, n_transactions=9, n_logs=11, batch_size=2, insert_workers=3, max_in_flight=4
+        )
+        return {name: sorted(tuple(doc[key] for key in fields) for doc in db[name].docs) for name, fields in keys.items()}
+
+    assert seeded_run() == seeded_run()
+
+
+def test_independent_collections_load_concurrently(monkeypatch):
+    db = SlowDB()
+    monkeypatch.setattr(fake_data, "db", db)
+    monkeypatch.setattr(fake_data, "_print_db_stats", lambda: None)
+
+    pipeline.insert_data_pipelined(
+        n_users=20, n_products=20, n_transactions=20, n_logs=20, batch_size=2, insert_workers=4, max_in_flight=8
+    )
+
+    assert ("users", "products") in db.tracker.overlaps
+    assert ("transactions", "logs") in db.tracker.overlaps
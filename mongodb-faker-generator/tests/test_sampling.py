@@ -0,0 +1,68 @@
+"""Tests for alias-method reference sampling."""
+
+import os
+import sys
+from collections import Counter
+from random import Random
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import generate_fake_data as fake_data  # noqa: E402
+from python import sampling  # noqa: E402
+
+
+def test_alias_sampler_matches_weights():
+    table = sampling.AliasSampler([1, 0, 3], Random(0))
+    counts = Counter(table.sample() for _ in range(20000))
+    assert counts[1] == 0
+    assert 0.70 < counts[2] / 20000 < 0.80
+
+
+@pytest.mark.parametrize("weights", [[], [-1, 2], [0, 0]])
+def test_alias_sampler_rejects_bad_weights(weights):
+    with pytest.raises(ValueError):
+        sampling.AliasSampler(weights)
+
+
+def test_zipf_weights_are_decreasing():
+    weights = sampling.zipf_weights(5, 1.0)
+    assert weights[0] == 1.0
+    assert weights == sorted(weights, reverse=True)
+    assert sampling.zipf_weights(3, 0) == [1.0, 1.0, 1.0]
+
+
+def test_key_sampler_is_seeded_and_validates():
+    first = sampling.KeySampler("abcdef", seed=3)
+    second = sampling.KeySampler("abcdef", seed=3)
+    assert [first.sample() for _ in range(10)] == [second.sample() for _ in range(10)]
+    with pytest.raises(ValueError):
+        sampling.KeySampler([])
+    with pytest.raises(ValueError):
+        sampling.KeySampler([1, 2], weights=[1])
+
+
+def test_zipf_skew_creates_hot_products():
+    products = fake_data.generate_products(50)
+    sampler = sampling.product_sampler(products, zipf=1.2, seed=1)
+    orders = fake_data.generate_transactions([], [], 400, user_sampler=sampling.KeySampler(["u1"]), product_sampler=sampler)
+
+    counts = Counter(item["productSku"] for order in orders for item in order["items"])
+    assert counts.most_common(1)[0][0] == products[0]["sku"]
+    prices = {p["sku"]: p["price"]["amount"] for p in products}
+    for order in orders:
+        assert order["userId"] == "u1"
+        for item in order["items"]:
+            assert item["unitPrice"] == prices[item["productSku"]]
+
+
+def test_logs_accept_user_sampler():
+    users = fake_data.generate_users(3)
+    sampler = sampling.user_sampler(users, weights=[0, 0, 1], seed=2)
+    logs = fake_data.generate_logs(users, 30, user_sampler=sampler)
+    assert {log["userId"] for log in logs} <= {users[2]["_id"], None}
+    with pytest.raises(ValueError):
+        sampling.user_sampler(users, weights=[1, 1, 1], zipf=1.0)
@@ -32,17 +32,28 @@ class RecordingCollection:
         self.name = name
         self.dropped = False
         self.inserted_docs = []
+        self.batch_sizes = []
         self.created_indexes = []
 
     def drop(self):
         self.dropped = True
 
     def insert_many(self, docs):
-        self.inserted_docs = list(docs)
+        docs = list(docs)
+        self.batch_sizes.append(len(docs))
+        self.inserted_docs.extend(docs)
 
     def create_index(self, spec, **kwargs):
         self.created_indexes.append((tuple(spec), kwargs))
 
+    def create_indexes(self, models):
+        names = []
+        for model in models:
+            document = model.document
+            self.created_indexes.append((tuple(document["key"].items()), document))
+            names.append(document["name"])
+        return names
+
 
 class RecordingDB:
     """Dictionary-like object returning deterministic collections."""
@@ -211,6 +222,121 @@ def test_insert_data_to_mongodb_records_operations(monkeypatch):
     assert any(spec[0][0] == "timestamp" for spec, _ in log_indexes)
 
 
+def test_batched_splits_without_materialising():
+    """_batched should yield bounded lists and reject non-positive sizes."""
+    batches = list(fake_data._batched(iter(range(7)), 3))
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    try:
+        list(fake_data._batched([1], 0))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for batch size 0")
+
+
+def test_iter_generators_match_list_generators():
+    """The lazy iterators should yield the same documents as the list builders."""
+    fake_data.fake.seed_instance(7)
+    fake_data.random.seed(7)
+    eager = fake_data.generate_products(5)
+    fake_data.fake.seed_instance(7)
+    fake_data.random.seed(7)
+    lazy = list(fake_data.iter_products(5))
+    assert [p["sku"] for p in lazy] == [p["sku"] for p in eager]
+
+
+def test_insert_data_streaming_uses_bounded_batches(monkeypatch):
+    """Streaming seeding should insert every collection in batches and keep references valid."""
+    recording_db = RecordingDB()
+    monkeypatch.setattr(fake_data, "db", recording_db)
+
+    fake_data.insert_data_streaming(
+        n_users=7, n_products=5, n_transactions=11, n_logs=23, batch_size=4
+    )
+
+    for name, expected in (("users", 7), ("products", 5), ("transactions", 11), ("logs", 23)):
+        collection = recording_db[name]
+        assert collection.dropped
+        assert len(collection.inserted_docs) == expected
+        assert max(collection.batch_sizes) <= 4
+        assert collection.created_indexes
+
+    user_ids = {u["_id"] for u in recording_db["users"].inserted_docs}
+    skus = {p["sku"] for p in recording_db["products"].inserted_docs}
+    for order in recording_db["transactions"].inserted_docs:
+        assert order["userId"] in user_ids
+        assert all(item["productSku"] in skus for item in order["items"])
+
+
+def test_reference_tables_match_full_documents():
+    """Compact tables should drive the generators exactly like the full documents."""
+    fake_data.seed_generators(5)
+    users = fake_data.generate_users(6)
+    products = fake_data.generate_products(4)
+    user_table = fake_data.UserTable(users)
+    product_table = fake_data.ProductTable(products)
+
+    assert [u["_id"] for u in user_table] == [u["_id"] for u in users]
+    assert product_table[-1]["sku"] == products[-1]["sku"]
+    assert product_table[-1]["price"] == {"amount": products[-1]["price"]["amount"]}
+
+    fake_data.seed_generators(9)
+    from_docs = fake_data.generate_transactions(users, products, 8)
+    fake_data.seed_generators(9)
+    from_tables = fake_data.generate_transactions(user_table, product_table, 8)
+    assert [(t["userId"], t["items"]) for t in from_tables] == [(t["userId"], t["items"]) for t in from_docs]
+
+
+def test_user_table_packs_uuids_and_falls_back_for_other_ids():
+    """UUID ids cost 16 bytes each; any other id type switches to a plain list."""
+    import pickle
+
+    ids = ["0b7e8a3c-3d4e-4f7a-9f45-1c2d3e4f5a6b", "9e8d7c6b-5a49-4382-b716-0a1b2c3d4e5f"]
+    table = fake_data.UserTable({"_id": value} for value in ids)
+    assert len(table._packed) == 32 and table._ids is None
+    assert pickle.loads(pickle.dumps(table))[1] == {"_id": ids[1]}
+
+    table.append_id(42)
+    assert list(table.ids()) == ids + [42]
+    assert table.picker(fake_data.random.Random(0))() in ids + [42]
+
+
+def test_deferred_indexes_are_built_after_all_loads(monkeypatch):
+    """With defer_indexes, no index exists until every collection has been loaded."""
+    recording_db = RecordingDB()
+    monkeypatch.setattr(fake_data, "db", recording_db)
+    index_counts_at_build = {}
+    real_build = fake_data.build_indexes
+
+    def spy_build(*args, **kwargs):
+        for name, collection in recording_db.collections.items():
+            index_counts_at_build[name] = (len(collection.inserted_docs), len(collection.created_indexes))
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(fake_data, "build_indexes", spy_build)
+    fake_data.insert_data_streaming(n_users=3, n_products=3, n_transactions=3, n_logs=3, defer_indexes=True)
+
+    assert index_counts_at_build == {name: (3, 0) for name in recording_db.collections}
+    for name, collection in recording_db.collections.items():
+        assert len(collection.created_indexes) == len(fake_data.INDEX_SPECS[name])
+
+
+def test_build_indexes_reports_timings(monkeypatch):
+    """build_indexes should batch create_indexes calls and time each one."""
+    recording_db = RecordingDB()
+    monkeypatch.setattr(fake_data, "db", recording_db)
+
+    batched = fake_data.build_indexes()
+    assert len(batched) == len(recording_db.collections)
+    logs_timing = next(t for t in batched if t["collection"] == "logs")
+    assert len(logs_timing["indexes"]) == len(fake_data.INDEX_SPECS["logs"])
+    assert logs_timing["seconds"] >= 0
+
+    per_index = fake_data.build_indexes(["products"], index_batch_size=1)
+    assert len(per_index) == len(fake_data.INDEX_SPECS["products"])
+    assert all(len(t["indexes"]) == 1 for t in per_index)
+
+
 def test_query_examples_runs_with_fake_db(monkeypatch):
     """query_examples should issue the expected filters without hitting MongoDB."""
     query_db = QueryDB()
@@ -0,0 +1,126 @@
+"""Tests for time-series log arrivals, backfill and paced streaming."""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import generate_fake_data as fake_data  # noqa: E402
+from python import timeseries_logs as ts  # noqa: E402
+
+START = datetime(2024, 3, 4)
+USERS = [{"_id": "u1"}, {"_id": "u2"}]
+
+
+class TimeseriesCollection:
+    def __init__(self):
+        self.docs = []
+        self.batches = []
+        self.indexes = []
+
+    def insert_many(self, docs):
+        self.batches.append(len(docs))
+        self.docs.extend(docs)
+
+    def create_index(self, keys, **kwargs):
+        self.indexes.append(keys)
+
+
+class TimeseriesDB(dict):
+    def __init__(self):
+        super().__init__()
+        self.created = {}
+
+    def __missing__(self, name):
+        self[name] = TimeseriesCollection()
+        return self[name]
+
+    def drop_collection(self, name):
+        self.pop(name, None)
+
+    def create_collection(self, name, **options):
+        self.created[name] = options
+        return self[name]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_arrivals_are_sorted_and_inside_window():
+    end = START + timedelta(days=2)
+    arrivals = list(ts.iter_arrival_times(2000, START, end, seed=1))
+    assert len(arrivals) == 2000
+    assert arrivals == sorted(arrivals)
+    assert START <= arrivals[0] and arrivals[-1] < end
+
+
+def test_diurnal_pattern_favours_peak_hours():
+    pattern = ts.ArrivalPattern(amplitude=0.8, peak_hour=14, burst_probability=0)
+    arrivals = list(ts.iter_arrival_times(5000, START, START + timedelta(days=1), pattern, seed=2))
+    afternoon = sum(12 <= a.hour < 16 for a in arrivals)
+    night = sum(0 <= a.hour < 4 for a in arrivals)
+    assert afternoon > 3 * night
+
+
+def test_bursts_raise_bucket_weights():
+    from random import Random
+
+    pattern = ts.ArrivalPattern(amplitude=0, burst_probability=1.0, burst_multiplier=5, burst_buckets=2)
+    weights = pattern.bucket_weights(START, START + timedelta(minutes=4), Random(0))
+    assert weights == [5.0, 5.0, 5.0, 5.0]
+    with pytest.raises(ValueError):
+        pattern.bucket_weights(START, START, Random(0))
+
+
+def test_backfill_creates_timeseries_collection(monkeypatch):
+    db = TimeseriesDB()
+    monkeypatch.setattr(fake_data, "db", db)
+    inserted = ts.backfill_timeseries_logs(USERS, 25, START, START + timedelta(hours=6), seed=3, batch_size=10)
+
+    assert inserted == 25
+    options = db.created[ts.DEFAULT_COLLECTION]
+    assert options["timeseries"] == {"timeField": "timestamp", "metaField": "meta", "granularity": "seconds"}
+    collection = db[ts.DEFAULT_COLLECTION]
+    assert collection.batches == [10, 10, 5]
+    stamps = [doc["timestamp"] for doc in collection.docs]
+    assert stamps == sorted(stamps)
+    assert set(collection.docs[0]["meta"]) == {"level", "type"}
+    assert "level" not in collection.docs[0]
+    assert collection.indexes
+
+
+def test_live_stream_is_paced(monkeypatch):
+    db = TimeseriesDB()
+    monkeypatch.setattr(fake_data, "db", db)
+    clock = FakeClock()
+
+    stats = ts.stream_logs_live(
+        USERS, rate=50, duration=2.0, poisson=False, flush_interval=0.5, clock=clock, sleep=clock.sleep
+    )
+
+    collection = db[ts.DEFAULT_COLLECTION]
+    assert stats["events"] == 100
+    assert len(collection.docs) == 100
+    assert collection.batches == [25, 25, 25, 25]
+    assert clock.now == pytest.approx(2.0)
+    assert stats["rate"] == pytest.approx(50)
+
+
+def test_live_stream_validates_arguments():
+    with pytest.raises(ValueError):
+        ts.stream_logs_live(USERS, rate=0, duration=1)
+    with pytest.raises(ValueError):
+        ts.stream_logs_live(USERS, rate=10)
@@ -0,0 +1,61 @@
+"""Tests for pooled Faker providers."""
+
+import os
+import sys
+from random import Random
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from python import generate_fake_data as fake_data  # noqa: E402
+from python import value_pools  # noqa: E402
+
+
+def test_value_pool_draws_from_vocabulary():
+    counter = iter(range(100))
+    pool = value_pools.ValuePool(lambda: next(counter), 4, Random(1))
+    assert pool.values == [0, 1, 2, 3]
+    assert {pool.draw() for _ in range(200)} == {0, 1, 2, 3}
+    with pytest.raises(ValueError):
+        value_pools.ValuePool(lambda: 1, 0, Random(1))
+
+
+def test_pooled_generation_limits_vocabulary_and_restores_faker():
+    original = fake_data.fake
+    users = fake_data.generate_users(3)
+    fields = ("logs.metadata.userAgent", "logs.metadata.ip")
+    with value_pools.pooled_generation(fields=fields, pool_size=3) as pooled:
+        assert fake_data.fake is pooled
+        logs = fake_data.generate_logs(users, 60)
+    assert fake_data.fake is original
+
+    assert {log["metadata"]["userAgent"] for log in logs} <= set(pooled.pools["logs.metadata.userAgent"].values)
+    assert {log["metadata"]["ip"] for log in logs} <= set(pooled.pools["logs.metadata.ip"].values)
+    # Non-pooled providers still vary freely.
+    assert len({log["message"] for log in logs}) > 3
+
+
+def test_uuid4_stays_unique_in_pooled_mode():
+    with value_pools.pooled_generation(fields=("users._id",), pool_size=2):
+        users = fake_data.generate_users(50)
+    ids = [user["_id"] for user in users]
+    assert len(set(ids)) == len(ids)
+    assert all(len(i) == 36 and i[14] == "4" for i in ids)
+
+
+def test_pools_are_per_field_not_per_provider():
+    with value_pools.pooled_generation(fields=("logs.metadata.userAgent",), pool_size=2) as pooled:
+        users = fake_data.generate_users(40)
+        logs = fake_data.generate_logs(users, 40)
+    assert list(pooled.pools) == ["logs.metadata.userAgent"]
+    assert {log["metadata"]["userAgent"] for log in logs} <= set(pooled.pools["logs.metadata.userAgent"].values)
+    # users.metadata.userAgent shares the provider but is not pooled.
+    assert len({user["metadata"]["userAgent"] for user in users}) > 2
+
+
+def test_unknown_field_is_rejected():
+    with pytest.raises(ValueError):
+        value_pools.PooledFaker(fake_data.fake, fields=("users.no_such_field",))